@@ -0,0 +1,5 @@
+"""Microbenchmarks for the matrix package
+
+Run with ``python -m benchmarks run -o results.json`` and compare two runs
+with ``python -m benchmarks compare base.json results.json``.
+"""
@@ -0,0 +1,83 @@
+import argparse
+import sys
+
+from benchmarks import (
+    bench_batch,
+    bench_import,
+    bench_lut,
+    bench_matrix1x,
+    bench_matrix2x,
+    bench_matrix3x,
+    bench_parallel,
+    bench_solve,
+)
+from benchmarks.runner import compare, format_time, load, run, save
+
+MODULES = (
+    bench_batch,
+    bench_import,
+    bench_lut,
+    bench_matrix1x,
+    bench_matrix2x,
+    bench_matrix3x,
+    bench_parallel,
+    bench_solve,
+)
+
+
+def report(name: str, result: dict):
+    print(f"{name:<60} {format_time(result['min']):>12}", flush=True)
+
+
+def run_command(args) -> int:
+    results = run(
+        args.filter, repeat=args.repeat, min_time=args.min_time, report=report
+    )
+    if args.output:
+        save(results, args.output)
+    return 0
+
+
+def compare_command(args) -> int:
+    rows = compare(load(args.base), load(args.new), threshold=args.threshold)
+    regressions = 0
+    for row in rows:
+        flag = "REGRESSION" if row["regression"] else ""
+        print(
+            f"{row['name']:<60} {format_time(row['base']):>12} "
+            f"{format_time(row['new']):>12} {row['ratio']:>7.2f}x {flag}"
+        )
+        regressions += row["regression"]
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="write JSON results to a file")
+    run_parser.add_argument("-k", "--filter", help="only run names containing this")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds per timing run"
+    )
+    run_parser.set_defaults(func=run_command)
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown fraction reported as a regression",
+    )
+    compare_parser.set_defaults(func=compare_command)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import os
+import random
+import tempfile
+from array import array
+
+from benchmarks.bench_matrix3x import DATA_3X3
+from benchmarks.runner import benchmark
+from matrix import (
+    Matrix3x1,
+    Matrix3x3,
+    Matrix3x3Array,
+    TransformChain,
+    Vector3Array,
+    backend,
+    parallel,
+    stream,
+)
+from matrix.matrix3x import determinants
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+
+
+def pixels(size: int) -> array:
+    rng = random.Random(size)
+    return array("d", [rng.random() for _ in range(3 * size)])
+
+
+def with_numpy(enabled: bool, func):
+    def timed():
+        previous = backend.use_numpy
+        backend.use_numpy = enabled
+        try:
+            return func()
+        finally:
+            backend.use_numpy = previous
+
+    return timed
+
+
+@benchmark("batch.multiply.matrix3x1", sizes=SIZES[:-1])
+def batch_multiply_3x1(size: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    data = pixels(size)
+
+    def multiply():
+        values = iter(data)
+        for vector in zip(values, values, values):
+            m * Matrix3x1.from_iterable(vector)
+
+    return multiply
+
+
+@benchmark("batch.transform_many.python", sizes=SIZES)
+def batch_transform_many_python(size: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    data = pixels(size)
+    return with_numpy(False, lambda: m.transform_many(data))
+
+
+if backend.numpy() is not None:
+
+    @benchmark("batch.transform_many.numpy", sizes=SIZES)
+    def batch_transform_many_numpy(size: int):
+        m = Matrix3x3.from_iterable(DATA_3X3)
+        data = pixels(size)
+        return with_numpy(True, lambda: m.transform_many(data))
+
+
+@benchmark("batch.lu.solve_many.python", sizes=SIZES)
+def batch_lu_solve_many_python(size: int):
+    lu = Matrix3x3.from_iterable(DATA_3X3).lu()
+    data = pixels(size)
+    return with_numpy(False, lambda: lu.solve_many(data))
+
+
+if backend.numpy() is not None:
+
+    @benchmark("batch.lu.solve_many.numpy", sizes=SIZES)
+    def batch_lu_solve_many_numpy(size: int):
+        lu = Matrix3x3.from_iterable(DATA_3X3).lu()
+        data = pixels(size)
+        return with_numpy(True, lambda: lu.solve_many(data))
+
+
+@benchmark("batch.inverse.transform_many.python", sizes=SIZES)
+def batch_inverse_transform_many_python(size: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    data = pixels(size)
+    return with_numpy(False, lambda: m.inverse().transform_many(data))
+
+
+if backend.numpy() is not None:
+
+    @benchmark("batch.inverse.transform_many.numpy", sizes=SIZES)
+    def batch_inverse_transform_many_numpy(size: int):
+        m = Matrix3x3.from_iterable(DATA_3X3)
+        data = pixels(size)
+        return with_numpy(True, lambda: m.inverse().transform_many(data))
+
+
+@benchmark("batch.parallel.transform_many", sizes=SIZES[2:])
+def batch_parallel_transform_many(size: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    data = pixels(size)
+    return lambda: parallel.transform_many(m, data, chunk_size=size // 8)
+
+
+def pixels_8bit(size: int) -> bytes:
+    rng = random.Random(size)
+    return bytes(rng.randrange(256) for _ in range(3 * size))
+
+
+@benchmark("batch.fixed.transform_many.python", sizes=SIZES)
+def batch_fixed_transform_many_python(size: int):
+    fixed = Matrix3x3.from_iterable(DATA_3X3).quantize(8)
+    data = pixels_8bit(size)
+    fixed.transform_many(data[:3])
+    return with_numpy(False, lambda: fixed.transform_many(data))
+
+
+if backend.numpy() is not None:
+
+    @benchmark("batch.fixed.transform_many.numpy", sizes=SIZES)
+    def batch_fixed_transform_many_numpy(size: int):
+        fixed = Matrix3x3.from_iterable(DATA_3X3).quantize(8)
+        data = pixels_8bit(size)
+        return with_numpy(True, lambda: fixed.transform_many(data))
+
+
+@benchmark("batch.transform_chain", sizes=SIZES)
+def batch_transform_chain(size: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    chain = TransformChain([m, m.inverse(), m, m.inverse()])
+    data = pixels(size)
+    return lambda: chain.transform_many(data)
+
+
+@benchmark("batch.determinants", sizes=SIZES[:-1])
+def batch_determinants(size: int):
+    values = iter(pixels(3 * size))
+    matrices = [Matrix3x3.from_iterable(data) for data in zip(*(values,) * 9)]
+    return lambda: determinants(matrices)
+
+
+def matrix_array(size: int) -> Matrix3x3Array:
+    values = iter(pixels(3 * size))
+    return Matrix3x3Array.from_matrices(
+        Matrix3x3.from_iterable(data) for data in zip(*(values,) * 9)
+    )
+
+
+@benchmark("batch.matrix3x3array.multiply.matrix3x3array", sizes=SIZES[:-1])
+def batch_matrix_array_multiply(size: int):
+    a = matrix_array(size)
+    b = a.transpose()
+    return lambda: a * b
+
+
+@benchmark("batch.matrix3x3array.multiply.vector3array", sizes=SIZES[:-1])
+def batch_matrix_array_multiply_vectors(size: int):
+    a = matrix_array(size)
+    v = Vector3Array.from_flat(pixels(size))
+    return lambda: a * v
+
+
+@benchmark("batch.matrix3x3array.inverse", sizes=SIZES[:-1])
+def batch_matrix_array_inverse(size: int):
+    a = matrix_array(size)
+    return a.inverse
+
+
+@benchmark("batch.matrix3x3array.inverse.tol", sizes=SIZES[:-1])
+def batch_matrix_array_inverse_tol(size: int):
+    a = matrix_array(size)
+    return lambda: a.inverse(tol=1e-12)
+
+
+@benchmark("batch.matrix3x3array.is_singular", sizes=SIZES[:-1])
+def batch_matrix_array_is_singular(size: int):
+    a = matrix_array(size)
+    return a.is_singular
+
+
+@benchmark("batch.matrix3x3array.add", sizes=SIZES[:-1])
+def batch_matrix_array_add(size: int):
+    a = matrix_array(size)
+    b = a.transpose()
+    return lambda: a + b
+
+
+@benchmark("batch.matrix3x3array.axpy", sizes=SIZES[:-1])
+def batch_matrix_array_axpy(size: int):
+    a = matrix_array(size)
+    b = a.transpose()
+    return lambda: a.axpy(0.25, b)
+
+
+@benchmark("batch.matrix3x3array.lerp.weights", sizes=SIZES[:-1])
+def batch_matrix_array_lerp_weights(size: int):
+    a = matrix_array(size)
+    b = a.transpose()
+    weights = pixels(size)[:size]
+    return lambda: a.lerp(b, weights)
+
+
+@benchmark("batch.parallel.inverse", sizes=SIZES[2:-1])
+def batch_parallel_inverse(size: int):
+    a = matrix_array(size)
+    return lambda: parallel.inverse(a, chunk_size=size // 8)
+
+
+@benchmark("batch.stream.transform", sizes=SIZES)
+def batch_stream_transform(size: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    directory = tempfile.TemporaryDirectory()
+    src = os.path.join(directory.name, "src.raw")
+    dst = os.path.join(directory.name, "dst.raw")
+    with open(src, "wb") as fp:
+        pixels(size).tofile(fp)
+
+    def transform():
+        return stream.transform(src, dst, m)
+
+    # The files are removed when the benchmark is no longer referenced
+    transform.directory = directory
+    return transform
@@ -0,0 +1,69 @@
+"""Import time of the package
+
+Each benchmark starts a new interpreter, so the times include interpreter
+startup. Run this module directly for the ``python -X importtime`` breakdown
+of each statement, slowest module first, and the total time of the
+``matrix`` imports against a budget::
+
+    python -m benchmarks.bench_import
+"""
+import subprocess
+import sys
+
+from benchmarks.runner import benchmark
+
+STATEMENTS = {
+    "import.matrix": "import matrix",
+    "import.matrix3x3": "from matrix import Matrix3x3",
+    "import.all": (
+        "from matrix import Matrix1x3, Matrix2x2, Matrix3x3, Matrix3x3Array, "
+        "TransformChain"
+    ),
+}
+
+# Microseconds the matrix imports of a statement should take, well above the
+# time on a typical machine but far below eagerly importing every submodule
+BUDGET = {
+    "import.matrix": 10000,
+    "import.matrix3x3": 40000,
+}
+
+
+def import_times(statement: str) -> list[tuple[str, int, int]]:
+    """The module name, self and cumulative microseconds of every import"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        times.append((name.strip(), int(own), int(cumulative)))
+    return times
+
+
+def _statement(statement: str):
+    def setup():
+        command = [sys.executable, "-c", statement]
+        return lambda: subprocess.run(command, check=True)
+
+    return setup
+
+
+for _name, _statement_source in STATEMENTS.items():
+    benchmark(_name)(_statement(_statement_source))
+
+
+if __name__ == "__main__":
+    for name, statement in STATEMENTS.items():
+        times = import_times(statement)
+        total = sum(own for module, own, _ in times if module.startswith("matrix"))
+        budget = BUDGET.get(name)
+        over = " over budget" if budget is not None and total > budget else ""
+        print(f"{statement} ({total} us{over})")
+        for name, own, cumulative in sorted(times, key=lambda t: -t[1])[:15]:
+            print(f"    {name:<40} {own:>8} us {cumulative:>8} us")
@@ -0,0 +1,65 @@
+from benchmarks.bench_batch import SIZES, pixels, with_numpy
+from benchmarks.bench_matrix3x import DATA_3X3
+from benchmarks.runner import benchmark
+from matrix import Matrix3x1, Matrix3x3, backend
+from matrix.lut import LUT3D
+
+RGB_TO_XYZ = Matrix3x3.from_iterable(DATA_3X3)
+
+
+def decode(value: float) -> float:
+    if value <= 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def srgb_to_xyz(x: float, y: float, z: float) -> tuple:
+    """Decode the sRGB transfer function then convert to XYZ"""
+    return (
+        RGB_TO_XYZ * Matrix3x1.from_iterable((decode(x), decode(y), decode(z)))
+    ).data
+
+
+@benchmark("lut.bake", sizes=(17, 33, 65))
+def lut_bake(size: int):
+    return lambda: LUT3D.bake(srgb_to_xyz, size)
+
+
+@benchmark("lut.direct", sizes=SIZES[:-1])
+def lut_direct(size: int):
+    data = pixels(size)
+
+    def direct():
+        values = iter(data)
+        return [srgb_to_xyz(*pixel) for pixel in zip(values, values, values)]
+
+    return direct
+
+
+@benchmark("lut.tetrahedral.python", sizes=SIZES[:-1])
+def lut_tetrahedral_python(size: int):
+    lut = LUT3D.bake(srgb_to_xyz)
+    data = pixels(size)
+    return with_numpy(False, lambda: lut.transform_many(data))
+
+
+@benchmark("lut.trilinear.python", sizes=SIZES[:-1])
+def lut_trilinear_python(size: int):
+    lut = LUT3D.bake(srgb_to_xyz)
+    data = pixels(size)
+    return with_numpy(False, lambda: lut.transform_many(data, method="trilinear"))
+
+
+if backend.numpy() is not None:
+
+    @benchmark("lut.tetrahedral.numpy", sizes=SIZES)
+    def lut_tetrahedral_numpy(size: int):
+        lut = LUT3D.bake(srgb_to_xyz)
+        data = pixels(size)
+        return with_numpy(True, lambda: lut.transform_many(data))
+
+    @benchmark("lut.trilinear.numpy", sizes=SIZES)
+    def lut_trilinear_numpy(size: int):
+        lut = LUT3D.bake(srgb_to_xyz)
+        data = pixels(size)
+        return with_numpy(True, lambda: lut.transform_many(data, method="trilinear"))
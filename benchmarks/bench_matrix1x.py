@@ -0,0 +1,40 @@
+from benchmarks.runner import benchmark
+from matrix import Matrix1x2, Matrix1x3, Matrix2x1, Matrix3x1
+
+
+@benchmark("matrix1x2.from_iterable")
+def matrix1x2_from_iterable():
+    data = [1.0, 2.0]
+    return lambda: Matrix1x2.from_iterable(data)
+
+
+@benchmark("matrix1x2.multiply.scalar")
+def matrix1x2_multiply_scalar():
+    a = Matrix1x2.from_iterable([1.0, 2.0])
+    return lambda: a * 2.5
+
+
+@benchmark("matrix1x2.multiply.matrix2x1")
+def matrix1x2_multiply_2x1():
+    a = Matrix1x2.from_iterable([1.0, 2.0])
+    b = Matrix2x1.from_iterable([3.0, 4.0])
+    return lambda: a * b
+
+
+@benchmark("matrix1x3.from_iterable")
+def matrix1x3_from_iterable():
+    data = [1.0, 2.0, 3.0]
+    return lambda: Matrix1x3.from_iterable(data)
+
+
+@benchmark("matrix1x3.multiply.scalar")
+def matrix1x3_multiply_scalar():
+    a = Matrix1x3.from_iterable([1.0, 2.0, 3.0])
+    return lambda: a * 2.5
+
+
+@benchmark("matrix1x3.multiply.matrix3x1")
+def matrix1x3_multiply_3x1():
+    a = Matrix1x3.from_iterable([1.0, 2.0, 3.0])
+    b = Matrix3x1.from_iterable([4.0, 5.0, 6.0])
+    return lambda: a * b
@@ -0,0 +1,73 @@
+from benchmarks.runner import benchmark
+from matrix import Matrix2x1, Matrix2x2
+
+DATA_2X2 = [1.0, 2.0, 3.0, 4.0]
+
+
+@benchmark("matrix2x1.from_iterable")
+def matrix2x1_from_iterable():
+    data = [1.0, 2.0]
+    return lambda: Matrix2x1.from_iterable(data)
+
+
+@benchmark("matrix2x1.multiply.scalar")
+def matrix2x1_multiply_scalar():
+    a = Matrix2x1.from_iterable([1.0, 2.0])
+    return lambda: a * 2.5
+
+
+@benchmark("matrix2x2.from_iterable")
+def matrix2x2_from_iterable():
+    return lambda: Matrix2x2.from_iterable(DATA_2X2)
+
+
+@benchmark("matrix2x2.from_iterable.nested")
+def matrix2x2_from_iterable_nested():
+    data = ((1.0, 2.0), (3.0, 4.0))
+    return lambda: Matrix2x2.from_iterable(data)
+
+
+@benchmark("matrix2x2.from_flat")
+def matrix2x2_from_flat():
+    return lambda: Matrix2x2.from_flat(DATA_2X2)
+
+
+@benchmark("matrix2x2.from_flat.unchecked")
+def matrix2x2_from_flat_unchecked():
+    data = tuple(DATA_2X2)
+    return lambda: Matrix2x2._from_flat_unchecked(data)
+
+
+@benchmark("matrix2x2.multiply.matrix2x2")
+def matrix2x2_multiply_2x2():
+    a = Matrix2x2.from_iterable(DATA_2X2)
+    b = Matrix2x2.from_iterable([4.0, 3.0, 2.0, 1.0])
+    return lambda: a * b
+
+
+@benchmark("matrix2x2.multiply.matrix2x1")
+def matrix2x2_multiply_2x1():
+    a = Matrix2x2.from_iterable(DATA_2X2)
+    b = Matrix2x1.from_iterable([1.0, 2.0])
+    return lambda: a * b
+
+
+@benchmark("matrix2x2.multiply.scalar")
+def matrix2x2_multiply_scalar():
+    a = Matrix2x2.from_iterable(DATA_2X2)
+    return lambda: a * 2.5
+
+
+@benchmark("matrix2x2.transpose")
+def matrix2x2_transpose():
+    return Matrix2x2.from_iterable(DATA_2X2).transpose
+
+
+@benchmark("matrix2x2.determinant")
+def matrix2x2_determinant():
+    return Matrix2x2.from_iterable(DATA_2X2).determinant
+
+
+@benchmark("matrix2x2.inverse")
+def matrix2x2_inverse():
+    return Matrix2x2.from_iterable(DATA_2X2).inverse
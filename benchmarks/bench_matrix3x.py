@@ -0,0 +1,213 @@
+from benchmarks.runner import benchmark
+from matrix import Matrix2x2, Matrix3x1, Matrix3x1Mut, Matrix3x3, Matrix3x3Mut, cache
+from matrix.matrix3x import _laderman_3x3, matrix_multiply_3x1, matrix_multiply_3x3
+
+DATA_3X3 = [0.4124, 0.3576, 0.1805, 0.2126, 0.7152, 0.0722, 0.0193, 0.1192, 0.9505]
+
+
+@benchmark("matrix3x1.from_iterable")
+def matrix3x1_from_iterable():
+    data = [1.0, 2.0, 3.0]
+    return lambda: Matrix3x1.from_iterable(data)
+
+
+@benchmark("matrix3x1.multiply.scalar")
+def matrix3x1_multiply_scalar():
+    a = Matrix3x1.from_iterable([1.0, 2.0, 3.0])
+    return lambda: a * 2.5
+
+
+@benchmark("matrix3x3.from_iterable")
+def matrix3x3_from_iterable():
+    return lambda: Matrix3x3.from_iterable(DATA_3X3)
+
+
+@benchmark("matrix3x3.from_iterable.nested")
+def matrix3x3_from_iterable_nested():
+    data = (tuple(DATA_3X3[:3]), tuple(DATA_3X3[3:6]), tuple(DATA_3X3[6:]))
+    return lambda: Matrix3x3.from_iterable(data)
+
+
+@benchmark("matrix3x3.from_flat")
+def matrix3x3_from_flat():
+    return lambda: Matrix3x3.from_flat(DATA_3X3)
+
+
+@benchmark("matrix3x3.from_flat.unchecked")
+def matrix3x3_from_flat_unchecked():
+    data = tuple(DATA_3X3)
+    return lambda: Matrix3x3._from_flat_unchecked(data)
+
+
+@benchmark("matrix3x3.multiply.matrix3x3")
+def matrix3x3_multiply_3x3():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.inverse()
+    return lambda: a * b
+
+
+@benchmark("matrix3x3.multiply.laderman")
+def matrix3x3_multiply_laderman():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.inverse()
+    return lambda: Matrix3x3.from_iterable(_laderman_3x3(a._flat, b._flat))
+
+
+@benchmark("matrix3x3.multiply.matrix3x1")
+def matrix3x3_multiply_3x1():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = Matrix3x1.from_iterable([0.25, 0.5, 0.75])
+    return lambda: a * b
+
+
+@benchmark("matrix3x3.multiply.matrix3x1.out")
+def matrix3x3_multiply_3x1_out():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = Matrix3x1.from_iterable([0.25, 0.5, 0.75])
+    out = Matrix3x1Mut()
+    return lambda: matrix_multiply_3x1(a, b, out=out)
+
+
+@benchmark("matrix3x3.multiply.matrix3x3.out")
+def matrix3x3_multiply_3x3_out():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.inverse()
+    out = Matrix3x3Mut()
+    return lambda: matrix_multiply_3x3(a, b, out=out)
+
+
+@benchmark("matrix3x3.multiply.scalar")
+def matrix3x3_multiply_scalar():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    return lambda: a * 2.5
+
+
+@benchmark("matrix3x3.multiply.scalar.int")
+def matrix3x3_multiply_scalar_int():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    return lambda: a * 2
+
+
+@benchmark("matrix3x3.multiply.scalar.reflected")
+def matrix3x3_multiply_scalar_reflected():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    return lambda: 2.5 * a
+
+
+@benchmark("matrix3x3.transpose")
+def matrix3x3_transpose():
+    return Matrix3x3.from_iterable(DATA_3X3).transpose
+
+
+@benchmark("matrix3x3.determinant")
+def matrix3x3_determinant():
+    return Matrix3x3.from_iterable(DATA_3X3).determinant
+
+
+@benchmark("matrix3x3.cofactor")
+def matrix3x3_cofactor():
+    return Matrix3x3.from_iterable(DATA_3X3).cofactor
+
+
+@benchmark("matrix3x3.adjugate")
+def matrix3x3_adjugate():
+    return Matrix3x3.from_iterable(DATA_3X3).adjugate
+
+
+@benchmark("matrix3x3.adjoint")
+def matrix3x3_adjoint():
+    return Matrix3x3.from_iterable(DATA_3X3).adjoint
+
+
+@benchmark("matrix3x3.inverse")
+def matrix3x3_inverse():
+    return Matrix3x3.from_iterable(DATA_3X3).inverse
+
+
+def inverse_from_minors(m: Matrix3x3) -> Matrix3x3:
+    """The original inverse, built from nine Matrix2x2 minors"""
+    d = m.data
+    dets = []
+    for row in range(3):
+        rows = [r for r in range(3) if r != row]
+        for column in range(3):
+            columns = [c for c in range(3) if c != column]
+            minor = Matrix2x2.from_iterable(
+                [d[r][c] for r in rows for c in columns]
+            ).determinant()
+            dets.append(minor if (row + column) % 2 == 0 else -minor)
+
+    det = m.determinant()
+    return Matrix3x3.from_iterable(dets).transpose() * (1 / det)
+
+
+@benchmark("matrix3x3.inverse.tol")
+def matrix3x3_inverse_tol():
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    return lambda: m.inverse(tol=1e-12)
+
+
+@benchmark("matrix3x3.condition_number")
+def matrix3x3_condition_number():
+    return Matrix3x3.from_iterable(DATA_3X3).condition_number
+
+
+@benchmark("matrix3x3.inverse.minors")
+def matrix3x3_inverse_minors():
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    return lambda: inverse_from_minors(m)
+
+
+@benchmark("matrix3x3.inverse.cached")
+def matrix3x3_inverse_cached():
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    return lambda: cache.inverse(m)
+
+
+@benchmark("matrix3x3.add")
+def matrix3x3_add():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.transpose()
+    return lambda: a + b
+
+
+@benchmark("matrix3x3.axpy")
+def matrix3x3_axpy():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.transpose()
+    return lambda: a.axpy(0.25, b)
+
+
+@benchmark("matrix3x3.axpy.unfused")
+def matrix3x3_axpy_unfused():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.transpose()
+    return lambda: a * 0.25 + b
+
+
+@benchmark("matrix3x3.lerp")
+def matrix3x3_lerp():
+    a = Matrix3x3.from_iterable(DATA_3X3)
+    b = a.transpose()
+    return lambda: a.lerp(b, 0.25)
+
+
+@benchmark("matrix3x3.solve")
+def matrix3x3_solve():
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    b = Matrix3x1.from_iterable([0.25, 0.5, 0.75])
+    return lambda: m.solve(b)
+
+
+@benchmark("matrix3x3.solve.inverse")
+def matrix3x3_solve_inverse():
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    b = Matrix3x1.from_iterable([0.25, 0.5, 0.75])
+    return lambda: m.inverse() * b
+
+
+@benchmark("matrix3x3.solve.lu")
+def matrix3x3_solve_lu():
+    lu = Matrix3x3.from_iterable(DATA_3X3).lu()
+    b = Matrix3x1.from_iterable([0.25, 0.5, 0.75])
+    return lambda: lu.solve(b)
@@ -0,0 +1,67 @@
+"""Scaling of :mod:`matrix.parallel` with the number of workers
+
+Each benchmark is reported per worker count, with the pool started once
+beforehand and passed as ``executor`` so only the work itself is timed.
+Compare ``workers[1]`` with the others to see the speed up.
+"""
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks.bench_batch import matrix_array, pixels, with_numpy
+from benchmarks.bench_matrix3x import DATA_3X3
+from benchmarks.runner import benchmark
+from matrix import Matrix3x3, backend, parallel
+
+WORKERS = sorted({1, 2, 4, os.cpu_count() or 1})
+PIXELS = 10**6
+MATRICES = 10**5
+
+_pools: dict[tuple[type, int], Executor] = {}
+
+
+def pool(pool_type: type, workers: int) -> Executor:
+    """A pool kept for the rest of the run, so it is only started once"""
+    key = (pool_type, workers)
+    if key not in _pools:
+        _pools[key] = pool_type(workers)
+    return _pools[key]
+
+
+@benchmark("parallel.transform_many.processes.workers", sizes=WORKERS)
+def parallel_transform_many_processes(workers: int):
+    m = Matrix3x3.from_iterable(DATA_3X3)
+    data = pixels(PIXELS)
+    executor = pool(ProcessPoolExecutor, workers)
+    return with_numpy(
+        False,
+        lambda: parallel.transform_many(
+            m, data, chunk_size=PIXELS // (4 * workers), executor=executor
+        ),
+    )
+
+
+@benchmark("parallel.inverse.processes.workers", sizes=WORKERS)
+def parallel_inverse_processes(workers: int):
+    a = matrix_array(MATRICES)
+    executor = pool(ProcessPoolExecutor, workers)
+    return with_numpy(
+        False,
+        lambda: parallel.inverse(
+            a, chunk_size=MATRICES // (4 * workers), executor=executor
+        ),
+    )
+
+
+if backend.numpy() is not None:
+
+    @benchmark("parallel.transform_many.threads.workers", sizes=WORKERS)
+    def parallel_transform_many_threads(workers: int):
+        m = Matrix3x3.from_iterable(DATA_3X3)
+        data = pixels(PIXELS)
+        executor = pool(ThreadPoolExecutor, workers)
+        return with_numpy(
+            True,
+            lambda: parallel.transform_many(
+                m, data, chunk_size=PIXELS // (4 * workers), executor=executor
+            ),
+        )
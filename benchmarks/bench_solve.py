@@ -0,0 +1,59 @@
+"""Solving linear systems with LU factors compared with the inverse
+
+Each benchmark solves for one vector with a square matrix of each size.
+Comparing ``lu.reused`` with ``inverse.reused`` shows where reusing a
+factorization is faster than multiplying by a reused inverse. The batched
+equivalents are ``batch.lu.solve_many`` and ``batch.inverse.transform_many``
+in :mod:`benchmarks.bench_batch`.
+"""
+from benchmarks.runner import benchmark
+from matrix import Matrix
+
+ORDERS = (2, 3, 4, 6, 8)
+
+
+def system(order: int) -> tuple[Matrix, Matrix]:
+    """A well conditioned, diagonally dominant matrix and a vector"""
+    a = Matrix(
+        order,
+        order,
+        [
+            order if row == column else 1 / (row + column + 1)
+            for row in range(order)
+            for column in range(order)
+        ],
+    )
+    b = Matrix(order, 1, [1 / (row + 1) for row in range(order)])
+    return a, b
+
+
+@benchmark("solve.matrix", sizes=ORDERS)
+def solve_matrix(order: int):
+    a, b = system(order)
+    return lambda: a.solve(b)
+
+
+@benchmark("solve.inverse", sizes=ORDERS)
+def solve_inverse(order: int):
+    a, b = system(order)
+    return lambda: a.inverse() * b
+
+
+@benchmark("solve.inverse.reused", sizes=ORDERS)
+def solve_inverse_reused(order: int):
+    a, b = system(order)
+    inverse = a.inverse()
+    return lambda: inverse * b
+
+
+@benchmark("solve.lu", sizes=ORDERS)
+def solve_lu(order: int):
+    a, b = system(order)
+    return lambda: a.lu().solve(b)
+
+
+@benchmark("solve.lu.reused", sizes=ORDERS)
+def solve_lu_reused(order: int):
+    a, b = system(order)
+    lu = a.lu()
+    return lambda: lu.solve(b)
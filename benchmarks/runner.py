@@ -0,0 +1,138 @@
+"""Benchmark registry, timing and result comparison
+
+A benchmark is a setup function registered with :func:`benchmark`. It builds
+its inputs and returns the zero argument callable to be timed. Benchmarks
+registered with ``sizes`` are called once per size and are reported as
+``name[size]``.
+"""
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+Setup = Callable[..., Callable[[], object]]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Setup
+    size: int | None = None
+
+    def build(self) -> Callable[[], object]:
+        if self.size is None:
+            return self.setup()
+        return self.setup(self.size)
+
+
+_registry: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, sizes: Iterable[int] | None = None):
+    """Register a benchmark setup function under ``name``"""
+
+    def register(setup: Setup) -> Setup:
+        if sizes is None:
+            _add(Benchmark(name, setup))
+        else:
+            for size in sizes:
+                _add(Benchmark(f"{name}[{size}]", setup, size))
+        return setup
+
+    return register
+
+
+def _add(bench: Benchmark):
+    if bench.name in _registry:
+        raise ValueError(f"Benchmark {bench.name} is already registered")
+    _registry[bench.name] = bench
+
+
+def benchmarks(pattern: str | None = None) -> list[Benchmark]:
+    """The registered benchmarks whose name contains ``pattern``"""
+    return [
+        bench
+        for name, bench in sorted(_registry.items())
+        if pattern is None or pattern in name
+    ]
+
+
+def time_benchmark(bench: Benchmark, repeat: int = 5, min_time: float = 0.2) -> dict:
+    """Time a benchmark, returning seconds per call over ``repeat`` runs"""
+    timer = timeit.Timer(bench.build())
+    loops, _ = timer.autorange()
+    loops = max(1, int(loops * min_time / 0.2))
+    timings = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def run(
+    pattern: str | None = None,
+    repeat: int = 5,
+    min_time: float = 0.2,
+    report: Callable[[str, dict], None] | None = None,
+) -> dict:
+    """Run the registered benchmarks and return machine readable results"""
+    results = {}
+    for bench in benchmarks(pattern):
+        result = time_benchmark(bench, repeat=repeat, min_time=min_time)
+        results[bench.name] = result
+        if report is not None:
+            report(bench.name, result)
+
+    return {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(base: dict, new: dict, threshold: float = 0.1) -> list[dict]:
+    """Compare the fastest timings of two runs
+
+    Each entry gives the ratio of the new time to the base time and whether it
+    is a regression, i.e. slower by more than ``threshold`` (a fraction).
+    """
+    rows = []
+    for name, result in sorted(new["results"].items()):
+        if name not in base["results"]:
+            continue
+
+        ratio = result["min"] / base["results"][name]["min"]
+        rows.append(
+            {
+                "name": name,
+                "base": base["results"][name]["min"],
+                "new": result["min"],
+                "ratio": ratio,
+                "regression": ratio > 1.0 + threshold,
+            }
+        )
+    return rows
+
+
+def load(path: str) -> dict:
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def save(results: dict, path: str):
+    with open(path, "w") as fp:
+        json.dump(results, fp, indent=2)
+        fp.write("\n")
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
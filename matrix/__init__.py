@@ -1,6 +1,89 @@
-from matrix.base import Matrix
-from matrix.matrix1x import Matrix1x2, Matrix1x3
-from matrix.matrix2x import Matrix2x1, Matrix2x2
-from matrix.matrix3x import Matrix3x1, Matrix3x3
+"""Matrix classes for color space manipulation
 
-__all__ = [Matrix1x2, Matrix1x3, Matrix2x1, Matrix2x2, Matrix3x1, Matrix3x3, Matrix]
+The classes and submodules are imported the first time they are used, so
+importing the package itself is cheap.
+"""
+# typing.TYPE_CHECKING, without the cost of importing typing
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from matrix.arrays import Matrix3x3Array, Vector3Array
+    from matrix.base import Matrix
+    from matrix.chain import TransformChain
+    from matrix.matrix1x import Matrix1x2, Matrix1x3
+    from matrix.matrix2x import Matrix2x1, Matrix2x1Mut, Matrix2x2, Matrix2x2Mut
+    from matrix.matrix3x import Matrix3x1, Matrix3x1Mut, Matrix3x3, Matrix3x3Mut
+
+# The module defining each name exported by the package
+_exports = {
+    "Matrix1x2": "matrix1x",
+    "Matrix1x3": "matrix1x",
+    "Matrix2x1": "matrix2x",
+    "Matrix2x2": "matrix2x",
+    "Matrix3x1": "matrix3x",
+    "Matrix3x3": "matrix3x",
+    "Matrix2x1Mut": "matrix2x",
+    "Matrix2x2Mut": "matrix2x",
+    "Matrix3x1Mut": "matrix3x",
+    "Matrix3x3Mut": "matrix3x",
+    "Matrix": "base",
+    "TransformChain": "chain",
+    "Matrix3x3Array": "arrays",
+    "Vector3Array": "arrays",
+}
+
+_submodules = {
+    "aio",
+    "arrays",
+    "backend",
+    "base",
+    "cache",
+    "chain",
+    "colorspaces",
+    "fixed",
+    "kernels",
+    "lu",
+    "lut",
+    "matrix1x",
+    "matrix2x",
+    "matrix3x",
+    "parallel",
+    "stream",
+}
+
+__all__ = [
+    "Matrix1x2",
+    "Matrix1x3",
+    "Matrix2x1",
+    "Matrix2x2",
+    "Matrix3x1",
+    "Matrix3x3",
+    "Matrix2x1Mut",
+    "Matrix2x2Mut",
+    "Matrix3x1Mut",
+    "Matrix3x3Mut",
+    "Matrix",
+    "TransformChain",
+    "Matrix3x3Array",
+    "Vector3Array",
+]
+
+
+def __getattr__(name: str):
+    if name in _exports:
+        value = getattr(_import(_exports[name]), name)
+    elif name in _submodules:
+        value = _import(name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def _import(module: str):
+    # __import__ rather than importlib, which isn't loaded at startup
+    return __import__(f"{__name__}.{module}", fromlist=["_"])
+
+
+def __dir__():
+    return sorted({*globals(), *_exports, *_submodules})
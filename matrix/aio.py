@@ -0,0 +1,78 @@
+"""asyncio wrappers for batched transforms
+
+Large batches are split into chunks and each chunk is transformed on an
+executor, so the event loop stays responsive and a long job only holds one
+executor worker at a time. Results are produced one chunk at a time: the
+next chunk is not started until the previous one has been consumed, and
+cancelling the awaiting task stops any further chunks being started.
+"""
+import asyncio
+import sys
+from array import array
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
+from typing import Any
+
+from . import backend
+from .chain import TransformChain
+from .matrix3x import Matrix3x3, transform_many_3x1
+
+# Number of x, y, z vectors in each chunk
+DEFAULT_CHUNK_SIZE = 16384
+
+
+async def transform_many_async(
+    a: Matrix3x3 | TransformChain,
+    buffer: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+):
+    """Multiply a flat buffer of x, y, z triples by a 3x3 matrix
+
+    The asynchronous version of :func:`matrix.matrix3x.transform_many_3x1`,
+    with the same buffers and results. Chunks run on ``executor``, by default
+    the event loop's default executor.
+    """
+    values = backend.float64_view(buffer)
+    result = array("d", bytes(8 * len(values)))
+    with memoryview(result) as view:
+        start = 0
+        async for chunk in transform_chunks(a, values, chunk_size, executor):
+            stop = start + len(chunk)
+            view[start:stop] = chunk
+            start = stop
+
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        return numpy.frombuffer(result, dtype=numpy.float64).reshape(buffer.shape)
+    return result
+
+
+async def transform_chunks(
+    a: Matrix3x3 | TransformChain,
+    buffer: Any,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+) -> AsyncIterator[array]:
+    """Transform a buffer one chunk at a time
+
+    Yields an ``array('d')`` of up to ``chunk_size`` transformed vectors for
+    each chunk of ``buffer``, in order. Each chunk is only computed when the
+    consumer asks for it.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    if isinstance(a, TransformChain):
+        a = a.matrix
+
+    values = backend.float64_view(buffer)
+    if len(values) % 3:
+        raise ValueError("Buffer length must be a multiple of 3")
+
+    loop = asyncio.get_running_loop()
+    step = 3 * chunk_size
+    for start in range(0, len(values), step):
+        stop = start + step
+        yield await loop.run_in_executor(
+            executor, transform_many_3x1, a, values[start:stop]
+        )
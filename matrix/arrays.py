@@ -0,0 +1,506 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from itertools import repeat
+from numbers import Number
+from operator import add, mul, sub
+
+from . import backend
+from .base import SINGULAR_TOLERANCE, Matrix, _condition_limit
+from .matrix3x import Matrix3x1, Matrix3x3
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from typing_extensions import Self
+
+# Flat indices (p, q, r, s) of the 3x3 adjugate elements, in row major order,
+# where each element is a[p] * a[q] - a[r] * a[s]
+_ADJUGATE_3X3 = (
+    (4, 8, 5, 7),
+    (2, 7, 1, 8),
+    (1, 5, 2, 4),
+    (5, 6, 3, 8),
+    (0, 8, 2, 6),
+    (2, 3, 0, 5),
+    (3, 7, 4, 6),
+    (1, 6, 0, 7),
+    (0, 4, 1, 3),
+)
+
+
+class MatrixArray:
+    """A stack of matrices of one shape stored as a structure of arrays
+
+    All the elements live in a single contiguous ``array('d')``, one run per
+    matrix element: every matrix's element 0, then every matrix's element 1
+    and so on. Indexing returns an ordinary matrix built on demand.
+    """
+
+    __slots__ = ("_data", "_length")
+
+    matrix_type: type[Matrix]
+
+    def __init__(self, length: int = 0):
+        self._length = length
+        self._data = array("d", bytes(8 * self._elements() * length))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} = {tuple(m.data for m in self)}"
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, idx: int) -> Matrix:
+        length = self._length
+        if idx < 0:
+            idx += length
+        if not 0 <= idx < length:
+            raise IndexError(f"{self.__class__.__name__} index out of range")
+
+        data = self._data
+        return self.matrix_type._from_flat_unchecked(
+            tuple([data[start + idx] for start in range(0, len(data), length)])
+        )
+
+    def __iter__(self) -> Iterator[Matrix]:
+        from_flat = self.matrix_type._from_flat_unchecked
+        return map(from_flat, zip(*self.components()))
+
+    def __eq__(self, other: Any):
+        if isinstance(other, self.__class__):
+            return self._data == other._data
+        else:
+            return NotImplemented
+
+    def __add__(self, other: Any) -> Self:
+        if isinstance(other, self.__class__):
+            self._check_length(other)
+            return self._elementwise(other, add)
+        return NotImplemented
+
+    def __sub__(self, other: Any) -> Self:
+        if isinstance(other, self.__class__):
+            self._check_length(other)
+            return self._elementwise(other, sub)
+        return NotImplemented
+
+    def __rmul__(self, other: Any) -> Self:
+        if isinstance(other, Number):
+            return self._multiply_scalar(other)
+        return NotImplemented
+
+    def __neg__(self) -> Self:
+        return self._multiply_scalar(-1.0)
+
+    def __array__(self, dtype=None, copy=None):
+        """An ndarray of shape (length, rows, columns)"""
+        import numpy
+
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot be viewed without a copy"
+            )
+        rows, columns = self.matrix_type.size
+        values = numpy.frombuffer(self._data, dtype=numpy.float64)
+        values = values.reshape(rows, columns, self._length)
+        return numpy.array(numpy.moveaxis(values, 2, 0), dtype=dtype)
+
+    # Stops NumPy scalars on the left of an operator from converting the
+    # array to an ndarray, so ``np.float64(2.0) * a`` calls ``__rmul__``
+    __array_ufunc__ = None
+
+    @classmethod
+    def from_matrices(cls, matrices: Iterable[Matrix]) -> Self:
+        flats = [m._flat for m in matrices]
+        data = array("d")
+        for values in zip(*flats):
+            data.extend(values)
+        return cls._from_storage(data, len(flats))
+
+    @classmethod
+    def _from_storage(cls, data: array, length: int) -> Self:
+        obj = cls.__new__(cls)
+        obj._data = data
+        obj._length = length
+        return obj
+
+    @classmethod
+    def _from_components(cls, components: Iterable[Iterable[float]]) -> Self:
+        data = array("d")
+        for values in components:
+            data.extend(values)
+        return cls._from_storage(data, len(data) // cls._elements())
+
+    @classmethod
+    def _from_numpy(cls, values) -> Self:
+        import numpy
+
+        data = array("d")
+        # Flattened first, as a view with a 0 in its shape cannot be cast
+        data.frombytes(memoryview(numpy.ascontiguousarray(values).ravel()).cast("B"))
+        return cls._from_storage(data, len(data) // cls._elements())
+
+    @classmethod
+    def _elements(cls) -> int:
+        rows, columns = cls.matrix_type.size
+        return rows * columns
+
+    def component(self, idx: int) -> memoryview:
+        """A read only view of element ``idx`` of every matrix"""
+        start = idx * self._length
+        stop = start + self._length
+        return memoryview(self._data)[start:stop].toreadonly()
+
+    def components(self) -> list[memoryview]:
+        return [self.component(idx) for idx in range(self._elements())]
+
+    def hadamard(self, other: MatrixArray) -> Self:
+        """The element by element product of each pair of matrices"""
+        self._check_type(other)
+        return self._elementwise(other, mul)
+
+    def axpy(self, alpha: Number | Iterable[Number], other: MatrixArray) -> Self:
+        """``alpha * self + other`` for every pair of matrices in one pass
+
+        ``alpha`` is either one number or a weight for each matrix.
+        """
+        self._check_type(other)
+        weights = self._weights(alpha)
+        np = backend.numpy()
+        if np is not None:
+            # In place, to avoid allocating temporary arrays
+            values = self._numpy_elements(np) * self._numpy_weights(np, weights)
+            values += other._numpy_elements(np)
+            return self._from_numpy(values)
+
+        return self._from_storage(
+            array(
+                "d",
+                [
+                    w * x + y
+                    for w, x, y in zip(self._repeat(weights), self._data, other._data)
+                ],
+            ),
+            self._length,
+        )
+
+    def lerp(self, other: MatrixArray, t: Number | Iterable[Number]) -> Self:
+        """Interpolate linearly from each matrix at ``t = 0`` to ``other`` at 1
+
+        ``t`` is either one number or a position for each matrix.
+        """
+        self._check_type(other)
+        weights = self._weights(t)
+        np = backend.numpy()
+        if np is not None:
+            x = self._numpy_elements(np)
+            values = other._numpy_elements(np) - x
+            values *= self._numpy_weights(np, weights)
+            values += x
+            return self._from_numpy(values)
+
+        return self._from_storage(
+            array(
+                "d",
+                [
+                    x + w * (y - x)
+                    for w, x, y in zip(self._repeat(weights), self._data, other._data)
+                ],
+            ),
+            self._length,
+        )
+
+    def _numpy_elements(self, np):
+        """An ndarray with a row for each element of every matrix"""
+        values = np.frombuffer(self._data, dtype=np.float64)
+        return values.reshape(self._elements(), self._length)
+
+    def _numpy_components(self, np):
+        rows, columns = self.matrix_type.size
+        values = np.frombuffer(self._data, dtype=np.float64)
+        return values.reshape(rows, columns, self._length)
+
+    def _check_length(self, other: "MatrixArray"):
+        if len(other) != self._length:
+            raise ValueError(
+                f"Unable to combine arrays of length {self._length} and {len(other)}"
+            )
+
+    def _multiply_scalar(self, other: Number) -> Self:
+        other = float(other)
+        data = array("d", [value * other for value in self._data])
+        return self._from_storage(data, self._length)
+
+    def _elementwise(self, other: MatrixArray, operator: Callable) -> Self:
+        np = backend.numpy()
+        if np is not None:
+            x = self._numpy_elements(np)
+            return self._from_numpy(operator(x, other._numpy_elements(np)))
+
+        data = array("d", map(operator, self._data, other._data))
+        return self._from_storage(data, self._length)
+
+    def _check_type(self, other: Any):
+        if not isinstance(other, self.__class__):
+            raise TypeError(
+                f"Unable to combine {self.__class__.__name__} with type {type(other)}"
+            )
+        self._check_length(other)
+
+    def _weights(self, weight: Number | Iterable[Number]) -> float | array:
+        """A single weight, or an array of one weight per matrix"""
+        if isinstance(weight, Number):
+            return float(weight)
+
+        weights = array("d", weight)
+        if len(weights) != self._length:
+            raise ValueError(f"Need {self._length} weights, got {len(weights)}")
+        return weights
+
+    def _repeat(self, weights: float | array) -> Iterable[float]:
+        """The weight of every element of :attr:`_data`, in order"""
+        if isinstance(weights, float):
+            return repeat(weights)
+        return weights * self._elements()
+
+    def _numpy_weights(self, np, weights: float | array):
+        if isinstance(weights, float):
+            return weights
+        return np.frombuffer(weights, dtype=np.float64)
+
+
+class Vector3Array(MatrixArray):
+    """A stack of :class:`Matrix3x1` vectors
+
+    The x values of every vector are stored first, then the y then the z.
+    """
+
+    __slots__ = ()
+
+    matrix_type = Matrix3x1
+
+    def __mul__(self, other: Any) -> Self:
+        if isinstance(other, Number):
+            return self._multiply_scalar(other)
+        else:
+            raise TypeError(f"Unable to multiply vector array by type {type(other)}")
+
+    @classmethod
+    def from_flat(cls, buffer) -> Self:
+        """Create from a flat buffer of x, y, z triples"""
+        values = backend.flat_sequence(buffer)
+        if len(values) % 3:
+            raise ValueError("Buffer length must be a multiple of 3")
+        return cls._from_components((values[0::3], values[1::3], values[2::3]))
+
+    def to_flat(self) -> array:
+        """The vectors as a flat ``array('d')`` of x, y, z triples"""
+        result = array("d", bytes(8 * len(self._data)))
+        for idx, values in enumerate(self.components()):
+            result[idx::3] = array("d", values)
+        return result
+
+
+class Matrix3x3Array(MatrixArray):
+    """A stack of :class:`Matrix3x3`"""
+
+    __slots__ = ()
+
+    matrix_type = Matrix3x3
+
+    def __mul__(self, other: Any) -> Self | Vector3Array:
+        if isinstance(other, Matrix3x3Array):
+            self._check_length(other)
+            return _multiply_3x3_3x3(self, other)
+        elif isinstance(other, Vector3Array):
+            self._check_length(other)
+            return _multiply_3x3_3x1(self, other)
+        elif isinstance(other, Number):
+            return self._multiply_scalar(other)
+        else:
+            raise TypeError(f"Unable to multiply matrix array by type {type(other)}")
+
+    def transpose(self) -> Self:
+        c = self.components()
+        return self._from_components(
+            (c[0], c[3], c[6], c[1], c[4], c[7], c[2], c[5], c[8])
+        )
+
+    def determinant(self) -> array:
+        """The determinant of each matrix as an ``array('d')``"""
+        np = backend.numpy()
+        if np is not None:
+            e = self._numpy_components(np).reshape(9, self._length)
+            dets = _determinant_3x3(*e)
+            result = array("d")
+            result.frombytes(memoryview(dets).cast("B"))
+            return result
+
+        return array("d", _determinants_3x3(self.components()))
+
+    def inverse(self, tol: float | None = None) -> Self:
+        """Invert every matrix
+
+        Raises ValueError if any of the matrices has a determinant of 0 or,
+        when ``tol`` is given, if any of them :meth:`is_singular` to that
+        tolerance.
+        """
+        np = backend.numpy()
+        if np is not None:
+            e = self._numpy_components(np).reshape(9, self._length)
+            dets = _determinant_3x3(*e)
+            if not dets.all():
+                raise ValueError("Determinant is 0: Unable to calculate inverse")
+
+            inverses = 1 / dets
+            values = [
+                (e[p] * e[q] - e[r] * e[s]) * inverses for p, q, r, s in _ADJUGATE_3X3
+            ]
+            if tol is not None:
+                conditions = _norms_3x3(np, *e) * _norms_3x3(np, *values)
+                if (conditions >= _condition_limit(tol)).any():
+                    raise ValueError(
+                        "Matrix is nearly singular: Unable to calculate inverse"
+                    )
+            return self._from_numpy(values)
+
+        e = self.components()
+        dets = _determinants_3x3(e)
+        if 0.0 in dets:
+            raise ValueError("Determinant is 0: Unable to calculate inverse")
+
+        inverses = [1 / det for det in dets]
+        values = [
+            [
+                (w * x - y * z) * inverse
+                for w, x, y, z, inverse in zip(e[p], e[q], e[r], e[s], inverses)
+            ]
+            for p, q, r, s in _ADJUGATE_3X3
+        ]
+        if tol is not None:
+            norms = map(_norm_3x3, *e)
+            inverse_norms = map(_norm_3x3, *values)
+            limit = _condition_limit(tol)
+            if any(x * y >= limit for x, y in zip(norms, inverse_norms)):
+                raise ValueError(
+                    "Matrix is nearly singular: Unable to calculate inverse"
+                )
+        return self._from_components(values)
+
+    def condition_number(self) -> array:
+        """The 1-norm condition number of each matrix as an ``array('d')``
+
+        Singular matrices have a condition number of ``inf``.
+        """
+        np = backend.numpy()
+        if np is not None:
+            e = self._numpy_components(np).reshape(9, self._length)
+            dets = np.abs(_determinant_3x3(*e))
+            adjugates = [e[p] * e[q] - e[r] * e[s] for p, q, r, s in _ADJUGATE_3X3]
+            norms = _norms_3x3(np, *e) * _norms_3x3(np, *adjugates)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                conditions = np.where(dets == 0, np.inf, norms / dets)
+            result = array("d")
+            result.frombytes(memoryview(conditions).cast("B"))
+            return result
+
+        e = self.components()
+        adjugates = [
+            [w * x - y * z for w, x, y, z in zip(e[p], e[q], e[r], e[s])]
+            for p, q, r, s in _ADJUGATE_3X3
+        ]
+        return array(
+            "d",
+            [
+                norm * adjugate_norm / abs(det) if det else float("inf")
+                for norm, adjugate_norm, det in zip(
+                    map(_norm_3x3, *e),
+                    map(_norm_3x3, *adjugates),
+                    _determinants_3x3(e),
+                )
+            ],
+        )
+
+    def is_singular(self, tol: float = SINGULAR_TOLERANCE) -> list[bool]:
+        """Whether the reciprocal condition number of each matrix is below tol"""
+        limit = _condition_limit(tol)
+        return [condition >= limit for condition in self.condition_number()]
+
+
+def _determinant_3x3(a00, a01, a02, a10, a11, a12, a20, a21, a22):
+    return (
+        a00 * (a11 * a22 - a12 * a21)
+        + a01 * (a12 * a20 - a10 * a22)
+        + a02 * (a10 * a21 - a11 * a20)
+    )
+
+
+def _norm_3x3(a00, a01, a02, a10, a11, a12, a20, a21, a22):
+    return max(
+        abs(a00) + abs(a10) + abs(a20),
+        abs(a01) + abs(a11) + abs(a21),
+        abs(a02) + abs(a12) + abs(a22),
+    )
+
+
+def _norms_3x3(np, a00, a01, a02, a10, a11, a12, a20, a21, a22):
+    """The 1-norm of each matrix, given NumPy arrays of the elements"""
+    return np.maximum(
+        np.maximum(abs(a00) + abs(a10) + abs(a20), abs(a01) + abs(a11) + abs(a21)),
+        abs(a02) + abs(a12) + abs(a22),
+    )
+
+
+def _determinants_3x3(components: list[memoryview]) -> list[float]:
+    return [
+        a00 * (a11 * a22 - a12 * a21)
+        + a01 * (a12 * a20 - a10 * a22)
+        + a02 * (a10 * a21 - a11 * a20)
+        for a00, a01, a02, a10, a11, a12, a20, a21, a22 in zip(*components)
+    ]
+
+
+def _multiply_3x3_3x3(a: Matrix3x3Array, b: Matrix3x3Array) -> Matrix3x3Array:
+    np = backend.numpy()
+    if np is not None:
+        values = np.einsum(
+            "ikn,kjn->ijn", a._numpy_components(np), b._numpy_components(np)
+        )
+        return Matrix3x3Array._from_numpy(values)
+
+    x = a.components()
+    y = b.components()
+    return Matrix3x3Array._from_components(
+        [
+            x0 * y0 + x1 * y1 + x2 * y2
+            for x0, x1, x2, y0, y1, y2 in zip(
+                x[row], x[row + 1], x[row + 2], y[column], y[column + 3], y[column + 6]
+            )
+        ]
+        for row in (0, 3, 6)
+        for column in (0, 1, 2)
+    )
+
+
+def _multiply_3x3_3x1(a: Matrix3x3Array, b: Vector3Array) -> Vector3Array:
+    np = backend.numpy()
+    if np is not None:
+        values = np.einsum(
+            "ikn,kjn->ijn", a._numpy_components(np), b._numpy_components(np)
+        )
+        return Vector3Array._from_numpy(values)
+
+    x = a.components()
+    v0, v1, v2 = b.components()
+    return Vector3Array._from_components(
+        [
+            x0 * y0 + x1 * y1 + x2 * y2
+            for x0, x1, x2, y0, y1, y2 in zip(
+                x[row], x[row + 1], x[row + 2], v0, v1, v2
+            )
+        ]
+        for row in (0, 3, 6)
+    )
@@ -0,0 +1,67 @@
+"""Optional NumPy backend
+
+NumPy is never required. It is imported the first time a batched operation
+asks for it, and the vectorized code paths are only used when it is installed
+and :data:`use_numpy` is true.
+"""
+import sys
+from array import array
+from types import ModuleType
+
+use_numpy = True
+
+_numpy: ModuleType | None = None
+_numpy_checked = False
+
+
+def numpy() -> ModuleType | None:
+    """Return the numpy module if it is installed and enabled, otherwise None"""
+    global _numpy, _numpy_checked
+
+    if not use_numpy:
+        return None
+
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        _numpy = numpy
+        _numpy_checked = True
+
+    return _numpy
+
+
+def flat_sequence(buffer):
+    """Return ``buffer`` as a flat sequence of numbers supporting extended slicing
+
+    Lists, tuples and arrays are returned unchanged. Any other object must
+    support the buffer protocol and is wrapped in a one dimensional
+    :class:`memoryview`, so no data is copied.
+    """
+    if isinstance(buffer, (list, tuple, array)):
+        return buffer
+
+    view = memoryview(buffer)
+    if view.ndim != 1:
+        view = view.cast("B").cast(view.format)
+    return view
+
+
+def float64_view(buffer) -> memoryview:
+    """A one dimensional float64 memoryview of ``buffer``, copying only if needed
+
+    ``buffer`` is anything :func:`flat_sequence` accepts, or an ndarray.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        values = numpy.ascontiguousarray(buffer, dtype=numpy.float64)
+        return memoryview(values.reshape(-1))
+
+    values = flat_sequence(buffer)
+    if isinstance(values, array) and values.typecode == "d":
+        return memoryview(values)
+    elif isinstance(values, memoryview) and values.format == "d":
+        return values
+    return memoryview(array("d", values))
@@ -1,7 +1,74 @@
-from typing import Any
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Iterable
+from itertools import chain
+from numbers import Number
+
+from . import backend, kernels
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from typing_extensions import Self
+
+    from .lu import LU
+
+# Default reciprocal condition number below which a matrix is treated as
+# singular, leaving about 4 significant digits in a solution
+SINGULAR_TOLERANCE = 1e-12
+
+_interned: dict[tuple, "Matrix"] = {}
+_shapes: dict[tuple[int, int], type["Matrix"]] = {}
+_named_shapes_loaded = False
+
+# Multiply functions registered for (left type, right type) pairs, and the
+# function chosen for each pair of concrete types seen so far
+_multiply: dict[tuple[type, type], Callable] = {}
+_multiply_dispatch: dict[tuple[type, type], Callable | None] = {}
 
 
 class Matrix:
+    """Base class for all matrices, and a matrix of any size
+
+    ``Matrix(rows, columns, data)`` creates a matrix of the given size. Sizes
+    with a dedicated class, such as ``Matrix(3, 3)``, return an instance of
+    that class; any other size gets a generated class, e.g. ``Matrix4x4``,
+    whose operations use the shape specialised kernels in
+    :mod:`matrix.kernels`.
+
+    Elements are stored as a flat, row major tuple of floats in ``_flat``.
+    ``data`` and indexing provide the nested tuple view, so ``m[row][column]``
+    still works, while ``m[row, column]`` reads the flat storage directly.
+    """
+
+    __slots__ = ("_flat",)
+
+    size: tuple[int, int]
+
+    def __new__(cls, *args):
+        if cls is Matrix:
+            rows, columns, *data = args
+            return Matrix.of_size(rows, columns)(*data)
+
+        self = object.__new__(cls)
+        self._flat = _flatten(cls.size, *args)
+        return self
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        size = cls.__dict__.get("size")
+        if size is not None:
+            _shapes.setdefault(size, cls)
+
+    def __reduce_ex__(self, protocol):
+        # Classes generated by of_size are not attributes of this module, so
+        # pickle them by size, which gives the same class when unpickled
+        if type(self).__module__ == __name__:
+            return (Matrix, (*self.size, self._flat))
+        return super().__reduce_ex__(protocol)
+
     def __repr__(self):
         return f"{self.__class__.__name__} = {self.data}"
 
@@ -9,10 +76,452 @@ class Matrix:
         yield self.__class__.__name__
         yield "data", self.data
 
+    def __array__(self, dtype=None, copy=None):
+        import numpy
+
+        if copy is False:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot be viewed without a copy"
+            )
+        return numpy.array(self._flat, dtype=dtype).reshape(self.size)
+
+    # Stops NumPy scalars and arrays on the left of an operator from treating
+    # a matrix as an array, so ``np.float64(2.0) * m`` calls ``__rmul__``
+    __array_ufunc__ = None
+
     def __eq__(self, other: Any):
-        if isinstance(other, self.__class__):
-            return self.data == other.data
+        if self is other:
+            return True
+        elif isinstance(other, self.__class__):
+            return self._flat == other._flat
         else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash(self._flat)
+
+    def __getitem__(self, idx):
+        rows, columns = self.size
+        if rows == 1 or columns == 1:
+            return self._flat[idx]
+        elif isinstance(idx, tuple):
+            row, column = idx
+            return self._flat[row * columns + column]
+        elif isinstance(idx, slice):
+            return self.data[idx]
+        else:
+            start = range(rows)[idx] * columns
+            end = start + columns
+            return tuple(self._flat[start:end])
+
+    def __mul__(self, other: Any) -> Self | Number:
+        key = (type(self), type(other))
+        try:
+            function = _multiply_dispatch[key]
+        except KeyError:
+            function = _find_multiply(key)
+        if function is None:
             raise TypeError(
-                f"Unable to compare {self.__class__.__name__} to {type(other)}"
+                f"Unable to multiply {self.__class__.__name__} by type {type(other)}"
             )
+        return function(self, other)
+
+    def __rmul__(self, other: Any) -> Self:
+        key = (type(other), type(self))
+        try:
+            function = _multiply_dispatch[key]
+        except KeyError:
+            function = _find_multiply(key)
+        if function is None:
+            return NotImplemented
+        return function(other, self)
+
+    def __add__(self, other: Any) -> Self:
+        if isinstance(other, Matrix) and other.size == self.size:
+            data = kernels.elementwise("+", len(self._flat))(self._flat, other._flat)
+            return self._from_flat_unchecked(data)
+        return NotImplemented
+
+    def __sub__(self, other: Any) -> Self:
+        if isinstance(other, Matrix) and other.size == self.size:
+            data = kernels.elementwise("-", len(self._flat))(self._flat, other._flat)
+            return self._from_flat_unchecked(data)
+        return NotImplemented
+
+    def __neg__(self) -> Self:
+        data = kernels.scale(len(self._flat))(self._flat, -1.0)
+        return self._from_flat_unchecked(data)
+
+    def hadamard(self, other: Matrix) -> Self:
+        """The element by element product with a matrix of the same size"""
+        self._check_same_size(other, "multiply elementwise")
+        data = kernels.elementwise("*", len(self._flat))(self._flat, other._flat)
+        return self._from_flat_unchecked(data)
+
+    def axpy(self, alpha: Number, other: Matrix) -> Self:
+        """``alpha * self + other`` without creating the scaled matrix"""
+        self._check_same_size(other, "add")
+        data = kernels.axpy(len(self._flat))(float(alpha), self._flat, other._flat)
+        return self._from_flat_unchecked(data)
+
+    def lerp(self, other: Matrix, t: Number) -> Self:
+        """Interpolate linearly from this matrix at ``t = 0`` to ``other`` at 1"""
+        self._check_same_size(other, "interpolate")
+        data = kernels.lerp(len(self._flat))(self._flat, other._flat, float(t))
+        return self._from_flat_unchecked(data)
+
+    def _check_same_size(self, other: Any, action: str):
+        if not isinstance(other, Matrix) or other.size != self.size:
+            raise TypeError(
+                f"Unable to {action} {self.__class__.__name__} "
+                f"and {other.__class__.__name__}"
+            )
+
+    @property
+    def data(self) -> tuple:
+        """The elements as a tuple for vectors, otherwise a tuple of rows"""
+        rows, columns = self.size
+        flat = self._flat
+        if rows == 1 or columns == 1:
+            return flat
+
+        elements = iter(flat)
+        return tuple(zip(*(elements,) * columns))
+
+    @classmethod
+    def of_size(cls, rows: int, columns: int) -> type["Matrix"]:
+        """The matrix class for a size, generating one if there is none"""
+        global _named_shapes_loaded
+
+        if not _named_shapes_loaded:
+            from . import matrix1x, matrix2x, matrix3x  # noqa: F401
+
+            _named_shapes_loaded = True
+
+        try:
+            return _shapes[(rows, columns)]
+        except KeyError:
+            if rows < 1 or columns < 1:
+                raise ValueError(f"Invalid matrix size {rows}x{columns}") from None
+            return type(
+                f"Matrix{rows}x{columns}",
+                (Matrix,),
+                {"__slots__": (), "size": (rows, columns), "__module__": __name__},
+            )
+
+    @classmethod
+    def from_iterable(cls, data: Iterable[Number] | Iterable[Iterable[Number]]):
+        return cls(data)
+
+    @classmethod
+    def from_flat(cls, flat: Iterable[Number]) -> Self:
+        """Create a matrix from exactly ``rows * columns`` numbers, row major
+
+        Faster than :meth:`from_iterable` for data that is already flat.
+        """
+        flat = tuple(map(float, flat))
+        rows, columns = cls.size
+        if len(flat) != rows * columns:
+            raise ValueError(
+                f"{cls.__name__} needs {rows * columns} elements, got {len(flat)}"
+            )
+        return cls._from_flat_unchecked(flat)
+
+    @classmethod
+    def _from_flat_unchecked(cls, flat: tuple) -> Self:
+        """Wrap a tuple of exactly ``rows * columns`` floats without copying
+
+        Only for trusted data, such as the result of a kernel.
+        """
+        self = object.__new__(cls)
+        self._flat = flat
+        return self
+
+    @classmethod
+    def from_array(cls, array: Any) -> Self:
+        """Create a matrix from a NumPy array, memoryview or other buffer
+
+        The array must hold exactly as many elements as the matrix, in row
+        major order. Its shape is otherwise ignored.
+        """
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(array, numpy.ndarray):
+            values = array.ravel().tolist()
+        else:
+            values = backend.flat_sequence(array)
+        return cls.from_flat(values)
+
+    @classmethod
+    def interned(cls, data: Any) -> Self:
+        """Return the canonical shared instance with the given elements
+
+        ``data`` is anything :meth:`from_iterable` accepts, or a matrix of this
+        class. Interned matrices live for the life of the process, so use this
+        for constants that are created repeatedly.
+        """
+        m = data if type(data) is cls else cls.from_iterable(data)
+        return _interned.setdefault((cls, m._flat), m)
+
+    @classmethod
+    def identity(cls) -> Self:
+        rows, columns = cls.size
+        if rows != columns:
+            raise TypeError(f"{cls.__name__} is not square")
+        data = [0.0] * (rows * columns)
+        data[:: columns + 1] = [1.0] * rows
+        return cls._from_flat_unchecked(tuple(data))
+
+    def transpose(self) -> "Matrix":
+        rows, columns = self.size
+        data = kernels.transpose(rows, columns)(self._flat)
+        return Matrix.of_size(columns, rows)._from_flat_unchecked(data)
+
+    def determinant(self) -> Number:
+        rows, columns = self._square_size()
+        return kernels.determinant(rows)(self._flat)
+
+    def inverse(self, tol: float | None = None) -> Self:
+        """The inverse matrix
+
+        Raises ValueError if the matrix is singular or, when ``tol`` is given,
+        if it :meth:`is_singular` to that tolerance.
+        """
+        rows, columns = self._square_size()
+        if tol is None:
+            return self._from_flat_unchecked(kernels.inverse(rows)(self._flat))
+
+        inverse, condition = kernels.inverse_condition(rows)(self._flat)
+        _check_condition(condition, tol)
+        return self._from_flat_unchecked(inverse)
+
+    def condition_number(self) -> float:
+        """The condition number in the 1-norm, ``inf`` for a singular matrix
+
+        Solving with the matrix, or inverting it, loses about ``log10`` of the
+        condition number in decimal digits of accuracy.
+        """
+        rows, columns = self._square_size()
+        try:
+            return kernels.inverse_condition(rows)(self._flat)[1]
+        except ValueError:
+            return float("inf")
+
+    def is_singular(self, tol: float = SINGULAR_TOLERANCE) -> bool:
+        """Whether the reciprocal of the condition number is below ``tol``
+
+        With a ``tol`` of 0 only exactly singular matrices are singular.
+        """
+        return self.condition_number() >= _condition_limit(tol)
+
+    def solve(self, b: Matrix) -> Matrix:
+        """The vector ``x`` where ``self * x == b``, of the same type as ``b``
+
+        This is cheaper and more accurate than ``self.inverse() * b``. Raises
+        ValueError if the matrix is singular. To solve for many vectors,
+        factorize the matrix once with :meth:`lu`.
+        """
+        rows, columns = self._square_size()
+        if not isinstance(b, Matrix) or b.size != (rows, 1):
+            raise TypeError(
+                f"Unable to solve {self.__class__.__name__} for {b.__class__.__name__}"
+            )
+        return b._from_flat_unchecked(kernels.solve(rows)(self._flat, b._flat))
+
+    def lu(self) -> LU:
+        """The LU factorization, see :class:`matrix.lu.LU`"""
+        from .lu import LU
+
+        return LU(self)
+
+    def _square_size(self) -> tuple[int, int]:
+        rows, columns = self.size
+        if rows != columns:
+            raise TypeError(f"{self.__class__.__name__} is not square")
+        return rows, columns
+
+
+class MutableMatrix(Matrix):
+    """Mixin making a matrix class mutable
+
+    The elements are stored in a list so results can be written into an
+    existing matrix, either with the in-place operators or with the ``out``
+    parameter of functions such as
+    :func:`matrix.matrix3x.matrix_multiply_3x1`, without allocating a new one.
+    Mutable matrices are not hashable.
+
+    ``class Matrix3x3Mut(MutableMatrix, Matrix3x3)`` is a mutable
+    :class:`Matrix3x3` and can be used anywhere one is expected.
+    """
+
+    __slots__ = ()
+
+    __hash__ = None
+
+    def __new__(cls, *args):
+        self = super().__new__(cls, *args)
+        self._flat = list(self._flat)
+        return self
+
+    @classmethod
+    def _from_flat_unchecked(cls, flat: tuple) -> Self:
+        self = object.__new__(cls)
+        self._flat = list(flat)
+        return self
+
+    @classmethod
+    def interned(cls, data: Any) -> Self:
+        raise TypeError(f"{cls.__name__} is mutable, so cannot be interned")
+
+    def __eq__(self, other: Any):
+        if self is other:
+            return True
+        elif isinstance(other, Matrix) and other.size == self.size:
+            return tuple(self._flat) == tuple(other._flat)
+        else:
+            return NotImplemented
+
+    def __setitem__(self, idx, value: Number):
+        rows, columns = self.size
+        if isinstance(idx, tuple):
+            row, column = idx
+            idx = row * columns + column
+        elif rows != 1 and columns != 1:
+            raise TypeError(f"{self.__class__.__name__} indices must be (row, column)")
+        self._flat[idx] = float(value)
+
+    def __imul__(self, other: Any) -> Self:
+        if isinstance(other, Number):
+            kernels.scale_into(len(self._flat))(self._flat, float(other), self._flat)
+            return self
+        elif isinstance(other, Matrix):
+            rows, inner = self.size
+            if other.size != (inner, inner):
+                raise TypeError(
+                    f"Unable to multiply {self.__class__.__name__} "
+                    f"in place by {other.__class__.__name__}"
+                )
+
+            kernels.multiply_into(rows, inner, inner)(
+                self._flat, other._flat, self._flat
+            )
+            return self
+        else:
+            return NotImplemented
+
+    @property
+    def data(self) -> tuple:
+        rows, columns = self.size
+        if rows == 1 or columns == 1:
+            return tuple(self._flat)
+        return super().data
+
+    def assign(self, data: Iterable[Number]) -> Self:
+        """Replace every element, in row major order"""
+        flat = self._flat
+        values = [float(value) for value in data]
+        if len(values) != len(flat):
+            raise ValueError(
+                f"{self.__class__.__name__} needs {len(flat)} elements, "
+                f"got {len(values)}"
+            )
+        flat[:] = values
+        return self
+
+    def frozen(self) -> Matrix:
+        """An immutable copy of this matrix"""
+        return Matrix.of_size(*self.size)._from_flat_unchecked(tuple(self._flat))
+
+
+def register_multiply(left: type, right: type, function: Callable[[Any, Any], Any]):
+    """Compute ``a * b`` as ``function(a, b)`` for a ``left`` and a ``right``
+
+    Either type can be a base class or an ABC such as :class:`numbers.Number`.
+    When several registrations match, the one for the closest base class of
+    the left operand wins, then the closest of the right.
+    """
+    _multiply[(left, right)] = function
+    _multiply_dispatch.clear()
+
+
+def _find_multiply(key: tuple[type, type]) -> Callable | None:
+    left, right = key
+    matches = [
+        (_distance(left, base_left), _distance(right, base_right), function)
+        for (base_left, base_right), function in _multiply.items()
+        if issubclass(left, base_left) and issubclass(right, base_right)
+    ]
+    function = min(matches, key=lambda match: match[:2])[2] if matches else None
+    _multiply_dispatch[key] = function
+    return function
+
+
+def _distance(cls: type, base: type) -> int:
+    """How far up the MRO of ``cls`` a base is, with ABCs after every class"""
+    mro = cls.__mro__
+    return mro.index(base) if base in mro else len(mro)
+
+
+def _multiply_scalar(a: Matrix, b: Number) -> Matrix:
+    data = kernels.scale(len(a._flat))(a._flat, float(b))
+    return a._from_flat_unchecked(data)
+
+
+def _multiply_matrix(a: Matrix, b: Matrix) -> Matrix | Number:
+    rows, inner = a.size
+    other_rows, columns = b.size
+    if inner != other_rows:
+        raise TypeError(
+            f"Unable to multiply {a.__class__.__name__} by {b.__class__.__name__}"
+        )
+
+    data = kernels.multiply(rows, inner, columns)(a._flat, b._flat)
+    if rows == columns == 1:
+        return data[0]
+    return Matrix.of_size(rows, columns)._from_flat_unchecked(data)
+
+
+def _multiply_reflected(a: Number, b: Matrix) -> Matrix:
+    # Multiplying by a scalar commutes
+    return b * a
+
+
+register_multiply(Matrix, Number, _multiply_scalar)
+register_multiply(Matrix, Matrix, _multiply_matrix)
+register_multiply(Number, Matrix, _multiply_reflected)
+
+
+def _check_condition(condition: float, tol: float):
+    """Raise ValueError if the reciprocal of ``condition`` is below ``tol``"""
+    if condition >= _condition_limit(tol):
+        raise ValueError("Matrix is nearly singular: Unable to calculate inverse")
+
+
+def _condition_limit(tol: float) -> float:
+    """The condition number at which a matrix is singular to ``tol``
+
+    A ``tol`` of 0 only treats exactly singular matrices, with an infinite
+    condition number, as singular.
+    """
+    if tol < 0:
+        raise ValueError(f"tol must not be negative, not {tol}")
+    return 1.0 / tol if tol else float("inf")
+
+
+def _flatten(size: tuple[int, int], data: Any = None) -> tuple:
+    rows, columns = size
+    if data is None:
+        return (0.0,) * (rows * columns)
+
+    data = tuple(data)
+    if data and isinstance(data[0], Iterable):
+        data = tuple(chain.from_iterable(data))
+    _check_length(size, len(data))
+    return tuple(map(float, data))
+
+
+def _check_length(size: tuple[int, int], length: int):
+    rows, columns = size
+    if length != rows * columns:
+        raise ValueError(
+            f"A {rows}x{columns} matrix needs {rows * columns} elements, got {length}"
+        )
@@ -0,0 +1,129 @@
+"""Opt in memoization of matrix results
+
+The functions in this module return the same values as the matrix methods of
+the same name, but remember the results for the most recently used matrices.
+Matrices are keyed by their type and element values, so equal matrices share
+cached results whichever instance is passed in.
+
+A lookup costs about as much as a 3x3 determinant or transpose, so the cache
+only pays off for the more expensive operations: :func:`inverse`,
+:func:`adjoint` and :func:`lu`, and any operation on generated sizes.
+
+    from matrix import cache
+
+    inverse = cache.inverse(bradford)
+    weights = cache.lu(primaries).solve(white)
+    print(cache.cache_info())
+"""
+from collections import OrderedDict
+from numbers import Number
+from typing import Any, NamedTuple
+
+from .base import Matrix
+from .lu import LU
+
+DEFAULT_MAXSIZE = 256
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class MatrixCache:
+    """A bounded least recently used cache of matrix operation results"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[tuple, Any] = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, m: Matrix, operation: str) -> Any:
+        """Return ``m.<operation>()``, computing it only on a cache miss"""
+        flat = m._flat
+        if type(flat) is list:
+            # A mutable matrix, whose elements must be copied to be a key
+            flat = tuple(flat)
+        key = (operation, type(m), flat)
+        results = self._results
+        try:
+            result = results[key]
+        except KeyError:
+            self.misses += 1
+            result = getattr(m, operation)()
+            results[key] = result
+            if len(results) > self.maxsize:
+                results.popitem(last=False)
+        else:
+            self.hits += 1
+            results.move_to_end(key)
+        return result
+
+    def determinant(self, m: Matrix) -> Number:
+        return self.get(m, "determinant")
+
+    def transpose(self, m: Matrix) -> Matrix:
+        return self.get(m, "transpose")
+
+    def adjoint(self, m: Matrix) -> Matrix:
+        return self.get(m, "adjoint")
+
+    def inverse(self, m: Matrix) -> Matrix:
+        return self.get(m, "inverse")
+
+    def lu(self, m: Matrix) -> LU:
+        return self.get(m, "lu")
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def clear(self):
+        self._results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_cache = MatrixCache()
+
+
+def determinant(m: Matrix) -> Number:
+    return _cache.determinant(m)
+
+
+def transpose(m: Matrix) -> Matrix:
+    return _cache.transpose(m)
+
+
+def adjoint(m: Matrix) -> Matrix:
+    return _cache.adjoint(m)
+
+
+def inverse(m: Matrix) -> Matrix:
+    return _cache.inverse(m)
+
+
+def lu(m: Matrix) -> LU:
+    """The LU factorization of a matrix, to solve for many vectors"""
+    return _cache.lu(m)
+
+
+def cache_info() -> CacheInfo:
+    """Hit and miss statistics for the shared cache"""
+    return _cache.info()
+
+
+def cache_clear():
+    _cache.clear()
+
+
+def set_maxsize(maxsize: int):
+    """Change the number of results the shared cache holds"""
+    _cache.maxsize = maxsize
+    while len(_cache._results) > maxsize:
+        _cache._results.popitem(last=False)
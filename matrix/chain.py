@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from .matrix3x import Matrix3x1, Matrix3x3
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class TransformChain:
+    """A pipeline of Matrix3x3 transforms applied in the order they are added
+
+    The steps are folded into a single matrix the first time the chain is
+    applied, so transforming a vector or a batch costs one matrix-vector
+    product however many steps there are.
+    """
+
+    def __init__(self, steps: Iterable[Matrix3x3] | None = None):
+        self._steps: tuple[Matrix3x3, ...] = ()
+        self._matrix: Matrix3x3 | None = None
+        if steps is not None:
+            for step in steps:
+                self.append(step)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} = {self._steps}"
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __mul__(self, other: Matrix3x1) -> Matrix3x1:
+        if isinstance(other, Matrix3x1):
+            return self.matrix * other
+        else:
+            raise TypeError(f"Unable to multiply transform chain by type {type(other)}")
+
+    @property
+    def steps(self) -> tuple[Matrix3x3, ...]:
+        return self._steps
+
+    @property
+    def matrix(self) -> Matrix3x3:
+        """The single matrix equivalent to applying every step in turn"""
+        if self._matrix is None:
+            self._matrix = compose(*self._steps)
+        return self._matrix
+
+    def append(self, step: Matrix3x3) -> Self:
+        if not isinstance(step, Matrix3x3):
+            raise TypeError(f"Unable to add type {type(step)} to a transform chain")
+
+        self._steps += (step,)
+        self._matrix = None
+        return self
+
+    def transform(self, vector: Matrix3x1) -> Matrix3x1:
+        return self.matrix * vector
+
+    def transform_many(self, buffer):
+        """Apply the chain to a flat buffer of x, y, z triples
+
+        See :func:`matrix.matrix3x.transform_many_3x1`
+        """
+        return self.matrix.transform_many(buffer)
+
+
+def compose(*steps: Matrix3x3) -> Matrix3x3:
+    """Fold transforms applied first to last into a single matrix
+
+    Results are memoized by the value of the steps, so chains built from the
+    same matrices share the composed result.
+    """
+    return _compose(tuple(tuple(step._flat) for step in steps))
+
+
+@lru_cache(maxsize=256)
+def _compose(steps: tuple) -> Matrix3x3:
+    result = Matrix3x3.identity()
+    for step in steps:
+        result = Matrix3x3._from_flat_unchecked(step) * result
+    return result
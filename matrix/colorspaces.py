@@ -0,0 +1,238 @@
+"""Standard RGB color spaces and the matrices converting between them
+
+The RGB to XYZ matrix of a color space is derived from the chromaticities of
+its primaries and white point the first time it is needed. Conversions
+between two spaces with different white points include a chromatic
+adaptation, Bradford by default. Every matrix is memoized, so asking for the
+same conversion again is a dictionary lookup.
+
+    from matrix import colorspaces
+
+    p3_to_srgb = colorspaces.conversion("display-p3", "srgb")
+    xyz = colorspaces.to_xyz("srgb").transform_many(pixels)
+"""
+from typing import NamedTuple
+
+from .matrix3x import Matrix3x1, Matrix3x3
+
+Chromaticity = tuple[float, float]
+
+
+class ColorSpace(NamedTuple):
+    """The CIE xy chromaticities of an RGB space's primaries and white point"""
+
+    name: str
+    red: Chromaticity
+    green: Chromaticity
+    blue: Chromaticity
+    white: str
+
+
+WHITE_POINTS: dict[str, Chromaticity] = {
+    "D50": (0.3457, 0.3585),
+    "D65": (0.3127, 0.3290),
+}
+
+COLOR_SPACES = (
+    ColorSpace("srgb", (0.64, 0.33), (0.30, 0.60), (0.15, 0.06), "D65"),
+    ColorSpace("display-p3", (0.680, 0.320), (0.265, 0.690), (0.150, 0.060), "D65"),
+    ColorSpace("rec2020", (0.708, 0.292), (0.170, 0.797), (0.131, 0.046), "D65"),
+    ColorSpace("prophoto", (0.7347, 0.2653), (0.1596, 0.8404), (0.0366, 0.0001), "D50"),
+)
+
+# Cone response matrices for von Kries style chromatic adaptation
+ADAPTATIONS: dict[str, Matrix3x3] = {
+    "bradford": Matrix3x3(
+        (
+            (0.8951, 0.2664, -0.1614),
+            (-0.7502, 1.7135, 0.0367),
+            (0.0389, -0.0685, 1.0296),
+        )
+    ),
+    "cat02": Matrix3x3(
+        (
+            (0.7328, 0.4296, -0.1624),
+            (-0.7036, 1.6975, 0.0061),
+            (0.0030, 0.0136, 0.9834),
+        )
+    ),
+    "xyz-scaling": Matrix3x3.identity(),
+}
+
+DEFAULT_ADAPTATION = "bradford"
+
+
+class ColorSpaceRegistry:
+    """Named color spaces, white points and adaptations with memoized matrices"""
+
+    def __init__(self):
+        self._spaces: dict[str, ColorSpace] = {}
+        self._white_points: dict[str, Chromaticity] = {}
+        self._adaptations: dict[str, Matrix3x3] = {}
+        self._matrices: dict[tuple, Matrix3x3] = {}
+
+    def __contains__(self, name: str):
+        return name in self._spaces
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(self._spaces)
+
+    def register(self, space: ColorSpace):
+        """Add a color space, replacing any space with the same name"""
+        if space.white not in self._white_points:
+            raise ValueError(f"Unknown white point {space.white!r}")
+        self._spaces[space.name] = space
+        self._matrices.clear()
+
+    def register_white_point(self, name: str, white: Chromaticity):
+        self._white_points[name] = tuple(map(float, white))
+        self._matrices.clear()
+
+    def register_adaptation(self, name: str, cone_response: Matrix3x3):
+        """Add a chromatic adaptation given its XYZ to cone response matrix"""
+        if not isinstance(cone_response, Matrix3x3):
+            raise TypeError(
+                f"Adaptation must be a Matrix3x3, not {type(cone_response)}"
+            )
+        self._adaptations[name] = cone_response
+        self._matrices.clear()
+
+    def space(self, name: str) -> ColorSpace:
+        try:
+            return self._spaces[name]
+        except KeyError:
+            raise ValueError(f"Unknown color space {name!r}") from None
+
+    def white_point(self, name: str) -> Matrix3x1:
+        """The XYZ of a white point, scaled to a Y of 1"""
+        try:
+            x, y = self._white_points[name]
+        except KeyError:
+            raise ValueError(f"Unknown white point {name!r}") from None
+        return Matrix3x1((x / y, 1.0, (1.0 - x - y) / y))
+
+    def to_xyz(self, name: str) -> Matrix3x3:
+        """The matrix converting linear RGB in a color space to XYZ"""
+        key = ("to_xyz", name)
+        try:
+            return self._matrices[key]
+        except KeyError:
+            pass
+
+        space = self.space(name)
+        columns = [(x / y, 1.0, (1.0 - x - y) / y) for x, y in space[1:4]]
+        primaries = Matrix3x3(list(zip(*columns)))
+        sr, sg, sb = primaries.solve(self.white_point(space.white))._flat
+        scale = Matrix3x3(((sr, 0.0, 0.0), (0.0, sg, 0.0), (0.0, 0.0, sb)))
+        return self._matrices.setdefault(key, primaries * scale)
+
+    def from_xyz(self, name: str) -> Matrix3x3:
+        """The matrix converting XYZ to linear RGB in a color space"""
+        key = ("from_xyz", name)
+        try:
+            return self._matrices[key]
+        except KeyError:
+            return self._matrices.setdefault(key, self.to_xyz(name).inverse())
+
+    def adaptation(
+        self, source: str, target: str, method: str = DEFAULT_ADAPTATION
+    ) -> Matrix3x3:
+        """The matrix adapting XYZ under one white point to another"""
+        key = ("adaptation", source, target, method)
+        try:
+            return self._matrices[key]
+        except KeyError:
+            pass
+
+        try:
+            cone_response = self._adaptations[method]
+        except KeyError:
+            raise ValueError(f"Unknown chromatic adaptation {method!r}") from None
+        ss, ts = (
+            (cone_response * self.white_point(white))._flat
+            for white in (source, target)
+        )
+        gain = Matrix3x3(
+            (
+                (ts[0] / ss[0], 0.0, 0.0),
+                (0.0, ts[1] / ss[1], 0.0),
+                (0.0, 0.0, ts[2] / ss[2]),
+            )
+        )
+        result = cone_response.inverse() * gain * cone_response
+        return self._matrices.setdefault(key, result)
+
+    def conversion(
+        self, source: str, target: str, adaptation: str | None = DEFAULT_ADAPTATION
+    ) -> Matrix3x3:
+        """The single matrix converting linear RGB from one color space to another
+
+        When the white points differ the colors are adapted with the named
+        ``adaptation``, or passed through as XYZ unchanged if it is None.
+        Raises ValueError for an unknown ``adaptation`` even if they are the
+        same.
+        """
+        key = (source, target, adaptation)
+        try:
+            return self._matrices[key]
+        except KeyError:
+            pass
+
+        if adaptation is not None and adaptation not in self._adaptations:
+            raise ValueError(f"Unknown chromatic adaptation {adaptation!r}")
+        result = self.to_xyz(source)
+        source_white = self.space(source).white
+        target_white = self.space(target).white
+        if adaptation is not None and source_white != target_white:
+            result = self.adaptation(source_white, target_white, adaptation) * result
+        result = self.from_xyz(target) * result
+        return self._matrices.setdefault(key, result)
+
+    def clear(self):
+        """Forget the memoized matrices"""
+        self._matrices.clear()
+
+
+_registry = ColorSpaceRegistry()
+for _name, _white in WHITE_POINTS.items():
+    _registry.register_white_point(_name, _white)
+for _space in COLOR_SPACES:
+    _registry.register(_space)
+for _name, _cone_response in ADAPTATIONS.items():
+    _registry.register_adaptation(_name, _cone_response)
+
+
+def register(space: ColorSpace):
+    _registry.register(space)
+
+
+def register_white_point(name: str, white: Chromaticity):
+    _registry.register_white_point(name, white)
+
+
+def register_adaptation(name: str, cone_response: Matrix3x3):
+    _registry.register_adaptation(name, cone_response)
+
+
+def names() -> tuple[str, ...]:
+    """The names of the registered color spaces"""
+    return _registry.names
+
+
+def to_xyz(name: str) -> Matrix3x3:
+    return _registry.to_xyz(name)
+
+
+def from_xyz(name: str) -> Matrix3x3:
+    return _registry.from_xyz(name)
+
+
+def adaptation(source: str, target: str, method: str = DEFAULT_ADAPTATION) -> Matrix3x3:
+    return _registry.adaptation(source, target, method)
+
+
+def conversion(
+    source: str, target: str, adaptation: str | None = DEFAULT_ADAPTATION
+) -> Matrix3x3:
+    return _registry.conversion(source, target, adaptation)
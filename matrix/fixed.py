@@ -0,0 +1,213 @@
+"""Fixed point transforms of 8 and 16 bit integer pixels
+
+A :class:`Matrix3x3` is quantized once into integer coefficients scaled by
+``2 ** shift``, then applied to integer pixel buffers using only integer
+arithmetic. Each result is rounded to the nearest integer, halves rounding
+up, and clamped to the range of the pixel type.
+
+The default shift keeps the quantization error below a tenth of a unit in
+the last place, so results are within 1 of the rounded float transform.
+"""
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from . import backend
+from .matrix3x import Matrix3x3
+
+# Fractional bits added to the pixel bit depth to give the default shift
+GUARD_BITS = 4
+
+# Bits of the unsigned array typecodes that can hold pixels
+_UNSIGNED_BITS = {"B": 8, "H": 16}
+
+
+class FixedMatrix3x3:
+    """A :class:`Matrix3x3` quantized for ``bits`` bit unsigned pixels"""
+
+    __slots__ = ("bits", "shift", "coefficients", "_tables")
+
+    def __init__(self, matrix: Matrix3x3, bits: int = 8, shift: int | None = None):
+        if not 1 <= bits <= 16:
+            raise ValueError(f"bits must be between 1 and 16, not {bits}")
+        if shift is None:
+            shift = bits + GUARD_BITS
+        elif shift < 1:
+            raise ValueError(f"shift must be at least 1, not {shift}")
+
+        self.bits = bits
+        self.shift = shift
+        self.coefficients = tuple(round(value * (1 << shift)) for value in matrix._flat)
+        self._tables = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__} = {self.coefficients} "
+            f"(bits={self.bits}, shift={self.shift})"
+        )
+
+    def __eq__(self, other: Any):
+        if isinstance(other, FixedMatrix3x3):
+            return (self.bits, self.shift, self.coefficients) == (
+                other.bits,
+                other.shift,
+                other.coefficients,
+            )
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return hash((self.bits, self.shift, self.coefficients))
+
+    @property
+    def typecode(self) -> str:
+        """The ``array`` typecode of the pixels, ``"B"`` or ``"H"``"""
+        return "B" if self.bits <= 8 else "H"
+
+    @property
+    def matrix(self) -> Matrix3x3:
+        """The matrix the quantized coefficients represent"""
+        scale = 1 / (1 << self.shift)
+        return Matrix3x3.from_flat([value * scale for value in self.coefficients])
+
+    def transform(self, pixel: Iterable[int]) -> tuple[int, int, int]:
+        """Transform a single x, y, z pixel"""
+        x, y, z = pixel
+        shift = self.shift
+        half = 1 << (shift - 1)
+        maximum = (1 << self.bits) - 1
+        return tuple(
+            min(max((c0 * x + c1 * y + c2 * z + half) >> shift, 0), maximum)
+            for c0, c1, c2 in self._rows()
+        )
+
+    def transform_many(self, buffer: Any):
+        """Transform a flat buffer of x, y, z integer pixels
+
+        ``buffer`` can be a list of integers, an ``array`` of type ``"B"`` or
+        ``"H"``, ``bytes`` or any object supporting the buffer protocol. The
+        result is a new ``array`` of :attr:`typecode`, or a NumPy array of the
+        same shape when an ndarray is passed in.
+
+        Raises ValueError if a value is outside the range of ``bits`` bit
+        pixels.
+        """
+        np = backend.numpy()
+        if np is not None:
+            return self._transform_many_numpy(np, buffer)
+
+        values = backend.flat_sequence(buffer)
+        if len(values) % 3:
+            raise ValueError("Buffer length must be a multiple of 3")
+        if len(values) and not self._in_range(values):
+            self._check_range(min(values), max(values))
+
+        xs = values[0::3]
+        ys = values[1::3]
+        zs = values[2::3]
+        if isinstance(values, memoryview):
+            # Lists iterate much faster than memoryviews
+            xs, ys, zs = xs.tolist(), ys.tolist(), zs.tolist()
+        typecode = self.typecode
+        result = array(typecode, bytes(array(typecode).itemsize * len(values)))
+        shift = self.shift
+        if self.bits <= 8:
+            for row, (t0, t1, t2, clamp) in enumerate(self._lookup_tables()):
+                result[row::3] = array(
+                    typecode,
+                    [
+                        clamp[(t0[x] + t1[y] + t2[z]) >> shift]
+                        for x, y, z in zip(xs, ys, zs)
+                    ],
+                )
+            return result
+
+        half = 1 << (shift - 1)
+        maximum = (1 << self.bits) - 1
+        for row, (c0, c1, c2) in enumerate(self._rows()):
+            result[row::3] = array(
+                typecode,
+                [
+                    min(max((c0 * x + c1 * y + c2 * z + half) >> shift, 0), maximum)
+                    for x, y, z in zip(xs, ys, zs)
+                ],
+            )
+        return result
+
+    def _in_range(self, values) -> bool:
+        """Whether the element type of ``values`` only holds valid pixels"""
+        if isinstance(values, array):
+            typecode = values.typecode
+        elif isinstance(values, memoryview):
+            typecode = values.format
+        else:
+            return False
+        return self.bits >= _UNSIGNED_BITS.get(typecode, 17)
+
+    def _check_range(self, low: int, high: int):
+        maximum = (1 << self.bits) - 1
+        if low < 0 or high > maximum:
+            raise ValueError(
+                f"Pixel values must be between 0 and {maximum} for {self.bits} "
+                f"bit pixels, not {low if low < 0 else high}"
+            )
+
+    def _rows(self) -> list[tuple[int, int, int]]:
+        coefficients = iter(self.coefficients)
+        return list(zip(coefficients, coefficients, coefficients))
+
+    def _lookup_tables(self) -> list[tuple[list, list, list, list]]:
+        """Tables of the products of each coefficient with every pixel value
+
+        For each output row the first table also adds the rounding half and
+        an offset making the shifted sum a valid index into the clamp table.
+        """
+        if self._tables is None:
+            shift = self.shift
+            half = 1 << (shift - 1)
+            maximum = (1 << self.bits) - 1
+            pixels = range(maximum + 1)
+            self._tables = []
+            for c0, c1, c2 in self._rows():
+                low = (sum(min(c, 0) for c in (c0, c1, c2)) * maximum + half) >> shift
+                high = (sum(max(c, 0) for c in (c0, c1, c2)) * maximum + half) >> shift
+                offset = half - (low << shift)
+                self._tables.append(
+                    (
+                        [c0 * value + offset for value in pixels],
+                        [c1 * value for value in pixels],
+                        [c2 * value for value in pixels],
+                        [min(max(value, 0), maximum) for value in range(low, high + 1)],
+                    )
+                )
+        return self._tables
+
+    def _transform_many_numpy(self, np, buffer):
+        dtype = np.uint8 if self.bits <= 8 else np.uint16
+        if isinstance(buffer, np.ndarray):
+            values = buffer
+        else:
+            # From the element values, so the format of the buffer is kept
+            values = np.asarray(backend.flat_sequence(buffer))
+        if values.size % 3:
+            raise ValueError("Buffer length must be a multiple of 3")
+        if values.size:
+            self._check_range(values.min(), values.max())
+
+        # Use 32 bit arithmetic when no sum of products can overflow it
+        maximum = (1 << self.bits) - 1
+        largest = max(sum(map(abs, row)) for row in self._rows()) * maximum
+        working = np.int32 if largest < 1 << 30 else np.int64
+        c = np.array(self.coefficients, dtype=working).reshape(3, 3)
+        transformed = values.reshape(-1, 3).astype(working) @ c.T
+        transformed += 1 << (self.shift - 1)
+        transformed >>= self.shift
+        np.clip(transformed, 0, maximum, out=transformed)
+        transformed = transformed.astype(dtype)
+        if isinstance(buffer, np.ndarray):
+            return transformed.reshape(buffer.shape)
+
+        result = array(self.typecode)
+        # Flattened first, as a view with a 0 in its shape cannot be cast
+        result.frombytes(memoryview(transformed.ravel()).cast("B"))
+        return result
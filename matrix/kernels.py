@@ -0,0 +1,778 @@
+"""Shape specialised kernels
+
+Each kernel works on flat, row major tuples of floats. For small shapes the
+kernel is generated as fully unrolled, straight-line Python source and
+compiled once per shape. Larger shapes use loops instead.
+
+Other implementations of a kernel, such as the Laderman 3x3 multiply in
+:mod:`matrix.matrix3x`, can be added with :func:`register_variant`. The
+generated kernel is used unless choosing the fastest is enabled, by setting
+the ``MATRIX_KERNEL_SELECT`` environment variable to ``fastest`` or calling
+:func:`set_select_fastest` before the kernels are created. Each variant is
+then timed briefly on the running interpreter the first time the kernel is
+needed, so which one is used can differ between processes.
+
+Set the ``MATRIX_KERNEL_CACHE`` environment variable, or call
+:func:`set_cache_dir`, to keep the compiled kernels and the variant choices
+in a directory so later processes skip both steps.
+"""
+import os
+import sys
+from collections.abc import Callable
+from functools import cache
+from operator import mul
+from time import perf_counter
+
+# Largest number of multiplications (rows * inner * columns) that is unrolled
+MAX_UNROLLED_MULTIPLY = 64
+# Largest number of elements unrolled for transpose and elementwise kernels
+MAX_UNROLLED_ELEMENTS = 16
+# Largest square matrix with an unrolled determinant and inverse
+MAX_UNROLLED_SQUARE = 4
+# Calls per timing run, and number of runs, when choosing between variants
+SELECT_NUMBER = 200
+SELECT_REPEAT = 3
+
+_cache_dir: str | None = None
+_variants: dict[tuple[str, tuple], dict[str, Callable]] = {}
+_selected: dict[str, str] = {}
+_selected_loaded = False
+_select_fastest = False
+
+
+def set_cache_dir(path: str | os.PathLike | None):
+    """Keep compiled kernels and variant choices in ``path``, or nowhere if None"""
+    global _cache_dir, _selected_loaded
+
+    _cache_dir = os.fspath(path) if path else None
+    _selected_loaded = False
+
+
+def set_select_fastest(enabled: bool):
+    """Time the variants of kernels and use the fastest, or the generated one
+
+    Only affects kernels created afterwards; those bound when
+    :mod:`matrix.matrix3x` is imported are not replaced.
+    """
+    global _select_fastest
+
+    _select_fastest = enabled
+    for kind, _ in _variants:
+        globals()[kind].cache_clear()
+
+
+def compile_kernel(name: str, source: str) -> Callable:
+    """Compile the source of a single function and return the function"""
+    code = _load_code(name, source)
+    if code is None:
+        code = compile(source, f"<matrix.kernels.{name}>", "exec")
+        _store_code(name, source, code)
+
+    namespace: dict = {}
+    exec(code, namespace)
+    return namespace[name]
+
+
+def register_variant(kind: str, shape: tuple, name: str, kernel: Callable):
+    """Offer another implementation of a kernel
+
+    ``kind`` is the name of the kernel factory, e.g. ``"multiply"``, and
+    ``shape`` its arguments, e.g. ``(3, 3, 3)``. The generated kernel is
+    always a candidate under the name ``"generated"``. Variants are only used
+    when :func:`set_select_fastest` is enabled.
+    """
+    _variants.setdefault((kind, shape), {})[name] = kernel
+    _selected.pop(_variant_key(kind, shape), None)
+    globals()[kind].cache_clear()
+
+
+def selected() -> dict[str, str]:
+    """The variant chosen by timing for each kernel with more than one"""
+    return dict(_selected)
+
+
+def _select(kind: str, shape: tuple, kernel: Callable, *args) -> Callable:
+    """Return the fastest of ``kernel`` and the variants registered for it
+
+    Returns ``kernel`` unless :func:`set_select_fastest` is enabled.
+    """
+    variants = _variants.get((kind, shape))
+    if not variants or not _select_fastest:
+        return kernel
+
+    variants = {"generated": kernel, **variants}
+    key = _variant_key(kind, shape)
+    _load_selected()
+    name = _selected.get(key)
+    if name not in variants:
+        timings = {name: _time(variant, args) for name, variant in variants.items()}
+        name = min(timings, key=timings.__getitem__)
+        _selected[key] = name
+        _store_selected()
+    return variants[name]
+
+
+def _time(kernel: Callable, args: tuple) -> float:
+    """The best of SELECT_REPEAT timings of SELECT_NUMBER calls to a kernel
+
+    Timed directly rather than with timeit, which is slow to import.
+    """
+    best = float("inf")
+    calls = range(SELECT_NUMBER)
+    for _ in range(SELECT_REPEAT):
+        start = perf_counter()
+        for _ in calls:
+            kernel(*args)
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def _variant_key(kind: str, shape: tuple) -> str:
+    return f"{kind}{'x'.join(map(str, shape))}"
+
+
+def _sample(count: int) -> tuple:
+    """Arbitrary, well conditioned elements to time kernels with"""
+    return tuple(1.0 / (idx + 1) + (idx % 3 == 0) for idx in range(count))
+
+
+# The disk cache is optional, so its modules are only imported when it is used
+
+
+def _code_path(name: str, source: str) -> str:
+    import hashlib
+
+    digest = hashlib.sha256(source.encode()).hexdigest()[:20]
+    filename = f"{name}-{digest}.{sys.implementation.cache_tag}.bin"
+    return os.path.join(_cache_dir, filename)
+
+
+def _load_code(name: str, source: str):
+    if _cache_dir is None:
+        return None
+
+    import marshal
+    from importlib.util import MAGIC_NUMBER
+
+    try:
+        with open(_code_path(name, source), "rb") as fp:
+            data = fp.read()
+        if data.startswith(MAGIC_NUMBER):
+            return marshal.loads(data.removeprefix(MAGIC_NUMBER))
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return None
+
+
+def _store_code(name: str, source: str, code):
+    if _cache_dir is None:
+        return
+
+    import marshal
+    from importlib.util import MAGIC_NUMBER
+
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        with open(_code_path(name, source), "wb") as fp:
+            fp.write(MAGIC_NUMBER + marshal.dumps(code))
+    except OSError:
+        pass
+
+
+def _selected_path() -> str:
+    filename = f"selected.{sys.implementation.cache_tag}.json"
+    return os.path.join(_cache_dir, filename)
+
+
+def _load_selected():
+    global _selected_loaded
+
+    if _selected_loaded or _cache_dir is None:
+        return
+
+    import json
+
+    _selected_loaded = True
+    try:
+        with open(_selected_path()) as fp:
+            stored = json.load(fp)
+    except (OSError, ValueError):
+        return
+    if isinstance(stored, dict):
+        for key, name in stored.items():
+            _selected.setdefault(key, name)
+
+
+def _store_selected():
+    if _cache_dir is None:
+        return
+
+    import json
+
+    try:
+        os.makedirs(_cache_dir, exist_ok=True)
+        with open(_selected_path(), "w") as fp:
+            json.dump(_selected, fp, indent=2, sort_keys=True)
+    except OSError:
+        pass
+
+
+def _rows(a: tuple, columns: int) -> list[tuple]:
+    elements = iter(a)
+    return list(zip(*(elements,) * columns))
+
+
+def _names(prefix: str, count: int) -> list[str]:
+    return [f"{prefix}{idx}" for idx in range(count)]
+
+
+def _unpack(names: list[str], source: str) -> str:
+    if len(names) == 1:
+        return f"    {names[0]}, = {source}\n"
+    return f"    {', '.join(names)} = {source}\n"
+
+
+def _pack(terms: list[str]) -> str:
+    body = "".join(f"        {term},\n" for term in terms)
+    return f"    return (\n{body}    )\n"
+
+
+def _store(terms: list[str]) -> str:
+    return "".join(f"    out[{idx}] = {term}\n" for idx, term in enumerate(terms))
+
+
+def _multiply_terms(rows: int, inner: int, columns: int) -> list[str]:
+    return [
+        " + ".join(
+            f"a{row * inner + k} * b{k * columns + column}" for k in range(inner)
+        )
+        for row in range(rows)
+        for column in range(columns)
+    ]
+
+
+@cache
+def multiply(rows: int, inner: int, columns: int) -> Callable[[tuple, tuple], tuple]:
+    """Kernel multiplying a rows x inner matrix by an inner x columns matrix"""
+    if rows * inner * columns > MAX_UNROLLED_MULTIPLY:
+        return _multiply_loop(inner, columns)
+
+    a = _names("a", rows * inner)
+    b = _names("b", inner * columns)
+    terms = _multiply_terms(rows, inner, columns)
+    source = "def multiply(a, b):\n" + _unpack(a, "a") + _unpack(b, "b") + _pack(terms)
+    return _select(
+        "multiply",
+        (rows, inner, columns),
+        compile_kernel("multiply", source),
+        _sample(rows * inner),
+        _sample(inner * columns),
+    )
+
+
+@cache
+def multiply_into(
+    rows: int, inner: int, columns: int
+) -> Callable[[list, list, list], None]:
+    """Kernel like :func:`multiply` writing the product into the list ``out``
+
+    Both operands are read before ``out`` is written, so ``out`` may be the
+    storage of either of them.
+    """
+    if rows * inner * columns > MAX_UNROLLED_MULTIPLY:
+        kernel = _multiply_loop(inner, columns)
+
+        def multiply_into(a, b, out):
+            out[:] = kernel(a, b)
+
+        return multiply_into
+
+    a = _names("a", rows * inner)
+    b = _names("b", inner * columns)
+    terms = _multiply_terms(rows, inner, columns)
+    source = (
+        "def multiply_into(a, b, out):\n"
+        + _unpack(a, "a")
+        + _unpack(b, "b")
+        + _store(terms)
+    )
+    return compile_kernel("multiply_into", source)
+
+
+def _multiply_loop(inner: int, columns: int) -> Callable[[tuple, tuple], tuple]:
+    def multiply(a: tuple, b: tuple) -> tuple:
+        b_columns = [b[column::columns] for column in range(columns)]
+        return tuple(
+            sum(map(mul, a_row, b_column))
+            for a_row in _rows(a, inner)
+            for b_column in b_columns
+        )
+
+    return multiply
+
+
+@cache
+def transpose(rows: int, columns: int) -> Callable[[tuple], tuple]:
+    """Kernel transposing a rows x columns matrix"""
+    if rows * columns > MAX_UNROLLED_ELEMENTS:
+        return lambda a: tuple(
+            value for column in range(columns) for value in a[column::columns]
+        )
+
+    order = [row * columns + column for column in range(columns) for row in range(rows)]
+    terms = [f"a[{idx}]" for idx in order]
+    kernel = compile_kernel("transpose", "def transpose(a):\n" + _pack(terms))
+    return _select("transpose", (rows, columns), kernel, _sample(rows * columns))
+
+
+@cache
+def elementwise(operator: str, count: int) -> Callable[[tuple, tuple], tuple]:
+    """Kernel applying a binary operator, such as ``+``, element by element"""
+    if count > MAX_UNROLLED_ELEMENTS:
+        return compile_kernel(
+            "elementwise",
+            "def elementwise(a, b):\n"
+            f"    return tuple(x {operator} y for x, y in zip(a, b))\n",
+        )
+
+    terms = [f"a[{idx}] {operator} b[{idx}]" for idx in range(count)]
+    return compile_kernel("elementwise", "def elementwise(a, b):\n" + _pack(terms))
+
+
+@cache
+def norm1(rows: int, columns: int) -> Callable[[tuple], float]:
+    """Kernel calculating the 1-norm, the largest column sum of absolute values"""
+    if rows * columns > MAX_UNROLLED_ELEMENTS:
+        return lambda a: max(
+            sum(map(abs, a[column::columns])) for column in range(columns)
+        )
+
+    a = _names("a", rows * columns)
+    source = "def norm1(a):\n" + _unpack(a, "a") + _norm1(a, rows, columns, "norm")
+    return compile_kernel("norm1", source + "    return norm\n")
+
+
+def _norm1(names: list[str], rows: int, columns: int, target: str) -> str:
+    """Source assigning the 1-norm of the named elements to ``target``
+
+    Comparisons rather than ``max``, which is slow to call.
+    """
+    sums = [
+        " + ".join(f"abs({names[row * columns + column]})" for row in range(rows))
+        for column in range(columns)
+    ]
+    source = f"    {target} = {sums[0]}\n"
+    for column_sum in sums[1:]:
+        source += (
+            f"    column = {column_sum}\n"
+            f"    if column > {target}:\n"
+            f"        {target} = column\n"
+        )
+    return source
+
+
+@cache
+def scale(count: int) -> Callable[[tuple, float], tuple]:
+    """Kernel multiplying every element by a scalar"""
+    if count > MAX_UNROLLED_ELEMENTS:
+        return lambda a, s: tuple(value * s for value in a)
+
+    terms = [f"a[{idx}] * s" for idx in range(count)]
+    return compile_kernel("scale", "def scale(a, s):\n" + _pack(terms))
+
+
+@cache
+def axpy(count: int) -> Callable[[float, tuple, tuple], tuple]:
+    """Kernel scaling ``a`` and adding ``b`` in one pass, ``s * a + b``"""
+    if count > MAX_UNROLLED_ELEMENTS:
+        return lambda s, a, b: tuple(s * x + y for x, y in zip(a, b))
+
+    terms = [f"s * a[{idx}] + b[{idx}]" for idx in range(count)]
+    return compile_kernel("axpy", "def axpy(s, a, b):\n" + _pack(terms))
+
+
+@cache
+def lerp(count: int) -> Callable[[tuple, tuple, float], tuple]:
+    """Kernel interpolating linearly from ``a`` at ``t = 0`` to ``b`` at 1"""
+    if count > MAX_UNROLLED_ELEMENTS:
+        return lambda a, b, t: tuple(x + t * (y - x) for x, y in zip(a, b))
+
+    a = _names("a", count)
+    b = _names("b", count)
+    terms = [f"{x} + t * ({y} - {x})" for x, y in zip(a, b)]
+    source = "def lerp(a, b, t):\n" + _unpack(a, "a") + _unpack(b, "b") + _pack(terms)
+    return compile_kernel("lerp", source)
+
+
+@cache
+def scale_into(count: int) -> Callable[[list, float, list], None]:
+    """Kernel like :func:`scale` writing the result into the list ``out``"""
+    if count > MAX_UNROLLED_ELEMENTS:
+
+        def scale_into(a, s, out):
+            out[:] = [value * s for value in a]
+
+        return scale_into
+
+    terms = [f"a[{idx}] * s" for idx in range(count)]
+    return compile_kernel("scale_into", "def scale_into(a, s, out):\n" + _store(terms))
+
+
+def _minor(names: list[str], size: int, rows: list[int], columns: list[int]) -> str:
+    """Source for the determinant of some rows and columns of a square matrix"""
+    first = rows[0] * size
+    if len(rows) == 1:
+        return names[first + columns[0]]
+    elif len(rows) == 2:
+        second = rows[1] * size
+        return (
+            f"({names[first + columns[0]]} * {names[second + columns[1]]}"
+            f" - {names[first + columns[1]]} * {names[second + columns[0]]})"
+        )
+
+    terms = []
+    for idx, column in enumerate(columns):
+        others = [other for other in columns if other != column]
+        minor = _minor(names, size, rows[1:], others)
+        terms.append(f"{'-' if idx % 2 else '+'} {names[first + column]} * {minor}")
+    return f"({' '.join(terms)[2:]})"
+
+
+def _cofactor(names: list[str], size: int, row: int, column: int) -> str:
+    rows = [idx for idx in range(size) if idx != row]
+    columns = [idx for idx in range(size) if idx != column]
+    minor = _minor(names, size, rows, columns)
+    return f"-{minor}" if (row + column) % 2 else minor
+
+
+@cache
+def determinant(size: int) -> Callable[[tuple], float]:
+    """Kernel calculating the determinant of a size x size matrix"""
+    if size > MAX_UNROLLED_SQUARE:
+        return lambda a: _determinant_loop(a, size)
+
+    a = _names("a", size * size)
+    expression = _minor(a, size, list(range(size)), list(range(size)))
+    source = "def determinant(a):\n" + _unpack(a, "a") + f"    return {expression}\n"
+    kernel = compile_kernel("determinant", source)
+    return _select("determinant", (size, size), kernel, _sample(size * size))
+
+
+@cache
+def inverse(size: int) -> Callable[[tuple], tuple]:
+    """Kernel inverting a size x size matrix
+
+    The kernel raises ValueError if the matrix is singular. Unrolled kernels
+    calculate each cofactor once and expand the determinant along the first
+    row so those cofactors are reused.
+    """
+    if size > MAX_UNROLLED_SQUARE:
+        return lambda a: _inverse_loop(a, size)
+
+    a = _names("a", size * size)
+    source = "def inverse(a):\n" + _unpack(a, "a") + _cofactors(a, size)
+    if size == 1:
+        terms = ["inv"]
+    else:
+        terms = [
+            f"c{column}_{row} * inv" for row in range(size) for column in range(size)
+        ]
+
+    source += (
+        "    if det == 0:\n"
+        '        raise ValueError("Determinant is 0: Unable to calculate inverse")\n'
+        "    inv = 1 / det\n"
+    )
+    kernel = compile_kernel("inverse", source + _pack(terms))
+    return _select("inverse", (size, size), kernel, _sample(size * size))
+
+
+@cache
+def inverse_condition(size: int) -> Callable[[tuple], tuple[tuple, float]]:
+    """Kernel like :func:`inverse` also returning the 1-norm condition number
+
+    The norm of the inverse is taken from the cofactors already calculated
+    for it, so the condition number costs little more than the inverse.
+    """
+    if size > MAX_UNROLLED_SQUARE:
+        norm = norm1(size, size)
+
+        def inverse_condition(a):
+            inverse = _inverse_loop(a, size)
+            return inverse, norm(a) * norm(inverse)
+
+        return inverse_condition
+
+    a = _names("a", size * size)
+    source = "def inverse_condition(a):\n" + _unpack(a, "a") + _cofactors(a, size)
+    source += (
+        "    if det == 0:\n"
+        '        raise ValueError("Determinant is 0: Unable to calculate inverse")\n'
+        "    inv = 1 / det\n"
+    )
+    if size == 1:
+        terms = ["inv"]
+        condition = "1.0"
+    else:
+        terms = [
+            f"c{column}_{row} * inv" for row in range(size) for column in range(size)
+        ]
+        # The inverse is the adjugate, the transposed cofactors, times inv
+        adjugate = [f"c{row}_{column}" for column in range(size) for row in range(size)]
+        source += _norm1(a, size, size, "norm")
+        source += _norm1(adjugate, size, size, "adjugate_norm")
+        condition = "norm * adjugate_norm * abs(inv)"
+
+    body = "".join(f"        {term},\n" for term in terms)
+    source += f"    inverse = (\n{body}    )\n    return inverse, {condition}\n"
+    return compile_kernel("inverse_condition", source)
+
+
+@cache
+def solve(size: int) -> Callable[[tuple, tuple], tuple]:
+    """Kernel solving ``a x = b`` for a size x size matrix and a vector ``b``
+
+    Unrolled kernels use Cramer's rule with the cofactors of ``a``, which
+    avoids creating the inverse and multiplying by it. Larger matrices use
+    elimination with partial pivoting. The kernel raises ValueError if the
+    matrix is singular.
+    """
+    if size > MAX_UNROLLED_SQUARE:
+        return lambda a, b: _solve_loop(a, b, size)
+
+    a = _names("a", size * size)
+    b = _names("b", size)
+    source = "def solve(a, b):\n" + _unpack(a, "a") + _unpack(b, "b")
+    source += _cofactors(a, size)
+    if size == 1:
+        terms = ["b0 * inv"]
+    else:
+        terms = [
+            "("
+            + " + ".join(f"c{row}_{column} * b{row}" for row in range(size))
+            + ") * inv"
+            for column in range(size)
+        ]
+
+    source += (
+        "    if det == 0:\n"
+        '        raise ValueError("Determinant is 0: Unable to solve")\n'
+        "    inv = 1 / det\n"
+    )
+    return compile_kernel("solve", source + _pack(terms))
+
+
+@cache
+def lu_solve(size: int) -> Callable[[tuple, tuple, tuple], tuple]:
+    """Kernel solving ``a x = b`` from the LU factors of ``a``
+
+    Takes the factors as a flat tuple holding ``L`` below the diagonal,
+    ``U`` above it and the reciprocals of the diagonal of ``U`` on it, the
+    pivots and ``b``. Substitution only takes ``size * size`` operations,
+    so it is unrolled for larger sizes than the inverse.
+    """
+    if size * size > MAX_UNROLLED_MULTIPLY:
+        return lambda f, p, b: _lu_solve_loop(f, p, b, size)
+
+    f = _names("f", size * size)
+    source = "def lu_solve(f, p, b):\n" + _unpack(f, "f")
+    source += _unpack(_names("p", size), "p")
+    for target, expression in _lu_terms(size, "b[p{row}]", "y", "x"):
+        source += f"    {target} = {expression}\n"
+    return compile_kernel("lu_solve", source + _pack(_names("x", size)))
+
+
+@cache
+def lu_solve_many(size: int) -> Callable[[tuple, tuple, list], tuple[list, ...]]:
+    """Kernel like :func:`lu_solve` for a flat list of right hand sides
+
+    Returns a list of each element of the solutions, e.g. every ``x`` and
+    then every ``y``.
+    """
+    if size * size > MAX_UNROLLED_MULTIPLY:
+        return lambda f, p, values: _lu_solve_many_loop(f, p, values, size)
+
+    f = _names("f", size * size)
+    source = "def lu_solve_many(f, p, values):\n" + _unpack(f, "f")
+    source += _unpack(_names("p", size), "p")
+    for row, (target, expression, names) in enumerate(
+        _lu_terms(size, "b", "y", "x", many=True)
+    ):
+        if expression == "b":
+            source += f"    {target}s = values[p{row}::{size}]\n"
+            continue
+
+        lists = [
+            f"values[p{row}::{size}]" if name == "b" else f"{name}s" for name in names
+        ]
+        loop = ", ".join(names) + ("," if len(names) == 1 else "")
+        source += (
+            f"    {target}s = [\n        {expression}\n"
+            f"        for {loop} in zip({', '.join(lists)})\n    ]\n"
+        )
+    return compile_kernel(
+        "lu_solve_many", source + _pack([f"x{idx}s" for idx in range(size)])
+    )
+
+
+def _lu_terms(size: int, b: str, forward: str, back: str, many: bool = False):
+    """The target and expression of each step of substituting with LU factors
+
+    Forward substitution with ``L`` assigns ``forward<row>`` and back
+    substitution with ``U`` assigns ``back<row>``, the last row of each
+    merged into one step. With ``many`` the names each expression uses are
+    returned as well.
+    """
+    steps = []
+    for row in range(size):
+        names = [b] + [f"{forward}{k}" for k in range(row)]
+        terms = [b.format(row=row)] + [
+            f"f{row * size + k} * {forward}{k}" for k in range(row)
+        ]
+        if row < size - 1:
+            steps.append((f"{forward}{row}", " - ".join(terms), names))
+        else:
+            expression = f"({' - '.join(terms)}) * f{row * size + row}"
+            steps.append((f"{back}{row}", expression, names))
+
+    for row in reversed(range(size - 1)):
+        names = [f"{forward}{row}"] + [f"{back}{k}" for k in range(row + 1, size)]
+        terms = [f"{forward}{row}"] + [
+            f"f{row * size + k} * {back}{k}" for k in range(row + 1, size)
+        ]
+        expression = f"({' - '.join(terms)}) * f{row * size + row}"
+        steps.append((f"{back}{row}", expression, names))
+
+    if many:
+        return steps
+    return [(target, expression) for target, expression, _ in steps]
+
+
+def _cofactors(names: list[str], size: int) -> str:
+    """Source assigning every cofactor ``c<row>_<column>`` and ``det``
+
+    The determinant is expanded along the first row so the cofactors are
+    reused.
+    """
+    if size == 1:
+        return f"    det = {names[0]}\n"
+
+    source = ""
+    for row in range(size):
+        for column in range(size):
+            source += f"    c{row}_{column} = {_cofactor(names, size, row, column)}\n"
+    det = " + ".join(f"{names[column]} * c0_{column}" for column in range(size))
+    return source + f"    det = {det}\n"
+
+
+def _determinant_loop(a: tuple, size: int) -> float:
+    """Determinant of a square matrix by elimination with partial pivoting"""
+    rows = [list(row) for row in _rows(a, size)]
+    det = 1.0
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        if rows[pivot][column] == 0:
+            return 0.0
+        if pivot != column:
+            rows[column], rows[pivot] = rows[pivot], rows[column]
+            det = -det
+
+        pivot_row = rows[column]
+        det *= pivot_row[column]
+        for idx in range(column + 1, size):
+            row = rows[idx]
+            factor = row[column] / pivot_row[column]
+            for element in range(column, size):
+                row[element] -= factor * pivot_row[element]
+    return det
+
+
+def _inverse_loop(a: tuple, size: int) -> tuple:
+    """Inverse of a square matrix by Gauss-Jordan elimination
+
+    Raises ValueError if the matrix is singular
+    """
+    rows = [
+        list(row) + [float(idx == row_idx) for idx in range(size)]
+        for row_idx, row in enumerate(_rows(a, size))
+    ]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        if rows[pivot][column] == 0:
+            raise ValueError("Determinant is 0: Unable to calculate inverse")
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+
+        pivot_row = rows[column]
+        reciprocal = 1 / pivot_row[column]
+        pivot_row[:] = [value * reciprocal for value in pivot_row]
+        for row in rows:
+            if row is not pivot_row and row[column] != 0:
+                factor = row[column]
+                row[:] = [x - factor * y for x, y in zip(row, pivot_row)]
+
+    return tuple(value for row in rows for value in row[size:])
+
+
+def _solve_loop(a: tuple, b: tuple, size: int) -> tuple:
+    """Solve ``a x = b`` by Gaussian elimination with partial pivoting
+
+    Raises ValueError if the matrix is singular
+    """
+    rows = [[*row, value] for row, value in zip(_rows(a, size), b)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        if rows[pivot][column] == 0:
+            raise ValueError("Determinant is 0: Unable to solve")
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+
+        pivot_row = rows[column]
+        for idx in range(column + 1, size):
+            row = rows[idx]
+            factor = row[column] / pivot_row[column]
+            for element in range(column, size + 1):
+                row[element] -= factor * pivot_row[element]
+
+    x = [0.0] * size
+    for row in reversed(range(size)):
+        values = rows[row]
+        total = values[size] - sum(values[k] * x[k] for k in range(row + 1, size))
+        x[row] = total / values[row]
+    return tuple(x)
+
+
+def _lu_solve_loop(f: tuple, p: tuple, b: tuple, size: int) -> tuple:
+    """Forward and back substitution with the factors taken by :func:`lu_solve`"""
+    x = [b[pivot] for pivot in p]
+    for row in range(size):
+        for k in range(row):
+            x[row] -= f[row * size + k] * x[k]
+    for row in reversed(range(size)):
+        for k in range(row + 1, size):
+            x[row] -= f[row * size + k] * x[k]
+        x[row] *= f[row * size + row]
+    return tuple(x)
+
+
+def _lu_solve_many_loop(f: tuple, p: tuple, values: list, size: int) -> tuple:
+    """Like :func:`_lu_solve_loop`, for every right hand side in ``values``
+
+    Each element of the solutions is solved for at once, a row at a time.
+    """
+    xs = [values[pivot::size] for pivot in p]
+    for row in range(size):
+        for k in range(row):
+            factor = f[row * size + k]
+            if factor:
+                xs[row] = [x - factor * y for x, y in zip(xs[row], xs[k])]
+    for row in reversed(range(size)):
+        for k in range(row + 1, size):
+            factor = f[row * size + k]
+            if factor:
+                xs[row] = [x - factor * y for x, y in zip(xs[row], xs[k])]
+        reciprocal = f[row * size + row]
+        xs[row] = [x * reciprocal for x in xs[row]]
+    return tuple(xs)
+
+
+set_cache_dir(os.environ.get("MATRIX_KERNEL_CACHE"))
+set_select_fastest(os.environ.get("MATRIX_KERNEL_SELECT") == "fastest")
@@ -0,0 +1,171 @@
+"""LU factorization with partial pivoting
+
+Factorizing a matrix once and solving against the factors is more accurate
+than multiplying by its inverse, and the factors can be reused for any
+number of right hand sides. Solving for one vector with unrolled
+substitution is also faster than multiplying by a reused inverse, as is
+:meth:`LU.solve_many` on the Python backend. With NumPy a single matrix
+product is faster than substituting, so for large well conditioned batches
+``m.inverse().transform_many(buffer)`` is quicker; ``python -m benchmarks run
+-k solve`` compares them. :func:`matrix.cache.lu` keeps the factorization of
+recently used matrices.
+
+    from matrix import cache
+
+    lu = cache.lu(primaries)
+    weights = lu.solve(white)
+    rgb = lu.solve_many(xyz_pixels)
+"""
+from __future__ import annotations
+
+from array import array
+from numbers import Number
+
+from . import backend, kernels
+from .base import Matrix
+from .kernels import _rows
+
+
+class LU:
+    """The factorization ``P A = L U`` of a square matrix
+
+    ``L`` is lower triangular with a unit diagonal, ``U`` is upper triangular
+    and ``P`` swaps rows so the largest available pivot is used in each
+    column. Raises ValueError if the matrix is singular.
+    """
+
+    __slots__ = ("size", "_factors", "_packed", "_pivots", "_sign")
+
+    def __init__(self, m: Matrix):
+        size, _ = m._square_size()
+        rows = [list(row) for row in _rows(m._flat, size)]
+        pivots = list(range(size))
+        sign = 1.0
+        for column in range(size):
+            pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+            if rows[pivot][column] == 0:
+                raise ValueError("Determinant is 0: Unable to factorize")
+            if pivot != column:
+                rows[column], rows[pivot] = rows[pivot], rows[column]
+                pivots[column], pivots[pivot] = pivots[pivot], pivots[column]
+                sign = -sign
+
+            pivot_row = rows[column]
+            for idx in range(column + 1, size):
+                row = rows[idx]
+                factor = row[column] / pivot_row[column]
+                # L is stored below the diagonal, in the elements eliminated
+                row[column] = factor
+                for element in range(column + 1, size):
+                    row[element] -= factor * pivot_row[element]
+
+        self.size = size
+        self._factors = tuple(tuple(row) for row in rows)
+        # The factors as the kernels take them, dividing by the diagonal of U
+        # turned into multiplying by its reciprocals
+        for idx, row in enumerate(rows):
+            row[idx] = 1 / row[idx]
+        self._packed = tuple(value for row in rows for value in row)
+        self._pivots = tuple(pivots)
+        self._sign = sign
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size})"
+
+    @property
+    def pivots(self) -> tuple[int, ...]:
+        """The row of the original matrix used for each row of the factors"""
+        return self._pivots
+
+    @property
+    def lower(self) -> Matrix:
+        size = self.size
+        data = [
+            1.0 if row == column else value if column < row else 0.0
+            for row, values in enumerate(self._factors)
+            for column, value in enumerate(values)
+        ]
+        return Matrix.of_size(size, size)._from_flat_unchecked(tuple(data))
+
+    @property
+    def upper(self) -> Matrix:
+        size = self.size
+        data = [
+            value if column >= row else 0.0
+            for row, values in enumerate(self._factors)
+            for column, value in enumerate(values)
+        ]
+        return Matrix.of_size(size, size)._from_flat_unchecked(tuple(data))
+
+    def determinant(self) -> Number:
+        det = self._sign
+        for idx, row in enumerate(self._factors):
+            det *= row[idx]
+        return det
+
+    def solve(self, b: Matrix) -> Matrix:
+        """The vector ``x`` where ``A x = b``, of the same type as ``b``"""
+        if not isinstance(b, Matrix) or b.size != (self.size, 1):
+            raise TypeError(
+                f"Unable to solve a {self.size}x{self.size} system "
+                f"for {b.__class__.__name__}"
+            )
+
+        x = kernels.lu_solve(self.size)(self._packed, self._pivots, b._flat)
+        return b._from_flat_unchecked(x)
+
+    def solve_many(self, buffer):
+        """Solve for every vector in a flat buffer of right hand sides
+
+        The buffer holds the vectors one after another, like the buffers of
+        :func:`matrix.matrix3x.transform_many_3x1`. The result is a new
+        ``array('d')`` of the same length, or a NumPy array with the same
+        shape when an ndarray is passed in. With NumPy this is several times
+        slower than transforming by the inverse, see the module docstring.
+        """
+        np = backend.numpy()
+        if np is not None:
+            return self._solve_many_numpy(np, buffer)
+
+        size = self.size
+        values = backend.flat_sequence(buffer)
+        if len(values) % size:
+            raise ValueError(f"Buffer length must be a multiple of {size}")
+
+        if isinstance(values, memoryview):
+            # Lists slice and iterate much faster than memoryviews
+            values = values.tolist()
+        xs = kernels.lu_solve_many(size)(self._packed, self._pivots, values)
+
+        result = array("d", bytes(8 * len(values)))
+        for idx, x in enumerate(xs):
+            result[idx::size] = array("d", x)
+        return result
+
+    def _solve_many_numpy(self, np, buffer):
+        size = self.size
+        values = np.asarray(buffer, dtype=np.float64)
+        if values.size % size:
+            raise ValueError(f"Buffer length must be a multiple of {size}")
+
+        # A contiguous row per vector element, updated in place
+        factors = self._factors
+        xs = np.ascontiguousarray(values.reshape(-1, size).T[list(self._pivots)])
+        scaled = np.empty_like(xs[0])
+        for idx, row in enumerate(factors):
+            for k in range(idx):
+                xs[idx] -= np.multiply(xs[k], row[k], out=scaled)
+        for idx in reversed(range(size)):
+            row = factors[idx]
+            for k in range(idx + 1, size):
+                xs[idx] -= np.multiply(xs[k], row[k], out=scaled)
+            xs[idx] *= 1 / row[idx]
+
+        solved = xs.T
+        if isinstance(buffer, np.ndarray):
+            return solved.reshape(buffer.shape)
+
+        result = array("d")
+        # Flattened first, as a view with a 0 in its shape cannot be cast
+        result.frombytes(memoryview(np.ascontiguousarray(solved).ravel()).cast("B"))
+        return result
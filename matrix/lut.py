@@ -0,0 +1,400 @@
+"""Baked 3D lookup tables
+
+A :class:`LUT3D` samples a transform on an N x N x N grid once, then
+transforms pixels by interpolating between the grid points, which is much
+cheaper than evaluating a chain of matrices and transfer functions per
+pixel.
+
+Tables can be saved in a compact binary format and loaded again with the
+values memory mapped, so large tables are shared between processes and cost
+nothing to load. The format is a 24 byte header followed by the table as
+little endian float32 or float64 values::
+
+    magic    4s  b"MLUT"
+    version  B   1
+    typecode c   b"f" or b"d"
+    size     H   grid points along each axis
+    low      d   smallest input value of the grid
+    high     d   largest input value of the grid
+"""
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterable
+from itertools import product
+
+from . import backend
+from .chain import TransformChain
+from .matrix3x import Matrix3x3
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from typing_extensions import Self
+
+HEADER = struct.Struct("<4sBcHdd")
+MAGIC = b"MLUT"
+VERSION = 1
+
+METHODS = ("tetrahedral", "trilinear")
+
+Transform = (
+    Matrix3x3 | TransformChain | Callable[[float, float, float], Iterable[float]]
+)
+
+
+class LUT3D:
+    """A transform of x, y, z values sampled on a regular 3D grid
+
+    ``table`` holds the transformed x, y, z of every grid point, with the x
+    index varying slowest and the z index fastest. Inputs outside of the
+    ``domain`` are clamped to it.
+    """
+
+    __slots__ = ("size", "domain", "_table", "_list")
+
+    def __init__(
+        self,
+        size: int,
+        table: Any,
+        domain: tuple[float, float] = (0.0, 1.0),
+    ):
+        _check_grid(size, domain)
+        if len(table) != 3 * size**3:
+            raise ValueError(
+                f"A LUT of size {size} needs {3 * size**3} values, got {len(table)}"
+            )
+        low, high = domain
+
+        self.size = size
+        self.domain = (float(low), float(high))
+        self._table = table
+        self._list = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(size={self.size}, domain={self.domain})"
+
+    def __eq__(self, other: Any):
+        if isinstance(other, LUT3D):
+            return (
+                self.size == other.size
+                and self.domain == other.domain
+                and list(self._table) == list(other._table)
+            )
+        else:
+            return NotImplemented
+
+    @property
+    def table(self):
+        """The flat sequence of transformed grid points"""
+        return self._table
+
+    @classmethod
+    def bake(
+        cls,
+        transform: Transform,
+        size: int = 33,
+        domain: tuple[float, float] = (0.0, 1.0),
+    ) -> Self:
+        """Sample ``transform`` on a ``size`` x ``size`` x ``size`` grid
+
+        ``transform`` is a :class:`Matrix3x3`, a :class:`TransformChain` or a
+        callable taking x, y and z and returning the transformed x, y, z.
+        """
+        _check_grid(size, domain)
+        low, high = domain
+        step = (high - low) / (size - 1)
+        axis = [low + step * idx for idx in range(size)]
+        grid = array(
+            "d", [value for point in product(axis, repeat=3) for value in point]
+        )
+
+        if isinstance(transform, (Matrix3x3, TransformChain)):
+            table = array("d", transform.transform_many(grid))
+        else:
+            values = iter(grid)
+            table = array(
+                "d",
+                [
+                    value
+                    for point in zip(values, values, values)
+                    for value in transform(*point)
+                ],
+            )
+        return cls(size, table, domain)
+
+    def lookup(self, pixel: Iterable[float], method: str = "tetrahedral") -> tuple:
+        """Transform a single x, y, z value"""
+        x, y, z = pixel
+        return tuple(_interpolator(method)(self, (x,), (y,), (z,)))
+
+    def transform_many(self, buffer: Any, method: str = "tetrahedral"):
+        """Transform a flat buffer of x, y, z triples
+
+        Takes the same buffers and returns the same types as
+        :meth:`Matrix3x3.transform_many <matrix.matrix3x.Matrix3x3.transform_many>`.
+        ``method`` is ``"tetrahedral"`` or ``"trilinear"``. Raises ValueError
+        if any of the values is NaN.
+        """
+        interpolate = _interpolator(method)
+        np = backend.numpy()
+        if np is not None:
+            return self._transform_many_numpy(np, buffer, method)
+
+        values = backend.flat_sequence(buffer)
+        if len(values) % 3:
+            raise ValueError("Buffer length must be a multiple of 3")
+
+        xs = values[0::3]
+        ys = values[1::3]
+        zs = values[2::3]
+        if isinstance(values, memoryview):
+            # Lists iterate much faster than memoryviews
+            xs, ys, zs = xs.tolist(), ys.tolist(), zs.tolist()
+        return array("d", interpolate(self, xs, ys, zs))
+
+    def to_bytes(self, dtype: str = "f") -> bytes:
+        """The table in the binary format, with values of type ``dtype``"""
+        if dtype not in ("f", "d"):
+            raise ValueError(f"dtype must be 'f' or 'd', not {dtype!r}")
+
+        values = array(dtype, self._table)
+        if sys.byteorder == "big":
+            values.byteswap()
+        low, high = self.domain
+        header = HEADER.pack(MAGIC, VERSION, dtype.encode(), self.size, low, high)
+        return header + values.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: Any) -> Self:
+        """Create a LUT from the binary format without copying the values
+
+        ``data`` is ``bytes`` or any object supporting the buffer protocol,
+        which must stay unchanged while the LUT is used.
+        """
+        view = memoryview(data).cast("B")
+        if len(view) < HEADER.size:
+            raise ValueError("Data is too short for a LUT")
+        magic, version, typecode, size, low, high = HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION or typecode not in (b"f", b"d"):
+            raise ValueError("Data is not a LUT in a supported format")
+
+        typecode = typecode.decode()
+        start = HEADER.size
+        values = view[start:]
+        if len(values) % array(typecode).itemsize:
+            raise ValueError("LUT data has a partial value")
+        values = values.cast(typecode)
+        if sys.byteorder == "big":
+            values = array(typecode, values)
+            values.byteswap()
+        return cls(size, values, (low, high))
+
+    def save(self, path: str | os.PathLike, dtype: str = "f"):
+        """Write the LUT to a file, as float32 values by default"""
+        with open(path, "wb") as fp:
+            fp.write(self.to_bytes(dtype))
+
+    @classmethod
+    def load(cls, path: str | os.PathLike) -> Self:
+        """Read a LUT written by :meth:`save`, memory mapping the values
+
+        The map stays open for as long as the table is referenced.
+        """
+        with open(path, "rb") as fp:
+            try:
+                data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # An empty file can't be mapped
+                data = fp.read()
+        return cls.from_bytes(data)
+
+    def _values(self) -> list:
+        """The table as a list, which indexes faster than arrays and views"""
+        if self._list is None:
+            self._list = list(self._table)
+        return self._list
+
+    def _transform_many_numpy(self, np, buffer, method: str):
+        values = np.asarray(buffer, dtype=np.float64)
+        if values.size % 3:
+            raise ValueError("Buffer length must be a multiple of 3")
+        if np.isnan(values).any():
+            raise ValueError("Unable to look up NaN values")
+
+        size = self.size
+        low, high = self.domain
+        table = np.asarray(self._table).reshape(size, size, size, 3)
+
+        position = (values.reshape(-1, 3) - low) * ((size - 1) / (high - low))
+        np.clip(position, 0, size - 1, out=position)
+        index = np.minimum(position.astype(np.intp), size - 2)
+        fraction = position - index
+
+        if method == "trilinear":
+            transformed = _trilinear_numpy(np, table, index, fraction)
+        else:
+            transformed = _tetrahedral_numpy(np, table, index, fraction)
+
+        if isinstance(buffer, np.ndarray):
+            return transformed.reshape(buffer.shape)
+        result = array("d")
+        # Flattened first, as a view with a 0 in its shape cannot be cast
+        result.frombytes(
+            memoryview(np.ascontiguousarray(transformed).ravel()).cast("B")
+        )
+        return result
+
+
+def _check_grid(size: int, domain: tuple[float, float]):
+    if not 2 <= size <= 0xFFFF:
+        raise ValueError(f"size must be between 2 and 65535, not {size}")
+    low, high = domain
+    if not low < high:
+        raise ValueError(f"Invalid domain {domain}")
+
+
+def _interpolator(method: str) -> Callable:
+    if method == "tetrahedral":
+        return _tetrahedral
+    elif method == "trilinear":
+        return _trilinear
+    else:
+        raise ValueError(f"method must be one of {METHODS}, not {method!r}")
+
+
+def _axis(lut: LUT3D, values, stride: int) -> tuple[list, list]:
+    """The table offsets of the grid points below values and the fractions
+    of the way to the next grid points along one axis"""
+    low, high = lut.domain
+    last = lut.size - 1
+    scale = last / (high - low)
+    positions = [(value - low) * scale for value in values]
+    positions = [
+        (0.0 if position <= 0.0 else float(last) if position >= last else position)
+        for position in positions
+    ]
+    try:
+        indices = [
+            last - 1 if position >= last else int(position) for position in positions
+        ]
+    except ValueError:
+        # NaN fails every comparison, so it reaches int() and fails there
+        raise ValueError("Unable to look up NaN values") from None
+    return (
+        [idx * stride for idx in indices],
+        [position - idx for position, idx in zip(positions, indices)],
+    )
+
+
+def _tetrahedral(lut: LUT3D, xs, ys, zs) -> list:
+    """Interpolate within the one of six tetrahedra of a cell holding a point"""
+    t = lut._values()
+    sz = 3
+    sy = 3 * lut.size
+    sx = sy * lut.size
+    ox, fxs = _axis(lut, xs, sx)
+    oy, fys = _axis(lut, ys, sy)
+    oz, fzs = _axis(lut, zs, sz)
+    s111 = sx + sy + sz
+
+    result = []
+    extend = result.extend
+    for c000, fx, fy, fz in zip(map(sum, zip(ox, oy, oz)), fxs, fys, fzs):
+        # Walk from c000 to c111 along the axes in order of decreasing fraction
+        if fx > fy:
+            if fy > fz:
+                w0, w1, w2, w3 = 1 - fx, fx - fy, fy - fz, fz
+                b, c = c000 + sx, c000 + sx + sy
+            elif fx > fz:
+                w0, w1, w2, w3 = 1 - fx, fx - fz, fz - fy, fy
+                b, c = c000 + sx, c000 + sx + sz
+            else:
+                w0, w1, w2, w3 = 1 - fz, fz - fx, fx - fy, fy
+                b, c = c000 + sz, c000 + sx + sz
+        else:
+            if fz > fy:
+                w0, w1, w2, w3 = 1 - fz, fz - fy, fy - fx, fx
+                b, c = c000 + sz, c000 + sy + sz
+            elif fz > fx:
+                w0, w1, w2, w3 = 1 - fy, fy - fz, fz - fx, fx
+                b, c = c000 + sy, c000 + sy + sz
+            else:
+                w0, w1, w2, w3 = 1 - fy, fy - fx, fx - fz, fz
+                b, c = c000 + sy, c000 + sx + sy
+        d = c000 + s111
+
+        extend(
+            (
+                w0 * t[c000] + w1 * t[b] + w2 * t[c] + w3 * t[d],
+                w0 * t[c000 + 1] + w1 * t[b + 1] + w2 * t[c + 1] + w3 * t[d + 1],
+                w0 * t[c000 + 2] + w1 * t[b + 2] + w2 * t[c + 2] + w3 * t[d + 2],
+            )
+        )
+    return result
+
+
+def _trilinear(lut: LUT3D, xs, ys, zs) -> list:
+    """Interpolate between the eight corners of the cell holding a point"""
+    t = lut._values()
+    sy = 3 * lut.size
+    sx = sy * lut.size
+    ox, fxs = _axis(lut, xs, sx)
+    oy, fys = _axis(lut, ys, sy)
+    oz, fzs = _axis(lut, zs, 3)
+
+    result = []
+    append = result.append
+    for c000, fx, fy, fz in zip(map(sum, zip(ox, oy, oz)), fxs, fys, fzs):
+        for channel in (c000, c000 + 1, c000 + 2):
+            c00 = t[channel]
+            c01 = t[channel + sy]
+            c10 = t[channel + sx]
+            c11 = t[channel + sx + sy]
+            c00 += (t[channel + 3] - c00) * fz
+            c01 += (t[channel + sy + 3] - c01) * fz
+            c10 += (t[channel + sx + 3] - c10) * fz
+            c11 += (t[channel + sx + sy + 3] - c11) * fz
+            c0 = c00 + (c01 - c00) * fy
+            c1 = c10 + (c11 - c10) * fy
+            append(c0 + (c1 - c0) * fx)
+    return result
+
+
+def _trilinear_numpy(np, table, index, fraction):
+    i, j, k = index.T
+    fx, fy, fz = (f[:, None] for f in fraction.T)
+    c00 = table[i, j, k] + (table[i, j, k + 1] - table[i, j, k]) * fz
+    c01 = table[i, j + 1, k] + (table[i, j + 1, k + 1] - table[i, j + 1, k]) * fz
+    c10 = table[i + 1, j, k] + (table[i + 1, j, k + 1] - table[i + 1, j, k]) * fz
+    c11 = (
+        table[i + 1, j + 1, k]
+        + (table[i + 1, j + 1, k + 1] - table[i + 1, j + 1, k]) * fz
+    )
+    c0 = c00 + (c01 - c00) * fy
+    c1 = c10 + (c11 - c10) * fy
+    return c0 + (c1 - c0) * fx
+
+
+def _tetrahedral_numpy(np, table, index, fraction):
+    # Visit the axes in order of decreasing fraction, as in _tetrahedral
+    order = np.argsort(-fraction, axis=1, kind="stable")
+    ordered = np.take_along_axis(fraction, order, axis=1)
+    steps = np.eye(3, dtype=np.intp)[order]
+
+    corner = index
+    result = (1 - ordered[:, 0, None]) * table[tuple(corner.T)]
+    weights = (
+        ordered[:, 0] - ordered[:, 1],
+        ordered[:, 1] - ordered[:, 2],
+        ordered[:, 2],
+    )
+    for step, weight in enumerate(weights):
+        corner = corner + steps[:, step]
+        result += weight[:, None] * table[tuple(corner.T)]
+    return result
@@ -1,38 +1,29 @@
+from __future__ import annotations
+
 from collections.abc import Iterable
 from numbers import Number
-from typing import Any
-
-from typing_extensions import Self
 
-from .base import Matrix
+from .base import Matrix, _check_length, register_multiply
 from .matrix2x import Matrix2x1
 from .matrix3x import Matrix3x1
 
 
 class Matrix1x2(Matrix):
+    __slots__ = ()
     size = (1, 2)
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         data: Iterable[Number] | None = None,
     ):
+        self = object.__new__(cls)
         if data is None:
-            self.data = (0.0, 0.0)
+            self._flat = (0.0, 0.0)
         else:
-            self.data = tuple(data[:2])
-
-    def __getitem__(self, idx):
-        return self.data[idx]
-
-    def __mul__(self, other: Any) -> Self | Number:
-        if isinstance(other, Number):
-            data = (self.data[0] * other, self.data[1] * other)
-            return Matrix1x2.from_iterable(data)
-        elif isinstance(other, Matrix2x1):
-            d = self.data
-            return d[0] * other[0] + d[1] * other[1]
-        else:
-            raise TypeError(f"Unable to multiply matrix by type {type(other)}")
+            self._flat = tuple(map(float, data))
+        if len(self._flat) != 2:
+            _check_length(cls.size, len(self._flat))
+        return self
 
     # def __eq__(self, other: Any):
     #     if isinstance(other, Matrix1x2):
@@ -48,34 +39,52 @@ class Matrix1x2(Matrix):
 
 
 class Matrix1x3(Matrix):
+    __slots__ = ()
     size = (1, 3)
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         data: Iterable[Number] | None = None,
     ):
+        self = object.__new__(cls)
         if data is None:
-            self.data = (0.0, 0.0, 0.0)
-        else:
-            self.data = tuple(data[:3])
-
-    def __getitem__(self, idx):
-        return self.data[idx]
-
-    def __mul__(self, other: Any) -> Self | Number:
-        if isinstance(other, Number):
-            data = (self.data[0] * other, self.data[1] * other, self.data[2] * other)
-            return Matrix1x3.from_iterable(data)
-        elif isinstance(other, Matrix3x1):
-            value = (
-                self.data[0] * other.data[0]
-                + self.data[1] * other.data[1]
-                + self.data[2] * other.data[2]
-            )
-            return value
+            self._flat = (0.0, 0.0, 0.0)
         else:
-            raise TypeError(f"Unable to multiply matrix by type {type(other)}")
+            self._flat = tuple(map(float, data))
+        if len(self._flat) != 3:
+            _check_length(cls.size, len(self._flat))
+        return self
 
     @classmethod
     def from_iterable(cls, data: Iterable[Number]):
         return cls(data)
+
+
+def _multiply_1x2_scalar(a: Matrix1x2, b: Number) -> Matrix1x2:
+    d = a._flat
+    b = float(b)
+    return Matrix1x2._from_flat_unchecked((d[0] * b, d[1] * b))
+
+
+def _multiply_1x2_2x1(a: Matrix1x2, b: Matrix2x1) -> float:
+    d = a._flat
+    o = b._flat
+    return d[0] * o[0] + d[1] * o[1]
+
+
+def _multiply_1x3_scalar(a: Matrix1x3, b: Number) -> Matrix1x3:
+    d = a._flat
+    b = float(b)
+    return Matrix1x3._from_flat_unchecked((d[0] * b, d[1] * b, d[2] * b))
+
+
+def _multiply_1x3_3x1(a: Matrix1x3, b: Matrix3x1) -> float:
+    d = a._flat
+    o = b._flat
+    return d[0] * o[0] + d[1] * o[1] + d[2] * o[2]
+
+
+register_multiply(Matrix1x2, Number, _multiply_1x2_scalar)
+register_multiply(Matrix1x2, Matrix2x1, _multiply_1x2_2x1)
+register_multiply(Matrix1x3, Number, _multiply_1x3_scalar)
+register_multiply(Matrix1x3, Matrix3x1, _multiply_1x3_3x1)
@@ -1,33 +1,39 @@
+from __future__ import annotations
+
 from collections.abc import Iterable
+from itertools import chain
 from numbers import Number
-from typing import Any
 
-from typing_extensions import Self
+from . import kernels
+from .base import (
+    Matrix,
+    MutableMatrix,
+    _check_condition,
+    _check_length,
+    register_multiply,
+)
 
-from .base import Matrix
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 
 class Matrix2x1(Matrix):
+    __slots__ = ()
     size = (2, 1)
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         data: Iterable[Number] | None = None,
     ):
+        self = object.__new__(cls)
         if data is None:
-            self.data = (0.0, 0.0)
-        else:
-            self.data = tuple(data[:2])
-
-    def __getitem__(self, idx):
-        return self.data[idx]
-
-    def __mul__(self, other: Any) -> Self | Number:
-        if isinstance(other, Number):
-            data = (self.data[0] * other, self.data[1] * other)
-            return Matrix2x1.from_iterable(data)
+            self._flat = (0.0, 0.0)
         else:
-            raise TypeError(f"Unable to multiply matrix by type {type(other)}")
+            self._flat = tuple(map(float, data))
+        if len(self._flat) != 2:
+            _check_length(cls.size, len(self._flat))
+        return self
 
     @classmethod
     def from_iterable(cls, data: Iterable[Number]):
@@ -35,36 +41,23 @@ class Matrix2x1(Matrix):
 
 
 class Matrix2x2(Matrix):
+    __slots__ = ()
     size = (2, 2)
 
-    def __init__(
-        self,
+    def __new__(
+        cls,
         data: Iterable[Number] | Iterable[Iterable[Number]] | None = None,
     ):
+        self = object.__new__(cls)
         if data is None:
-            self.data = ((1.0, 0.0), (0.0, 1.0))
+            self._flat = (1.0, 0.0, 0.0, 1.0)
         elif isinstance(data[0], Iterable):
-            self.data = (tuple(data[0]), tuple(data[1]))
+            self._flat = tuple(map(float, chain.from_iterable(data)))
         else:
-            self.data = (tuple(data[:2]), tuple(data[2:4]))
-
-    def __getitem__(self, idx):
-        return self.data[idx]
-
-    def __mul__(self, other: Any) -> Self:
-        if isinstance(other, Matrix2x2):
-            return matrix_multiply_2x2(self, other)
-        elif isinstance(other, Matrix2x1):
-            return matrix_multiply_2x1(self, other)
-        elif isinstance(other, Number):
-            d = self.data
-            data = (
-                d[0][0] * other,
-                d[0][1] * other,
-                d[1][0] * other,
-                d[1][1] * other,
-            )
-            return Matrix2x2.from_iterable(data)
+            self._flat = tuple(map(float, data))
+        if len(self._flat) != 4:
+            _check_length(cls.size, len(self._flat))
+        return self
 
     @classmethod
     def from_iterable(
@@ -75,43 +68,102 @@ class Matrix2x2(Matrix):
 
     @classmethod
     def identity(cls):
-        data = ((1.0, 0.0), (0.0, 1.0))
-        return cls.from_iterable(data)
+        return cls._from_flat_unchecked((1.0, 0.0, 0.0, 1.0))
 
     def transpose(self) -> Self:
-        d = self.data
-        data = (
-            (d[0][0], d[1][0]),
-            (d[0][1], d[1][1]),
-        )
-        return Matrix2x2.from_iterable(data)
+        return Matrix2x2._from_flat_unchecked(_transpose_2x2(self._flat))
 
     def determinant(self) -> Number:
-        return (self.data[0][0] * self.data[1][1]) - (self.data[0][1] * self.data[1][0])
-
-    def inverse(self) -> Self:
-        det = self.determinant()
-        if det == 0:
-            raise ValueError("Determinant is 0: Unable to calculate inverse")
-
-        d = self.data
-        data = (
-            (d[1][1] / det, -d[0][1] / det),
-            (-d[1][0] / det, d[0][0] / det),
-        )
-        m = Matrix2x2.from_iterable(data)
-        return m
-
-
-def matrix_multiply_2x1(a: Matrix2x2, b: Matrix2x1) -> Matrix2x1:
-    return Matrix2x1.from_iterable(
-        (a[0][0] * b[0] + a[0][1] * b[1], a[1][0] * b[0] + a[1][1] * b[1])
-    )
-
-
-def matrix_multiply_2x2(a: Matrix2x2, b: Matrix2x2) -> Matrix2x2:
-    elems = (
-        (a[0][0] * b[0][0] + a[0][1] * b[1][0], a[0][0] * b[0][1] + a[0][1] * b[1][1]),
-        (a[1][0] * b[0][0] + a[1][1] * b[1][0], a[1][0] * b[0][1] + a[1][1] * b[1][1]),
-    )
-    return Matrix2x2.from_iterable(elems)
+        return _determinant_2x2(self._flat)
+
+    def inverse(self, tol: float | None = None) -> Self:
+        if tol is None:
+            return Matrix2x2._from_flat_unchecked(_inverse_2x2(self._flat))
+
+        inverse, condition = _inverse_condition_2x2(self._flat)
+        _check_condition(condition, tol)
+        return Matrix2x2._from_flat_unchecked(inverse)
+
+    def condition_number(self) -> float:
+        try:
+            return _inverse_condition_2x2(self._flat)[1]
+        except ValueError:
+            return float("inf")
+
+    def solve(self, b: Matrix2x1) -> Matrix2x1:
+        """The vector ``x`` where ``self * x == b``, by Cramer's rule
+
+        Raises ValueError if the matrix is singular
+        """
+        if not isinstance(b, Matrix2x1):
+            raise TypeError(f"Unable to solve Matrix2x2 for {b.__class__.__name__}")
+        return b._from_flat_unchecked(_solve_2x2(self._flat, b._flat))
+
+
+class Matrix2x1Mut(MutableMatrix, Matrix2x1):
+    """A :class:`Matrix2x1` whose elements can be changed"""
+
+    __slots__ = ()
+
+
+class Matrix2x2Mut(MutableMatrix, Matrix2x2):
+    """A :class:`Matrix2x2` whose elements can be changed"""
+
+    __slots__ = ()
+
+
+def matrix_multiply_2x1(
+    a: Matrix2x2, b: Matrix2x1, out: Matrix2x1Mut | None = None
+) -> Matrix2x1:
+    """Multiply a vector by a matrix, writing into ``out`` if given"""
+    if out is None:
+        return Matrix2x1._from_flat_unchecked(_multiply_2x1(a._flat, b._flat))
+
+    _check_out(out, Matrix2x1Mut)
+    _multiply_2x1_into(a._flat, b._flat, out._flat)
+    return out
+
+
+def matrix_multiply_2x2(
+    a: Matrix2x2, b: Matrix2x2, out: Matrix2x2Mut | None = None
+) -> Matrix2x2:
+    """Multiply two matrices, writing into ``out`` if given"""
+    if out is None:
+        return Matrix2x2._from_flat_unchecked(_multiply_2x2(a._flat, b._flat))
+
+    _check_out(out, Matrix2x2Mut)
+    _multiply_2x2_into(a._flat, b._flat, out._flat)
+    return out
+
+
+def _multiply_2x1_scalar(a: Matrix2x1, b: Number) -> Matrix2x1:
+    d = a._flat
+    b = float(b)
+    return Matrix2x1._from_flat_unchecked((d[0] * b, d[1] * b))
+
+
+def _multiply_2x2_scalar(a: Matrix2x2, b: Number) -> Matrix2x2:
+    d = a._flat
+    b = float(b)
+    return Matrix2x2._from_flat_unchecked((d[0] * b, d[1] * b, d[2] * b, d[3] * b))
+
+
+def _check_out(out: Matrix, cls: type[Matrix]):
+    if not isinstance(out, cls):
+        raise TypeError(f"out must be a {cls.__name__}, not {type(out).__name__}")
+
+
+_multiply_2x2 = kernels.multiply(2, 2, 2)
+_multiply_2x1 = kernels.multiply(2, 2, 1)
+_multiply_2x2_into = kernels.multiply_into(2, 2, 2)
+_multiply_2x1_into = kernels.multiply_into(2, 2, 1)
+_transpose_2x2 = kernels.transpose(2, 2)
+_determinant_2x2 = kernels.determinant(2)
+_inverse_2x2 = kernels.inverse(2)
+_inverse_condition_2x2 = kernels.inverse_condition(2)
+_solve_2x2 = kernels.solve(2)
+
+register_multiply(Matrix2x1, Number, _multiply_2x1_scalar)
+register_multiply(Matrix2x2, Number, _multiply_2x2_scalar)
+register_multiply(Matrix2x2, Matrix2x1, matrix_multiply_2x1)
+register_multiply(Matrix2x2, Matrix2x2, matrix_multiply_2x2)
@@ -1,225 +1,332 @@
+from __future__ import annotations
+
+from array import array
 from collections.abc import Iterable
+from itertools import chain
 from numbers import Number
-from typing import Any
 
-from typing_extensions import Self
+from . import backend, kernels
+from .base import (
+    Matrix,
+    MutableMatrix,
+    _check_condition,
+    _check_length,
+    register_multiply,
+)
 
-from .base import Matrix
-from .matrix2x import Matrix2x2
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing_extensions import Self
 
 
 class Matrix3x1(Matrix):
+    __slots__ = ()
     size = (3, 1)
 
-    def __init__(self, data: Iterable[Number] | None = None):
+    def __new__(cls, data: Iterable[Number] | None = None):
+        self = object.__new__(cls)
         if data is None:
-            self.data = (0.0, 0.0, 0.0)
+            self._flat = (0.0, 0.0, 0.0)
         else:
-            self.data = data[:3]
-
-    def __getitem__(self, idx):
-        return self.data[idx]
-
-    def __mul__(self, other: Any):
-        d = self.data
-        if isinstance(other, Number):
-            data = (d[0] * other, d[1] * other, d[2] * other)
-            return Matrix3x1.from_iterable(data)
-        else:
-            raise TypeError(f"Unable to multiply matrix by type {type(other)}")
+            self._flat = tuple(map(float, data))
+        if len(self._flat) != 3:
+            _check_length(cls.size, len(self._flat))
+        return self
 
     @classmethod
     def from_iterable(cls, number_array: Iterable[Number]):
-        return cls(tuple(number_array[:3]))
+        return cls(number_array)
 
 
 class Matrix3x3(Matrix):
+    __slots__ = ()
     size = (3, 3)
 
-    def __init__(self, data: Iterable[Iterable[Number]] | None = None):
+    def __new__(
+        cls,
+        data: Iterable[Number] | Iterable[Iterable[Number]] | None = None,
+    ):
+        self = object.__new__(cls)
         if data is None:
-            self.data = ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
-        else:
-            self.data = data
-
-    def __getitem__(self, idx):
-        return self.data[idx]
-
-    def __mul__(self, other: Any) -> Self:
-        if isinstance(other, Matrix3x3):
-            return matrix_multiply_3x3(self, other)
-        elif isinstance(other, Matrix3x1):
-            return matrix_multiply_3x1(self, other)
-        elif isinstance(other, Number):
-            data = ()
-            for row in range(3):
-                row_data = ()
-                for column in range(3):
-                    value = self.data[row][column] * float(other)
-                    row_data += (value,)
-
-                data += row_data
-
-            return Matrix3x3.from_iterable(data)
+            self._flat = (0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        elif isinstance(data[0], Iterable):
+            self._flat = tuple(map(float, chain.from_iterable(data)))
         else:
-            raise TypeError(f"Unable to multiply matrix but type {type(other)}")
+            self._flat = tuple(map(float, data))
+        if len(self._flat) != 9:
+            _check_length(cls.size, len(self._flat))
+        return self
 
     @classmethod
-    def from_iterable(cls, number_array: Iterable[Number]):
-        if isinstance(number_array[0], Iterable):
-            return cls(number_array)
-        return cls(
-            (
-                tuple(number_array[:3]),
-                tuple(number_array[3:6]),
-                tuple(number_array[6:9]),
-            )
-        )
+    def from_iterable(
+        cls,
+        number_array: Iterable[Number] | Iterable[Iterable[Number]],
+    ):
+        return cls(number_array)
 
     @classmethod
     def identity(cls):
-        data = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
-        return cls.from_iterable(data)
+        data = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
+        return cls._from_flat_unchecked(data)
 
     def transpose(self) -> Self:
-        d = self.data
-        data = (
-            (d[0][0], d[1][0], d[2][0]),
-            (d[0][1], d[1][1], d[2][1]),
-            (d[0][2], d[1][2], d[2][2]),
-        )
-
-        return Matrix3x3.from_iterable(data)
+        return Matrix3x3._from_flat_unchecked(_transpose_3x3(self._flat))
 
     def determinant(self) -> Number:
-        d = (self.data[0] * 2, self.data[1] * 2, self.data[2] * 2)
-        return (
-            d[0][0] * d[1][1] * d[2][2]
-            + d[0][1] * d[1][2] * d[2][3]
-            + d[0][2] * d[1][3] * d[2][4]
-            - d[0][0] * d[1][2] * d[2][1]
-            - d[0][1] * d[1][0] * d[2][2]
-            - d[0][2] * d[1][1] * d[2][0]
-        )
-
-    def adjoint(self) -> Self:
-        elements: Iterable[Iterable[Matrix2x2]] = [[], [], []]
-
-        d = self.data
-        all_rows = set(range(3))
-        all_columns = set(range(3))
-        for row in range(3):
-            other_rows = tuple(all_rows - set((row,)))
-            for column in range(3):
-                other_columns = tuple(all_columns - set((column,)))
-                tl = d[other_rows[0]][other_columns[0]]
-                bl = d[other_rows[1]][other_columns[0]]
-                tr = d[other_rows[0]][other_columns[1]]
-                br = d[other_rows[1]][other_columns[1]]
-                m = Matrix2x2.from_iterable([tl, tr, bl, br])
-                elements[row].append(m)
-
-        sign = 1
-        dets = []
-        for row in range(3):
-            for column in range(3):
-                dets.append(elements[row][column].determinant() * sign)
-                sign *= -1
-
-        m = Matrix3x3.from_iterable(dets)
-        return m.transpose()
-
-    def inverse(self) -> Self:
-        det = self.determinant()
-        if det == 0:
-            raise ValueError("Determinant is 0: Unable to calculate inverse")
-
-        adjoint = self.adjoint()
-        return adjoint * (1 / det)
-
-
-def matrix_multiply_3x1(a: Matrix3x3, b: Matrix3x1) -> Matrix3x1:
-    elems = (
-        b[0] * a[0][0] + b[1] * a[0][1] + b[2] * a[0][2],
-        b[0] * a[1][0] + b[1] * a[1][1] + b[2] * a[1][2],
-        b[0] * a[2][0] + b[1] * a[2][1] + b[2] * a[2][2],
-    )
-    return Matrix3x1.from_iterable(elems)
+        return _determinant_3x3(self._flat)
 
+    def cofactor(self) -> Self:
+        """The matrix of cofactors"""
+        return Matrix3x3._from_flat_unchecked(_cofactors(self._flat))
 
-def matrix_multiply_3x3(a: Matrix3x3, b: Matrix3x3) -> Matrix3x3:
-    """3x3 matrix multiplication
+    def adjugate(self) -> Self:
+        """The transpose of the cofactor matrix"""
+        c00, c01, c02, c10, c11, c12, c20, c21, c22 = _cofactors(self._flat)
+        data = (c00, c10, c20, c01, c11, c21, c02, c12, c22)
+        return Matrix3x3._from_flat_unchecked(data)
 
-    http://www.ams.org/journals/bull/1976-82-01/S0002-9904-1976-13988-2/S0002-9904-1976-13988-2.pdf
+    adjoint = adjugate
+
+    def inverse(self, tol: float | None = None) -> Self:
+        if tol is None:
+            return Matrix3x3._from_flat_unchecked(_inverse_3x3(self._flat))
+
+        inverse, condition = _inverse_condition_3x3(self._flat)
+        _check_condition(condition, tol)
+        return Matrix3x3._from_flat_unchecked(inverse)
+
+    def condition_number(self) -> float:
+        try:
+            return _inverse_condition_3x3(self._flat)[1]
+        except ValueError:
+            return float("inf")
+
+    def solve(self, b: Matrix3x1) -> Matrix3x1:
+        """The vector ``x`` where ``self * x == b``, by Cramer's rule
+
+        Raises ValueError if the matrix is singular
+        """
+        if not isinstance(b, Matrix3x1):
+            raise TypeError(f"Unable to solve Matrix3x3 for {b.__class__.__name__}")
+        return b._from_flat_unchecked(_solve_3x3(self._flat, b._flat))
+
+    def quantize(self, bits: int = 8, shift: int | None = None):
+        """This matrix as integer coefficients for ``bits`` bit pixels
+
+        See :class:`matrix.fixed.FixedMatrix3x3`
+        """
+        from .fixed import FixedMatrix3x3
+
+        return FixedMatrix3x3(self, bits, shift)
+
+    def transform_many(self, buffer):
+        """Multiply every 3 element vector in a flat buffer by this matrix
+
+        See :func:`transform_many_3x1`
+        """
+        return transform_many_3x1(self, buffer)
+
+
+class Matrix3x1Mut(MutableMatrix, Matrix3x1):
+    """A :class:`Matrix3x1` whose elements can be changed"""
+
+    __slots__ = ()
+
+
+class Matrix3x3Mut(MutableMatrix, Matrix3x3):
+    """A :class:`Matrix3x3` whose elements can be changed"""
+
+    __slots__ = ()
+
+
+def matrix_multiply_3x1(
+    a: Matrix3x3, b: Matrix3x1, out: Matrix3x1Mut | None = None
+) -> Matrix3x1:
+    """Multiply a vector by a matrix
+
+    If ``out`` is given the result is written into it and it is returned,
+    so no new vector is created. ``out`` may be ``b``.
     """
-    terms = []
+    if out is None:
+        return Matrix3x1._from_flat_unchecked(_multiply_3x1(a._flat, b._flat))
+
+    _check_out(out, Matrix3x1Mut)
+    _multiply_3x1_into(a._flat, b._flat, out._flat)
+    return out
+
+
+def _multiply_3x1_scalar(a: Matrix3x1, b: Number) -> Matrix3x1:
+    d = a._flat
+    b = float(b)
+    return Matrix3x1._from_flat_unchecked((d[0] * b, d[1] * b, d[2] * b))
+
+
+def _multiply_3x3_scalar(a: Matrix3x3, b: Number) -> Matrix3x3:
+    b = float(b)
+    return Matrix3x3._from_flat_unchecked(tuple([value * b for value in a._flat]))
 
-    terms.append(
-        (a[0][0] + a[0][1] + a[0][2] - a[1][0] - a[1][1] - a[2][1] - a[2][2]) * b[1][1]
+
+def determinants(matrices: Iterable[Matrix3x3]) -> array:
+    """The determinant of each matrix as an ``array('d')``"""
+    return array(
+        "d",
+        [
+            a00 * (a11 * a22 - a12 * a21)
+            + a01 * (a12 * a20 - a10 * a22)
+            + a02 * (a10 * a21 - a11 * a20)
+            for a00, a01, a02, a10, a11, a12, a20, a21, a22 in (
+                m._flat for m in matrices
+            )
+        ],
     )
-    terms.append((a[0][0] - a[1][0]) * (-b[0][1] + b[1][1]))
-    terms.append(
-        a[1][1] * (-b[0][0] + b[0][1] + b[1][0] - b[1][1] - b[1][2] - b[2][0] + b[2][2])
+
+
+def _cofactors(d: tuple) -> tuple:
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = d
+    return (
+        a11 * a22 - a12 * a21,
+        a12 * a20 - a10 * a22,
+        a10 * a21 - a11 * a20,
+        a02 * a21 - a01 * a22,
+        a00 * a22 - a02 * a20,
+        a01 * a20 - a00 * a21,
+        a01 * a12 - a02 * a11,
+        a02 * a10 - a00 * a12,
+        a00 * a11 - a01 * a10,
     )
-    terms.append((-a[0][0] + a[1][0] + a[1][1]) * (b[0][0] - b[0][1] + b[1][1]))
-    terms.append((a[1][0] + a[1][1]) * (-b[0][0] + b[0][1]))
-    terms.append(a[0][0] * b[0][0])
-    terms.append((-a[0][0] + a[2][0] + a[2][1]) * (b[0][0] - b[0][2] + b[1][2]))
-    terms.append((-a[0][0] + a[2][0]) * (b[0][2] - b[1][2]))
-    terms.append((a[2][0] + a[2][1]) * (-b[0][0] + b[0][2]))
-    terms.append(
-        (a[0][0] + a[0][1] + a[0][2] - a[1][1] - a[1][2] - a[2][0] - a[2][1]) * b[1][2]
+
+
+def transform_many_3x1(a: Matrix3x3, buffer):
+    """Multiply a flat buffer of x, y, z triples by a 3x3 matrix
+
+    ``buffer`` can be a list of floats, an ``array('d')`` or any object
+    supporting the buffer protocol. The result is a new ``array('d')`` of the
+    same length, or a NumPy array with the same shape when an ndarray is passed
+    in. The NumPy backend is used whenever NumPy is installed.
+    """
+    np = backend.numpy()
+    if np is not None:
+        return _transform_many_numpy(np, a, buffer)
+
+    values = backend.flat_sequence(buffer)
+    if len(values) % 3:
+        raise ValueError("Buffer length must be a multiple of 3")
+    return _transform_many_python(a._flat, values)
+
+
+def _transform_many_python(flat, values) -> array:
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = flat
+    xs = values[0::3]
+    ys = values[1::3]
+    zs = values[2::3]
+
+    result = array("d", bytes(8 * len(values)))
+    result[0::3] = array(
+        "d", [a00 * x + a01 * y + a02 * z for x, y, z in zip(xs, ys, zs)]
     )
-    terms.append(
-        a[2][1] * (-b[0][0] + b[0][2] + b[1][0] - b[1][1] - b[1][2] - b[2][0] + b[2][1])
+    result[1::3] = array(
+        "d", [a10 * x + a11 * y + a12 * z for x, y, z in zip(xs, ys, zs)]
     )
-    terms.append((-a[0][2] + a[2][1] + a[2][2]) * (b[1][1] + b[2][0] - b[2][1]))
-    terms.append((a[0][2] - a[2][2]) * (b[1][1] - b[2][1]))
-    terms.append(a[0][2] * b[2][0])
-    terms.append((a[2][1] + a[2][2]) * (-b[2][0] + b[2][1]))
-    terms.append((-a[0][2] + a[1][1] + a[1][2]) * (b[1][2] + b[2][0] - b[2][2]))
-    terms.append((a[0][2] - a[1][2]) * (b[1][2] - b[2][2]))
-    terms.append((a[1][1] + a[1][2]) * (-b[2][0] + b[2][2]))
-    terms.append(a[0][1] * b[1][0])
-    terms.append(a[1][2] * b[2][1])
-    terms.append(a[1][0] * b[0][2])
-    terms.append(a[2][0] * b[0][1])
-    terms.append(a[2][2] * b[2][2])
-
-    return Matrix3x3.from_iterable(
-        [
-            terms[5] + terms[13] + terms[18],
-            terms[0]
-            + terms[3]
-            + terms[4]
-            + terms[5]
-            + terms[11]
-            + terms[13]
-            + terms[14],
-            terms[5]
-            + terms[6]
-            + terms[8]
-            + terms[9]
-            + terms[13]
-            + terms[15]
-            + terms[17],
-            terms[1]
-            + terms[2]
-            + terms[3]
-            + terms[5]
-            + terms[13]
-            + terms[15]
-            + terms[16],
-            terms[1] + terms[3] + terms[4] + terms[5] + terms[19],
-            terms[13] + terms[15] + terms[16] + terms[17] + terms[20],
-            terms[5]
-            + terms[6]
-            + terms[7]
-            + terms[10]
-            + terms[11]
-            + terms[12]
-            + terms[13],
-            terms[11] + terms[12] + terms[13] + terms[14] + terms[21],
-            terms[5] + terms[6] + terms[7] + terms[8] + terms[22],
-        ]
+    result[2::3] = array(
+        "d", [a20 * x + a21 * y + a22 * z for x, y, z in zip(xs, ys, zs)]
     )
+    return result
+
+
+def _transform_many_numpy(np, a: Matrix3x3, buffer):
+    values = np.asarray(buffer, dtype=np.float64)
+    if values.size % 3:
+        raise ValueError("Buffer length must be a multiple of 3")
+
+    transformed = values.reshape(-1, 3) @ np.array(a._flat).reshape(3, 3).T
+    if isinstance(buffer, np.ndarray):
+        return transformed.reshape(buffer.shape)
+
+    result = array("d")
+    # Flattened first, as a view with a 0 in its shape cannot be cast
+    result.frombytes(memoryview(transformed.ravel()).cast("B"))
+    return result
+
+
+def matrix_multiply_3x3(
+    a: Matrix3x3, b: Matrix3x3, out: Matrix3x3Mut | None = None
+) -> Matrix3x3:
+    """Multiply two matrices
+
+    If ``out`` is given the result is written into it and it is returned,
+    so no new matrix is created. ``out`` may be ``a`` or ``b``.
+    """
+    if out is None:
+        return Matrix3x3._from_flat_unchecked(_multiply_3x3(a._flat, b._flat))
+
+    _check_out(out, Matrix3x3Mut)
+    _multiply_3x3_into(a._flat, b._flat, out._flat)
+    return out
+
+
+def _check_out(out: Matrix, cls: type[Matrix]):
+    if not isinstance(out, cls):
+        raise TypeError(f"out must be a {cls.__name__}, not {type(out).__name__}")
+
+
+def _laderman_3x3(a: tuple, b: tuple) -> tuple:
+    """3x3 matrix multiplication using 23 multiplications
+
+    http://www.ams.org/journals/bull/1976-82-01/S0002-9904-1976-13988-2/S0002-9904-1976-13988-2.pdf
+    """
+    a00, a01, a02, a10, a11, a12, a20, a21, a22 = a
+    b00, b01, b02, b10, b11, b12, b20, b21, b22 = b
+    terms = []
+
+    terms.append((a00 + a01 + a02 - a10 - a11 - a21 - a22) * b11)
+    terms.append((a00 - a10) * (-b01 + b11))
+    terms.append(a11 * (-b00 + b01 + b10 - b11 - b12 - b20 + b22))
+    terms.append((-a00 + a10 + a11) * (b00 - b01 + b11))
+    terms.append((a10 + a11) * (-b00 + b01))
+    terms.append(a00 * b00)
+    terms.append((-a00 + a20 + a21) * (b00 - b02 + b12))
+    terms.append((-a00 + a20) * (b02 - b12))
+    terms.append((a20 + a21) * (-b00 + b02))
+    terms.append((a00 + a01 + a02 - a11 - a12 - a20 - a21) * b12)
+    terms.append(a21 * (-b00 + b02 + b10 - b11 - b12 - b20 + b21))
+    terms.append((-a02 + a21 + a22) * (b11 + b20 - b21))
+    terms.append((a02 - a22) * (b11 - b21))
+    terms.append(a02 * b20)
+    terms.append((a21 + a22) * (-b20 + b21))
+    terms.append((-a02 + a11 + a12) * (b12 + b20 - b22))
+    terms.append((a02 - a12) * (b12 - b22))
+    terms.append((a11 + a12) * (-b20 + b22))
+    terms.append(a01 * b10)
+    terms.append(a12 * b21)
+    terms.append(a10 * b02)
+    terms.append(a20 * b01)
+    terms.append(a22 * b22)
+
+    return (
+        terms[5] + terms[13] + terms[18],
+        terms[0] + terms[3] + terms[4] + terms[5] + terms[11] + terms[13] + terms[14],
+        terms[5] + terms[6] + terms[8] + terms[9] + terms[13] + terms[15] + terms[17],
+        terms[1] + terms[2] + terms[3] + terms[5] + terms[13] + terms[15] + terms[16],
+        terms[1] + terms[3] + terms[4] + terms[5] + terms[19],
+        terms[13] + terms[15] + terms[16] + terms[17] + terms[20],
+        terms[5] + terms[6] + terms[7] + terms[10] + terms[11] + terms[12] + terms[13],
+        terms[11] + terms[12] + terms[13] + terms[14] + terms[21],
+        terms[5] + terms[6] + terms[7] + terms[8] + terms[22],
+    )
+
+
+kernels.register_variant("multiply", (3, 3, 3), "laderman", _laderman_3x3)
+_multiply_3x3 = kernels.multiply(3, 3, 3)
+_multiply_3x1 = kernels.multiply(3, 3, 1)
+_multiply_3x3_into = kernels.multiply_into(3, 3, 3)
+_multiply_3x1_into = kernels.multiply_into(3, 3, 1)
+_transpose_3x3 = kernels.transpose(3, 3)
+_determinant_3x3 = kernels.determinant(3)
+_inverse_3x3 = kernels.inverse(3)
+_inverse_condition_3x3 = kernels.inverse_condition(3)
+_solve_3x3 = kernels.solve(3)
+
+register_multiply(Matrix3x1, Number, _multiply_3x1_scalar)
+register_multiply(Matrix3x3, Number, _multiply_3x3_scalar)
+register_multiply(Matrix3x3, Matrix3x1, matrix_multiply_3x1)
+register_multiply(Matrix3x3, Matrix3x3, matrix_multiply_3x3)
@@ -0,0 +1,184 @@
+"""Batched operations split across several cores
+
+The work is divided into chunks which run on a pool from
+:mod:`concurrent.futures`. When the NumPy backend is in use the chunks run
+on a thread pool, as NumPy releases the GIL while it computes. Otherwise
+they run on a process pool, with the values passed through
+:mod:`multiprocessing.shared_memory` so only the chunk bounds are pickled.
+
+A pool is started for each call unless one is passed as ``executor``, which
+is worth doing when calling repeatedly as starting processes is slow.
+
+    with ProcessPoolExecutor() as pool:
+        for image in images:
+            xyz = parallel.transform_many(rgb_to_xyz, image, executor=pool)
+"""
+import os
+import sys
+from array import array
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any
+
+from . import backend
+from .arrays import Matrix3x3Array
+from .chain import TransformChain
+from .matrix3x import Matrix3x3, _transform_many_python
+
+# Number of x, y, z vectors, or of matrices, in each chunk
+DEFAULT_CHUNK_SIZE = 262144
+
+
+def transform_many(
+    a: Matrix3x3 | TransformChain,
+    buffer: Any,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: bool | None = None,
+    executor: Executor | None = None,
+):
+    """Multiply a flat buffer of x, y, z triples by a 3x3 matrix on many cores
+
+    Takes the same buffers and returns the same result as
+    :func:`matrix.matrix3x.transform_many_3x1`. ``workers`` defaults to the
+    number of CPUs and ``processes`` selects a process pool rather than a
+    thread pool; by default processes are used unless the NumPy backend is.
+    Both are ignored when an ``executor`` to run the chunks on is passed.
+    """
+    if isinstance(a, TransformChain):
+        a = a.matrix
+
+    values = backend.float64_view(buffer)
+    if len(values) % 3:
+        raise ValueError("Buffer length must be a multiple of 3")
+
+    chunks = _chunks(len(values) // 3, chunk_size, 3)
+    result = _run(
+        _transform_part, a._flat, values, chunks, workers, processes, executor
+    )
+
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(buffer, numpy.ndarray):
+        return numpy.frombuffer(result, dtype=numpy.float64).reshape(buffer.shape)
+    return result
+
+
+def inverse(
+    matrices: Matrix3x3Array,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: bool | None = None,
+    executor: Executor | None = None,
+    tol: float | None = None,
+) -> Matrix3x3Array:
+    """Invert every matrix in a :class:`Matrix3x3Array` on many cores
+
+    See :func:`transform_many` for the other arguments. Raises ValueError if
+    any of the matrices has a determinant of 0 or, when ``tol`` is given, is
+    nearly singular, as :meth:`Matrix3x3Array.inverse` does.
+    """
+    length = len(matrices)
+    values = memoryview(matrices._data)
+    chunks = _chunks(length, chunk_size, 1)
+    result = _run(
+        _inverse_part, (length, tol), values, chunks, workers, processes, executor
+    )
+    return Matrix3x3Array._from_storage(result, length)
+
+
+def _chunks(count: int, chunk_size: int, width: int) -> list[tuple[int, int]]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    return [
+        (start * width, min(start + chunk_size, count) * width)
+        for start in range(0, count, chunk_size)
+    ]
+
+
+def _run(part, argument, values, chunks, workers, processes, executor) -> array:
+    """Call ``part(argument, values, result, start, stop)`` for every chunk"""
+    if executor is None:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if processes is None:
+            processes = backend.numpy() is None
+
+        if len(chunks) > 1 and workers > 1:
+            pool_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with pool_type(min(workers, len(chunks))) as pool:
+                return _run(part, argument, values, chunks, None, None, pool)
+
+    if isinstance(executor, ProcessPoolExecutor):
+        return _run_processes(executor, part, argument, values, chunks)
+
+    result = array("d", bytes(8 * len(values)))
+    with memoryview(result) as view:
+        if executor is None:
+            for start, stop in chunks:
+                part(argument, values, view, start, stop)
+        else:
+            _wait(executor, part, (argument, values, view), chunks)
+    return result
+
+
+def _run_processes(pool: Executor, part, argument, values, chunks) -> array:
+    # Each chunk only reads the values it writes, so the results are written
+    # over the values in a single block
+    shared = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        with shared.buf[: values.nbytes] as view:
+            view[:] = values.cast("B")
+
+        _wait(pool, _shared_part, ((part, argument), shared.name), chunks)
+
+        result = array("d")
+        with shared.buf[: values.nbytes] as view:
+            result.frombytes(view)
+        return result
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def _wait(pool: Executor, part, args: tuple, chunks):
+    futures = [pool.submit(part, *args, start, stop) for start, stop in chunks]
+    for future in futures:
+        future.result()
+
+
+def _shared_part(call: tuple, name: str, start: int, stop: int):
+    """Run one chunk in a worker process on the shared memory block"""
+    part, argument = call
+    shared = shared_memory.SharedMemory(name)
+    try:
+        with shared.buf.cast("d") as values:
+            part(argument, values, values, start, stop)
+    finally:
+        shared.close()
+
+
+def _transform_part(flat: tuple, values, result, start: int, stop: int):
+    np = backend.numpy()
+    if np is None:
+        with values[start:stop] as chunk:
+            result[start:stop] = _transform_many_python(flat, chunk)
+        return
+
+    a = np.array(flat).reshape(3, 3)
+    chunk = np.frombuffer(values, dtype=np.float64)[start:stop]
+    out = np.frombuffer(result, dtype=np.float64)[start:stop]
+    np.matmul(chunk.reshape(-1, 3), a.T, out=out.reshape(-1, 3))
+
+
+def _inverse_part(argument: tuple, values, result, start: int, stop: int):
+    length, tol = argument
+    bounds = [
+        (offset + start, offset + stop) for offset in range(0, 9 * length, length)
+    ]
+    data = array("d")
+    for lo, hi in bounds:
+        data.frombytes(values[lo:hi].cast("B"))
+    inverses = Matrix3x3Array._from_storage(data, stop - start).inverse(tol)
+    for idx, (lo, hi) in enumerate(bounds):
+        result[lo:hi] = inverses.component(idx)
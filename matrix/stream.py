@@ -0,0 +1,151 @@
+"""Streaming transforms of flat x, y, z data
+
+The input is processed in fixed size chunks with the batched
+:meth:`Matrix3x3.transform_many <matrix.matrix3x.Matrix3x3.transform_many>`
+kernel, so memory use depends on the chunk size and not on the input size.
+Files are memory mapped where possible and read in chunks otherwise.
+"""
+import mmap
+import os
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import BinaryIO
+
+from . import backend
+from .chain import TransformChain
+from .matrix3x import Matrix3x3
+
+# Number of x, y, z vectors in each chunk
+DEFAULT_CHUNK_SIZE = 65536
+
+# Array typecodes of the supported element types, float32 and float64
+TYPECODES = ("f", "d")
+
+Source = str | os.PathLike | BinaryIO | Iterable[float]
+Destination = str | os.PathLike | BinaryIO
+
+
+def transform(
+    src: Source,
+    dst: Destination,
+    matrix: Matrix3x3 | TransformChain,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype: str = "d",
+) -> int:
+    """Transform every x, y, z vector in ``src`` and write them to ``dst``
+
+    ``src`` is a file name, a binary file or an iterable of numbers, and
+    ``dst`` a file name or a binary file. Files hold raw, native endian
+    float32 (``dtype="f"``) or float64 (``dtype="d"``) values and the output
+    has the same type as the input.
+
+    Returns the number of vectors transformed.
+    """
+    if isinstance(dst, (str, os.PathLike)):
+        with open(dst, "wb") as fp:
+            return transform(src, fp, matrix, chunk_size, dtype)
+
+    count = 0
+    for chunk in transform_iter(src, matrix, chunk_size, dtype):
+        dst.write(chunk)
+        count += len(chunk) // 3
+    return count
+
+
+def transform_iter(
+    src: Source,
+    matrix: Matrix3x3 | TransformChain,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dtype: str = "d",
+) -> Iterator[array]:
+    """Transform ``src`` one chunk at a time
+
+    See :func:`transform` for the arguments. Yields an ``array`` of
+    ``dtype`` holding up to ``chunk_size`` transformed vectors.
+    """
+    if dtype not in TYPECODES:
+        raise ValueError(f"dtype must be one of {TYPECODES}, not {dtype!r}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    if isinstance(src, (str, os.PathLike)):
+        with open(src, "rb") as fp:
+            yield from _transform_file(fp, matrix, chunk_size, dtype)
+    elif hasattr(src, "read"):
+        yield from _transform_file(src, matrix, chunk_size, dtype)
+    else:
+        yield from _transform_iterable(src, matrix, chunk_size, dtype)
+
+
+def _transform_file(
+    fp: BinaryIO, matrix: Matrix3x3 | TransformChain, chunk_size: int, dtype: str
+) -> Iterator[array]:
+    step = 3 * chunk_size * array(dtype).itemsize
+    try:
+        mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Not a regular file, e.g. a pipe or BytesIO, or an empty file
+        mapped = None
+
+    if mapped is None:
+        # Reads can return fewer bytes than asked for, so carry any partial
+        # vector over to the next read and only check the length at the end
+        vector = 3 * array(dtype).itemsize
+        pending = b""
+        while data := fp.read(step):
+            if pending:
+                data = pending + data
+            usable = len(data) - len(data) % vector
+            pending = data[usable:]
+            if usable:
+                with memoryview(data)[:usable] as raw, raw.cast(dtype) as chunk:
+                    result = _transform_chunk(matrix, chunk, dtype)
+                yield result
+        _check_length(len(pending), dtype)
+        return
+
+    # The map covers the whole file, so start from the current position and
+    # leave the file after the data read, as reading it would
+    offset = fp.tell()
+    with mapped, memoryview(mapped) as view:
+        _check_length(max(len(view) - offset, 0), dtype)
+        for start in range(offset, len(view), step):
+            stop = start + step
+            # Release the views into the map before handing the result out
+            with view[start:stop] as raw, raw.cast(dtype) as chunk:
+                result = _transform_chunk(matrix, chunk, dtype)
+            fp.seek(min(stop, len(view)))
+            yield result
+
+
+def _transform_iterable(
+    src: Iterable[float],
+    matrix: Matrix3x3 | TransformChain,
+    chunk_size: int,
+    dtype: str,
+) -> Iterator[array]:
+    values = iter(src)
+    while chunk := array(dtype, islice(values, 3 * chunk_size)):
+        if len(chunk) % 3:
+            raise ValueError("Number of values must be a multiple of 3")
+        yield _transform_chunk(matrix, chunk, dtype)
+
+
+def _transform_chunk(matrix: Matrix3x3 | TransformChain, chunk, dtype: str) -> array:
+    np = backend.numpy()
+    if np is not None:
+        values = matrix.transform_many(np.frombuffer(chunk, dtype=dtype))
+        result = array(dtype)
+        result.frombytes(memoryview(values.astype(dtype, copy=False)).cast("B"))
+        return result
+
+    result = matrix.transform_many(chunk)
+    if result.typecode != dtype:
+        result = array(dtype, result)
+    return result
+
+
+def _check_length(length: int, dtype: str):
+    if length % (3 * array(dtype).itemsize):
+        raise ValueError("Input length must be a multiple of 3 values")
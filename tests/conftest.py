@@ -1,5 +1,7 @@
+import pytest
 from pytest import fixture
 
+from matrix import backend
 from matrix.matrix1x import Matrix1x2, Matrix1x3
 from matrix.matrix2x import Matrix2x1, Matrix2x2
 from matrix.matrix3x import Matrix3x1, Matrix3x3
@@ -43,3 +45,11 @@ def matrix_3x3() -> Matrix3x3:
 @fixture
 def matrix_3x3_1() -> Matrix3x3:
     return Matrix3x3.from_iterable([1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+
+@fixture(params=[False, True], ids=["python", "numpy"])
+def use_numpy(request, monkeypatch) -> bool:
+    if request.param:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(backend, "use_numpy", request.param)
+    return request.param
@@ -0,0 +1,94 @@
+import asyncio
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from matrix import TransformChain, aio
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.fixture
+def pixels() -> array:
+    return array("d", [float(idx % 7) / 3 for idx in range(3 * 100)])
+
+
+def test_transform_many_async(use_numpy, matrix_3x3, pixels):
+    result = asyncio.run(aio.transform_many_async(matrix_3x3, pixels, chunk_size=16))
+
+    assert result == matrix_3x3.transform_many(pixels)
+
+
+def test_transform_many_async_list(matrix_3x3, pixels):
+    result = asyncio.run(aio.transform_many_async(matrix_3x3, list(pixels)))
+
+    assert result == matrix_3x3.transform_many(pixels)
+
+
+def test_transform_many_async_ndarray(matrix_3x3, pixels):
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array(pixels).reshape(-1, 3)
+
+    result = asyncio.run(aio.transform_many_async(matrix_3x3, values, chunk_size=9))
+
+    assert result.shape == (100, 3)
+    assert result.ravel().tolist() == list(matrix_3x3.transform_many(pixels))
+
+
+def test_transform_chunks(matrix_3x3, matrix_3x3_1, pixels):
+    chain = TransformChain([matrix_3x3, matrix_3x3_1])
+
+    async def collect():
+        return [chunk async for chunk in aio.transform_chunks(chain, pixels, 40)]
+
+    chunks = asyncio.run(collect())
+
+    assert [len(chunk) for chunk in chunks] == [120, 120, 60]
+    assert array("d", b"".join(chunks)) == chain.transform_many(pixels)
+
+
+def test_transform_chunks_bad_length(matrix_3x3):
+    async def collect():
+        return [chunk async for chunk in aio.transform_chunks(matrix_3x3, [1.0])]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+def test_transform_chunks_backpressure(matrix_3x3, pixels):
+    async def consume_one(executor):
+        chunks = aio.transform_chunks(matrix_3x3, pixels, 10, executor)
+        await chunks.__anext__()
+        await asyncio.sleep(0.01)
+        await chunks.aclose()
+
+    with CountingExecutor() as executor:
+        asyncio.run(consume_one(executor))
+
+    assert executor.submitted == 1
+
+
+def test_transform_many_async_cancel(matrix_3x3, pixels):
+    async def cancel(executor):
+        task = asyncio.create_task(
+            aio.transform_many_async(matrix_3x3, pixels, 1, executor)
+        )
+        while not executor.submitted:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with CountingExecutor() as executor:
+        asyncio.run(cancel(executor))
+
+    assert executor.submitted < 100
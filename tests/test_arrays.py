@@ -0,0 +1,241 @@
+from array import array
+
+import pytest
+
+from matrix import Matrix3x1, Matrix3x3, Matrix3x3Array, Vector3Array
+
+
+@pytest.fixture
+def matrices(matrix_3x3, matrix_3x3_1) -> list[Matrix3x3]:
+    return [matrix_3x3, matrix_3x3_1, Matrix3x3.identity()]
+
+
+@pytest.fixture
+def vectors() -> list[Matrix3x1]:
+    return [
+        Matrix3x1.from_iterable([1, 2, 3]),
+        Matrix3x1.from_iterable([0.5, 0.25, 0.125]),
+        Matrix3x1.from_iterable([-1, 0, 1]),
+    ]
+
+
+def test_array_empty():
+    a = Matrix3x3Array(2)
+
+    assert len(a) == 2
+    assert a[0] == Matrix3x3()
+
+
+def test_array_no_matrices(use_numpy):
+    a = Matrix3x3Array.from_matrices([])
+    v = Vector3Array.from_flat([])
+
+    assert len(a * a) == 0
+    assert len(a * v) == 0
+    assert len(a + a) == 0
+    assert len(a.lerp(a, 0.5)) == 0
+    assert len(a.inverse()) == 0
+    assert len(a.inverse(tol=1e-12)) == 0
+    assert len(a.determinant()) == 0
+    assert len(a.is_singular()) == 0
+
+
+def test_array_from_matrices(matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+
+    assert len(a) == 3
+    assert list(a) == matrices
+    assert a[1] == matrices[1]
+    assert a[-1] == matrices[-1]
+
+
+def test_array_component(matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+
+    assert list(a.component(1)) == [2.0, 2.0, 0.0]
+
+
+def test_array_index_error(matrices):
+    with pytest.raises(IndexError):
+        Matrix3x3Array.from_matrices(matrices)[3]
+
+
+def test_array_multiply_matrices(use_numpy, matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+    b = Matrix3x3Array.from_matrices(reversed(matrices))
+
+    result = a * b
+
+    assert isinstance(result, Matrix3x3Array)
+    assert list(result) == [x * y for x, y in zip(matrices, reversed(matrices))]
+
+
+def test_array_multiply_vectors(use_numpy, matrices, vectors):
+    result = Matrix3x3Array.from_matrices(matrices) * Vector3Array.from_matrices(
+        vectors
+    )
+
+    assert isinstance(result, Vector3Array)
+    assert list(result) == [m * v for m, v in zip(matrices, vectors)]
+
+
+def test_array_multiply_scalar(matrices):
+    result = Matrix3x3Array.from_matrices(matrices) * 2
+
+    assert list(result) == [m * 2 for m in matrices]
+
+
+def test_array_multiply_reflected(matrices, vectors):
+    a = Matrix3x3Array.from_matrices(matrices)
+    v = Vector3Array.from_matrices(vectors)
+
+    assert 2 * a == a * 2
+    assert 0.5 * v == v * 0.5
+    with pytest.raises(TypeError):
+        "a" * a
+
+
+def test_array_multiply_numpy_scalar(matrices):
+    np = pytest.importorskip("numpy")
+    a = Matrix3x3Array.from_matrices(matrices)
+
+    result = np.float64(2.0) * a
+
+    assert isinstance(result, Matrix3x3Array)
+    assert result == a * 2
+
+
+def test_array_multiply_length_mismatch(matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+
+    with pytest.raises(ValueError):
+        a * Matrix3x3Array(1)
+
+
+def test_array_multiply_bad(matrices):
+    with pytest.raises(TypeError):
+        Matrix3x3Array.from_matrices(matrices) * "a"
+
+
+def test_array_add_sub_neg(use_numpy, matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+    b = Matrix3x3Array.from_matrices(reversed(matrices))
+
+    assert list(a + b) == [x + y for x, y in zip(matrices, reversed(matrices))]
+    assert list(a - b) == [x - y for x, y in zip(matrices, reversed(matrices))]
+    assert list(-a) == [-m for m in matrices]
+
+
+def test_array_hadamard(use_numpy, matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+    b = Matrix3x3Array.from_matrices(reversed(matrices))
+
+    result = a.hadamard(b)
+
+    assert list(result) == [x.hadamard(y) for x, y in zip(matrices, reversed(matrices))]
+
+
+def test_array_axpy(use_numpy, matrices):
+    a = Matrix3x3Array.from_matrices(matrices)
+    b = Matrix3x3Array.from_matrices(reversed(matrices))
+
+    assert list(a.axpy(0.5, b)) == [
+        x.axpy(0.5, y) for x, y in zip(matrices, reversed(matrices))
+    ]
+    assert list(a.axpy([1, 2, 3], b)) == [
+        x.axpy(w, y) for w, x, y in zip([1, 2, 3], matrices, reversed(matrices))
+    ]
+
+
+def test_array_lerp(use_numpy, vectors):
+    a = Vector3Array.from_matrices(vectors)
+    b = Vector3Array.from_matrices(reversed(vectors))
+
+    assert list(a.lerp(b, 0.0)) == vectors
+    assert list(a.lerp(b, [0.25, 0.5, 1.0])) == [
+        x.lerp(y, t) for t, x, y in zip([0.25, 0.5, 1.0], vectors, reversed(vectors))
+    ]
+
+
+def test_array_elementwise_bad(matrices, vectors):
+    a = Matrix3x3Array.from_matrices(matrices)
+
+    with pytest.raises(TypeError):
+        a + Vector3Array.from_matrices(vectors)
+    with pytest.raises(TypeError):
+        a.hadamard(matrices[0])
+    with pytest.raises(ValueError):
+        a.axpy(2.0, Matrix3x3Array(1))
+    with pytest.raises(ValueError):
+        a.lerp(a, [0.5])
+
+
+def test_array_transpose(matrices):
+    result = Matrix3x3Array.from_matrices(matrices).transpose()
+
+    assert list(result) == [m.transpose() for m in matrices]
+
+
+def test_array_determinant(use_numpy, matrices):
+    dets = Matrix3x3Array.from_matrices(matrices).determinant()
+
+    assert isinstance(dets, array)
+    assert list(dets) == [-16.0, 0.0, 1.0]
+
+
+def test_array_inverse(use_numpy, matrix_3x3):
+    matrices = [matrix_3x3, Matrix3x3.identity(), matrix_3x3 * 2]
+
+    result = Matrix3x3Array.from_matrices(matrices).inverse()
+
+    for inverse, m in zip(result, matrices):
+        for row, expected in zip(inverse.data, m.inverse().data):
+            assert row == pytest.approx(expected)
+
+
+def test_array_inverse_singular(use_numpy, matrices):
+    with pytest.raises(ValueError):
+        Matrix3x3Array.from_matrices(matrices).inverse()
+
+
+def test_array_condition_number(use_numpy, matrices):
+    singular = Matrix3x3.from_iterable((1, 2, 3, 0, 2, 2, 1, 4, 5))
+    a = Matrix3x3Array.from_matrices([*matrices, singular])
+
+    result = a.condition_number()
+
+    assert isinstance(result, array)
+    assert list(result) == pytest.approx(
+        [m.condition_number() for m in matrices] + [float("inf")]
+    )
+    assert a.is_singular() == [False, True, False, True]
+    assert a.is_singular(tol=0) == [False, True, False, True]
+
+
+def test_array_inverse_nearly_singular(use_numpy, matrix_3x3):
+    nearly = Matrix3x3.from_iterable((1, 0, 0, 0, 1, 0, 0, 0, 1e-14))
+    a = Matrix3x3Array.from_matrices([matrix_3x3, nearly])
+
+    assert list(a.inverse()) == [matrix_3x3.inverse(), nearly.inverse()]
+    with pytest.raises(ValueError):
+        a.inverse(tol=1e-12)
+    assert len(a.inverse(tol=1e-15)) == 2
+    assert len(a.inverse(tol=0)) == 2
+
+
+def test_vector_array_flat(vectors):
+    flat = [1.0, 2.0, 3.0, 0.5, 0.25, 0.125, -1.0, 0.0, 1.0]
+
+    a = Vector3Array.from_flat(flat)
+
+    assert a == Vector3Array.from_matrices(vectors)
+    assert list(a.to_flat()) == flat
+
+
+def test_array_numpy(matrices):
+    np = pytest.importorskip("numpy")
+
+    a = np.asarray(Matrix3x3Array.from_matrices(matrices))
+
+    assert a.shape == (3, 3, 3)
+    assert a[0].tolist() == np.asarray(matrices[0]).tolist()
@@ -0,0 +1,89 @@
+import pytest
+
+from matrix import Matrix2x2, Matrix3x1, Matrix3x3, Matrix3x3Mut, cache
+from matrix.cache import MatrixCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.cache_clear()
+    yield
+    cache.set_maxsize(cache.DEFAULT_MAXSIZE)
+    cache.cache_clear()
+
+
+def test_cache_inverse(matrix_3x3):
+    first = cache.inverse(matrix_3x3)
+    second = cache.inverse(Matrix3x3.from_iterable(matrix_3x3.data))
+
+    assert first is second
+    assert first == matrix_3x3.inverse()
+    assert cache.cache_info() == (1, 1, cache.DEFAULT_MAXSIZE, 1)
+
+
+def test_cache_mutable(matrix_3x3):
+    m = Matrix3x3Mut.from_iterable(matrix_3x3.data)
+    first = cache.inverse(m)
+
+    m *= 2
+    assert cache.inverse(m) == first * 0.5
+    assert cache.inverse(Matrix3x3Mut.from_iterable(matrix_3x3.data)) is first
+    assert cache.cache_info().misses == 2
+
+
+def test_cache_operations(matrix_2x2, matrix_3x3):
+    assert cache.determinant(matrix_2x2) == matrix_2x2.determinant()
+    assert cache.transpose(matrix_2x2) == matrix_2x2.transpose()
+    assert cache.adjoint(matrix_3x3) == matrix_3x3.adjoint()
+    assert cache.cache_info().misses == 3
+
+
+def test_cache_lu(matrix_3x3):
+    lu = cache.lu(matrix_3x3)
+    b = Matrix3x1.from_iterable([1, 2, 3])
+
+    assert cache.lu(Matrix3x3.from_iterable(matrix_3x3.data)) is lu
+    assert lu.solve(b).data == pytest.approx(matrix_3x3.solve(b).data)
+
+
+def test_cache_keyed_by_type():
+    data = [1.0, 2.0, 3.0, 4.0]
+    cache.transpose(Matrix2x2.from_iterable(data))
+
+    class Other(Matrix2x2):
+        __slots__ = ()
+
+    assert isinstance(cache.transpose(Other.from_iterable(data)), Matrix2x2)
+    assert cache.cache_info().misses == 2
+
+
+def test_cache_inverse_singular():
+    m = Matrix2x2.from_iterable([1.0, 1.0, 2.0, 2.0])
+
+    with pytest.raises(ValueError):
+        cache.inverse(m)
+
+    assert cache.cache_info().currsize == 0
+
+
+def test_cache_evicts_least_recently_used(matrix_2x2):
+    c = MatrixCache(maxsize=2)
+    a, b = matrix_2x2, matrix_2x2 * 2
+
+    c.transpose(a)
+    c.transpose(b)
+    c.transpose(a)
+    c.transpose(Matrix2x2.identity())
+    c.transpose(a)
+    c.transpose(b)
+
+    assert c.info() == (2, 4, 2, 2)
+
+
+def test_cache_set_maxsize(matrix_2x2, matrix_3x3):
+    cache.transpose(matrix_2x2)
+    cache.transpose(matrix_3x3)
+
+    cache.set_maxsize(1)
+
+    assert cache.cache_info().currsize == 1
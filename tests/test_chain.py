@@ -0,0 +1,62 @@
+import pytest
+
+from matrix import Matrix3x1, Matrix3x3, TransformChain
+from matrix.chain import compose
+
+
+def test_chain_empty_is_identity():
+    chain = TransformChain()
+
+    assert len(chain) == 0
+    assert chain.matrix == Matrix3x3.identity()
+
+
+def test_chain_matrix(matrix_3x3, matrix_3x3_1):
+    chain = TransformChain([matrix_3x3, matrix_3x3_1])
+
+    assert chain.matrix == matrix_3x3_1 * matrix_3x3
+
+
+def test_chain_append_invalidates(matrix_3x3, matrix_3x3_1):
+    chain = TransformChain([matrix_3x3])
+    assert chain.matrix == matrix_3x3
+
+    chain.append(matrix_3x3_1)
+    assert chain.matrix == matrix_3x3_1 * matrix_3x3
+
+
+def test_chain_append_bad(matrix_2x2):
+    with pytest.raises(TypeError):
+        TransformChain().append(matrix_2x2)
+
+
+def test_chain_transform(matrix_3x3, matrix_3x3_1, matrix_3x1):
+    chain = TransformChain([matrix_3x3, matrix_3x3_1])
+
+    expected = matrix_3x3_1 * (matrix_3x3 * matrix_3x1)
+    assert chain.transform(matrix_3x1) == expected
+    assert chain * matrix_3x1 == expected
+
+
+def test_chain_multiply_bad(matrix_3x3):
+    with pytest.raises(TypeError):
+        TransformChain([matrix_3x3]) * 2
+
+
+def test_chain_transform_many(matrix_3x3, matrix_3x3_1):
+    chain = TransformChain([matrix_3x3, matrix_3x3_1])
+
+    result = chain.transform_many([1.0, 2.0, 3.0])
+
+    expected = chain * Matrix3x1.from_iterable([1.0, 2.0, 3.0])
+    assert tuple(result) == pytest.approx(expected.data)
+
+
+def test_compose_memoized(matrix_3x3, matrix_3x3_1):
+    first = compose(matrix_3x3, matrix_3x3_1)
+    second = compose(
+        Matrix3x3.from_iterable(matrix_3x3.data),
+        Matrix3x3.from_iterable(matrix_3x3_1.data),
+    )
+
+    assert first is second
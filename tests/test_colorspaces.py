@@ -0,0 +1,132 @@
+import pytest
+
+from matrix import Matrix3x1, Matrix3x3, colorspaces
+from matrix.colorspaces import ColorSpace, ColorSpaceRegistry
+
+SRGB_TO_XYZ = (
+    (0.4124, 0.3576, 0.1805),
+    (0.2126, 0.7152, 0.0722),
+    (0.0193, 0.1192, 0.9505),
+)
+
+BRADFORD_D65_TO_D50 = (
+    (1.0479, 0.0229, -0.0502),
+    (0.0296, 0.9904, -0.0171),
+    (-0.0092, 0.0151, 0.7519),
+)
+
+
+def assert_close(m: Matrix3x3, expected: tuple, abs: float = 1e-4):
+    assert m.data == tuple(pytest.approx(row, abs=abs) for row in expected)
+
+
+def test_colorspaces_to_xyz():
+    assert_close(colorspaces.to_xyz("srgb"), SRGB_TO_XYZ)
+
+
+def test_colorspaces_white_maps_to_white_point():
+    white = Matrix3x1((1.0, 1.0, 1.0))
+    for name in colorspaces.names():
+        space = colorspaces._registry.space(name)
+        xyz = colorspaces.to_xyz(name) * white
+
+        expected = colorspaces._registry.white_point(space.white)
+        assert xyz.data == pytest.approx(expected.data)
+
+
+def test_colorspaces_from_xyz_is_inverse():
+    m = colorspaces.from_xyz("rec2020") * colorspaces.to_xyz("rec2020")
+
+    assert_close(m, Matrix3x3.identity().data, abs=1e-12)
+
+
+def test_colorspaces_adaptation():
+    assert_close(colorspaces.adaptation("D65", "D50"), BRADFORD_D65_TO_D50)
+
+
+def test_colorspaces_adaptation_maps_white():
+    m = colorspaces.adaptation("D65", "D50", "cat02")
+    d65 = colorspaces._registry.white_point("D65")
+    d50 = colorspaces._registry.white_point("D50")
+
+    assert (m * d65).data == pytest.approx(d50.data)
+
+
+def test_colorspaces_conversion_fused():
+    expected = (
+        colorspaces.from_xyz("prophoto")
+        * colorspaces.adaptation("D65", "D50")
+        * colorspaces.to_xyz("srgb")
+    )
+
+    assert_close(colorspaces.conversion("srgb", "prophoto"), expected.data, 1e-12)
+
+
+def test_colorspaces_conversion_without_adaptation():
+    expected = colorspaces.from_xyz("prophoto") * colorspaces.to_xyz("srgb")
+
+    m = colorspaces.conversion("srgb", "prophoto", adaptation=None)
+    assert_close(m, expected.data, 1e-12)
+
+
+def test_colorspaces_conversion_same_white():
+    m = colorspaces.conversion("srgb", "display-p3")
+
+    # sRGB white stays white and the red and green primaries are inside P3
+    white = m * Matrix3x1((1.0, 1.0, 1.0))
+    assert white.data == pytest.approx((1.0, 1.0, 1.0))
+    assert m[0][2] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_colorspaces_conversion_round_trip():
+    m = colorspaces.conversion("display-p3", "rec2020") * colorspaces.conversion(
+        "rec2020", "display-p3"
+    )
+
+    assert_close(m, Matrix3x3.identity().data, abs=1e-12)
+
+
+def test_colorspaces_memoized():
+    first = colorspaces.conversion("srgb", "rec2020", "cat02")
+
+    assert colorspaces.conversion("srgb", "rec2020", "cat02") is first
+    assert colorspaces.to_xyz("srgb") is colorspaces.to_xyz("srgb")
+
+
+def test_colorspaces_unknown():
+    with pytest.raises(ValueError):
+        colorspaces.conversion("srgb", "adobe-rgb")
+    with pytest.raises(ValueError):
+        colorspaces.adaptation("D65", "D50", "von-kries")
+    with pytest.raises(ValueError):
+        colorspaces.adaptation("D65", "A")
+
+
+@pytest.mark.parametrize("target", ["display-p3", "prophoto"])
+def test_colorspaces_conversion_unknown_adaptation(target):
+    with pytest.raises(ValueError, match="von-kries"):
+        colorspaces.conversion("srgb", target, "von-kries")
+
+
+def test_colorspaces_registry_register():
+    registry = ColorSpaceRegistry()
+    registry.register_white_point("D65", colorspaces.WHITE_POINTS["D65"])
+    registry.register(colorspaces.COLOR_SPACES[0])
+    first = registry.to_xyz("srgb")
+
+    registry.register(
+        ColorSpace("srgb", (0.64, 0.33), (0.21, 0.71), (0.15, 0.06), "D65")
+    )
+
+    assert "srgb" in registry
+    assert registry.names == ("srgb",)
+    assert registry.to_xyz("srgb") != first
+
+
+def test_colorspaces_registry_register_bad():
+    registry = ColorSpaceRegistry()
+
+    with pytest.raises(ValueError):
+        registry.register(colorspaces.COLOR_SPACES[0])
+    with pytest.raises(TypeError):
+        registry.register_adaptation("bad", Matrix3x1())
@@ -0,0 +1,147 @@
+import random
+from array import array
+
+import pytest
+
+from matrix import Matrix3x3
+from matrix.fixed import FixedMatrix3x3
+
+RGB_TO_XYZ = [0.4124, 0.3576, 0.1805, 0.2126, 0.7152, 0.0722, 0.0193, 0.1192, 0.9505]
+
+
+@pytest.fixture(params=[RGB_TO_XYZ, [1.5, -0.4, 0.1, -0.2, 1.2, 0.3, 0.05, -0.6, 1.7]])
+def matrix(request) -> Matrix3x3:
+    return Matrix3x3.from_iterable(request.param)
+
+
+def pixels(bits: int, count: int = 2000) -> array:
+    rng = random.Random(bits)
+    maximum = (1 << bits) - 1
+    values = [rng.randint(0, maximum) for _ in range(3 * count)]
+    values[:6] = [0, 0, 0, maximum, maximum, maximum]
+    return array("B" if bits <= 8 else "H", values)
+
+
+def rounded(matrix: Matrix3x3, values: array, bits: int) -> list[int]:
+    maximum = (1 << bits) - 1
+    return [
+        min(max(round(value), 0), maximum)
+        for value in matrix.transform_many(array("d", values))
+    ]
+
+
+@pytest.mark.parametrize("bits", [8, 10, 16])
+def test_fixed_within_1_lsb(use_numpy, matrix, bits):
+    values = pixels(bits)
+    fixed = matrix.quantize(bits)
+
+    result = fixed.transform_many(values)
+
+    assert result.typecode == fixed.typecode
+    expected = rounded(matrix, values, bits)
+    assert max(abs(a - b) for a, b in zip(result, expected)) <= 1
+
+
+def test_fixed_backends_agree(monkeypatch, matrix):
+    from matrix import backend
+
+    pytest.importorskip("numpy")
+    values = pixels(8)
+    fixed = matrix.quantize(8)
+
+    with_numpy = fixed.transform_many(values)
+    monkeypatch.setattr(backend, "use_numpy", False)
+    assert fixed.transform_many(values) == with_numpy
+
+
+def test_fixed_clamp(use_numpy):
+    fixed = Matrix3x3.from_iterable([2, 0, 0, 0, -1, 0, 0, 0, 1]).quantize()
+
+    assert list(fixed.transform_many(bytes([200, 10, 7]))) == [255, 0, 7]
+    assert fixed.transform((200, 10, 7)) == (255, 0, 7)
+
+
+@pytest.mark.parametrize("bits", [8, 16])
+def test_fixed_empty(use_numpy, bits):
+    fixed = Matrix3x3.from_iterable(RGB_TO_XYZ).quantize(bits)
+
+    assert len(fixed.transform_many(array(fixed.typecode))) == 0
+
+
+def test_fixed_buffer_format(use_numpy):
+    identity = Matrix3x3.identity()
+
+    result = identity.quantize(8).transform_many(array("H", [10, 20, 30]))
+    assert list(result) == [10, 20, 30]
+
+    result = identity.quantize(16).transform_many(bytes([10, 20, 30, 40, 50, 60]))
+    assert list(result) == [10, 20, 30, 40, 50, 60]
+
+
+@pytest.mark.parametrize(
+    "bits, values",
+    [(8, [-1, 0, 0]), (8, array("H", [256, 0, 0])), (10, [1024, 0, 0])],
+)
+def test_fixed_out_of_range(use_numpy, bits, values):
+    fixed = Matrix3x3.identity().quantize(bits)
+
+    with pytest.raises(ValueError):
+        fixed.transform_many(values)
+
+
+def test_fixed_transform(matrix):
+    fixed = matrix.quantize(16)
+    values = pixels(16, 10)
+
+    expected = list(fixed.transform_many(values))
+    values = iter(values)
+    result = [
+        value
+        for pixel in zip(values, values, values)
+        for value in fixed.transform(pixel)
+    ]
+    assert result == expected
+
+
+def test_fixed_list(use_numpy, matrix):
+    values = pixels(8, 10)
+    fixed = matrix.quantize()
+
+    assert fixed.transform_many(list(values)) == fixed.transform_many(values)
+
+
+def test_fixed_ndarray(matrix):
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array(pixels(8, 10), dtype=numpy.uint8).reshape(-1, 3)
+    fixed = matrix.quantize()
+
+    result = fixed.transform_many(values)
+
+    assert result.dtype == numpy.uint8
+    assert result.shape == (10, 3)
+    assert result.ravel().tolist() == list(
+        fixed.transform_many(values.ravel().tolist())
+    )
+
+
+def test_fixed_matrix(matrix):
+    fixed = FixedMatrix3x3(matrix, bits=8, shift=12)
+
+    assert fixed.shift == 12
+    assert all(abs(a - b) <= 2**-13 for a, b in zip(fixed.matrix._flat, matrix._flat))
+
+
+def test_fixed_equality(matrix):
+    assert matrix.quantize(8) == matrix.quantize(8)
+    assert hash(matrix.quantize(8)) == hash(matrix.quantize(8))
+    assert matrix.quantize(8) != matrix.quantize(16)
+
+
+def test_fixed_bad_bits(matrix):
+    with pytest.raises(ValueError):
+        matrix.quantize(17)
+
+
+def test_fixed_bad_length(use_numpy, matrix):
+    with pytest.raises(ValueError):
+        matrix.quantize().transform_many(bytes(4))
@@ -0,0 +1,98 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+import matrix
+
+# Microseconds spent importing the matrix modules for each statement. These
+# are loose limits, several times the time on a slow machine, to catch
+# eager imports without making the tests flaky; benchmarks/bench_import.py
+# measures the actual times
+IMPORT_BUDGET = {
+    "import matrix": 50000,
+    "from matrix import Matrix3x3": 250000,
+}
+
+# Modules which must only be imported when they are used
+HEAVY_MODULES = (
+    "typing",
+    "typing_extensions",
+    "inspect",
+    "numpy",
+    "timeit",
+    "concurrent.futures",
+    "matrix.lu",
+    "matrix.parallel",
+)
+
+SCRIPT = """
+import json, sys
+{statement}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def run(statement: str) -> list[str]:
+    process = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(process.stdout)
+
+
+def import_time(statement: str) -> int:
+    """Microseconds spent in the matrix modules themselves, from -X importtime"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, _, name = line.removeprefix("import time:").split("|")
+        if name.strip().split(".")[0] == "matrix":
+            total += int(own)
+    return total
+
+
+@pytest.mark.parametrize("statement", IMPORT_BUDGET)
+def test_import_budget(statement):
+    elapsed = min(import_time(statement) for _ in range(3))
+
+    assert 0 < elapsed < IMPORT_BUDGET[statement]
+
+
+@pytest.mark.parametrize("statement", IMPORT_BUDGET)
+def test_import_heavy_modules(statement):
+    modules = run(statement)
+
+    assert not set(HEAVY_MODULES) & set(modules)
+
+
+def test_import_lazy():
+    modules = run("import matrix")
+
+    assert "matrix" in modules
+    assert not [name for name in modules if name.startswith("matrix.")]
+
+
+def test_import_exports():
+    for name in matrix.__all__:
+        assert getattr(matrix, name).__name__ == name
+    assert set(matrix.__all__) <= set(dir(matrix))
+
+
+def test_import_submodule():
+    assert matrix.colorspaces.conversion("srgb", "srgb") is not None
+
+
+def test_import_unknown():
+    with pytest.raises(AttributeError):
+        matrix.Matrix4x4
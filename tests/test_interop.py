@@ -0,0 +1,76 @@
+from array import array
+
+import pytest
+
+from matrix import Matrix1x3, Matrix2x2, Matrix3x1, Matrix3x3
+
+
+def test_from_array_memoryview():
+    data = array("d", [1, 2, 3, 4])
+
+    m = Matrix2x2.from_array(memoryview(data))
+
+    assert m.data == ((1.0, 2.0), (3.0, 4.0))
+
+
+def test_from_array_array():
+    m = Matrix3x1.from_array(array("f", [0.5, 1.5, 2.5]))
+
+    assert m.data == (0.5, 1.5, 2.5)
+
+
+def test_from_array_bad_length():
+    with pytest.raises(ValueError):
+        Matrix3x3.from_array(array("d", [1, 2, 3]))
+
+
+def test_numpy_asarray(matrix_3x3_1):
+    np = pytest.importorskip("numpy")
+
+    a = np.asarray(matrix_3x3_1)
+
+    assert a.shape == (3, 3)
+    assert a.dtype == np.float64
+    assert a.tolist() == [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+
+def test_numpy_asarray_vector(matrix_1x3):
+    np = pytest.importorskip("numpy")
+
+    a = np.asarray(matrix_1x3, dtype=np.float32)
+
+    assert a.shape == (1, 3)
+    assert a.dtype == np.float32
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32", "int64"])
+def test_numpy_scalar_multiply(dtype, matrix_3x3_1):
+    np = pytest.importorskip("numpy")
+
+    m = np.dtype(dtype).type(2) * matrix_3x3_1
+
+    assert type(m) is Matrix3x3
+    assert m == matrix_3x3_1 * 2
+
+
+def test_numpy_array_multiply(matrix_3x3_1):
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(TypeError):
+        np.ones((3, 3)) * matrix_3x3_1
+
+
+def test_numpy_from_array():
+    np = pytest.importorskip("numpy")
+    a = np.arange(9, dtype=np.float64).reshape(3, 3)
+
+    assert Matrix3x3.from_array(a) == Matrix3x3.from_iterable(list(range(9)))
+    assert Matrix3x3.from_array(a.T) == Matrix3x3.from_iterable(a.T.ravel().tolist())
+
+
+def test_numpy_from_array_vector():
+    np = pytest.importorskip("numpy")
+
+    m = Matrix1x3.from_array(np.array([[1.0], [2.0], [3.0]]))
+
+    assert m.data == (1.0, 2.0, 3.0)
@@ -0,0 +1,176 @@
+import json
+
+import pytest
+
+from matrix import kernels
+
+
+@pytest.fixture
+def kernel_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(kernels, "_selected", {})
+    kernels.set_cache_dir(tmp_path)
+    yield tmp_path
+    kernels.set_cache_dir(None)
+
+
+@pytest.fixture
+def variants(monkeypatch):
+    monkeypatch.setattr(kernels, "_variants", {})
+    monkeypatch.setattr(kernels, "_selected", {})
+    monkeypatch.setattr(kernels, "SELECT_NUMBER", 10)
+    monkeypatch.setattr(kernels, "_select_fastest", True)
+    kernels.multiply.cache_clear()
+    yield
+    kernels.multiply.cache_clear()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4])
+def test_determinant_unrolled(size):
+    a = kernels._sample(size * size)
+    assert kernels.determinant(size)(a) == pytest.approx(
+        kernels._determinant_loop(a, size)
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4])
+def test_inverse_unrolled(size):
+    a = kernels._sample(size * size)
+    assert kernels.inverse(size)(a) == pytest.approx(kernels._inverse_loop(a, size))
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5])
+def test_inverse_condition(size):
+    a = kernels._sample(size * size)
+    norm = kernels.norm1(size, size)
+
+    inverse, condition = kernels.inverse_condition(size)(a)
+
+    assert inverse == pytest.approx(kernels._inverse_loop(a, size))
+    assert condition == pytest.approx(norm(a) * norm(inverse))
+
+
+@pytest.mark.parametrize("size", [2, 3, 4, 5])
+def test_inverse_singular(size):
+    with pytest.raises(ValueError):
+        kernels.inverse(size)((1.0,) * (size * size))
+
+
+def test_multiply_unrolled():
+    a = kernels._sample(12)
+    b = kernels._sample(8)
+    assert kernels.multiply(3, 4, 2)(a, b) == pytest.approx(
+        kernels._multiply_loop(4, 2)(a, b)
+    )
+
+
+@pytest.mark.parametrize("count", [3, 9, 25])
+def test_axpy_lerp(count):
+    a = kernels._sample(count)
+    b = tuple(reversed(a))
+
+    assert kernels.axpy(count)(2.0, a, b) == pytest.approx(
+        [2.0 * x + y for x, y in zip(a, b)]
+    )
+    assert kernels.lerp(count)(a, b, 0.25) == pytest.approx(
+        [x + 0.25 * (y - x) for x, y in zip(a, b)]
+    )
+
+
+@pytest.mark.parametrize("rows, columns", [(1, 1), (3, 1), (3, 3), (5, 5)])
+def test_norm1(rows, columns):
+    a = tuple(
+        value * (-1) ** idx for idx, value in enumerate(kernels._sample(rows * columns))
+    )
+
+    expected = max(
+        sum(abs(value) for value in a[column::columns]) for column in range(columns)
+    )
+    assert kernels.norm1(rows, columns)(a) == pytest.approx(expected)
+
+
+def test_variant_generated_by_default(variants, monkeypatch):
+    def fast(a, b):
+        return a
+
+    monkeypatch.setattr(kernels, "_select_fastest", False)
+    kernels.register_variant("multiply", (2, 2, 2), "fast", fast)
+
+    assert kernels.multiply(2, 2, 2) is not fast
+    assert kernels.selected() == {}
+
+    kernels.set_select_fastest(True)
+    assert kernels.multiply(2, 2, 2) is fast
+
+
+@pytest.mark.skipif(kernels._select_fastest, reason="variants selected by timing")
+def test_variant_generated_multiply_3x3():
+    from matrix.matrix3x import _laderman_3x3, _multiply_3x3
+
+    assert _multiply_3x3 is not _laderman_3x3
+
+
+def test_variant_fastest_selected(variants):
+    def slow(a, b):
+        for _ in range(1000):
+            pass
+        return kernels._multiply_loop(2, 2)(a, b)
+
+    kernels.register_variant("multiply", (2, 2, 2), "slow", slow)
+    kernel = kernels.multiply(2, 2, 2)
+
+    assert kernel is not slow
+    assert kernels.selected() == {"multiply2x2x2": "generated"}
+
+
+def test_variant_register_reselects(variants):
+    def fast(a, b):
+        return a
+
+    kernels.multiply(2, 2, 2)
+    kernels.register_variant("multiply", (2, 2, 2), "fast", fast)
+
+    assert kernels.multiply(2, 2, 2) is fast
+    assert kernels.selected() == {"multiply2x2x2": "fast"}
+
+
+def test_variant_laderman_matches():
+    from matrix.matrix3x import _laderman_3x3
+
+    a = kernels._sample(9)
+    b = kernels._sample(9)[::-1]
+    assert _laderman_3x3(a, b) == pytest.approx(kernels.multiply(3, 3, 3)(a, b))
+
+
+def test_cache_code(kernel_cache):
+    source = "def kernel(a):\n    return a + 1\n"
+    assert kernels.compile_kernel("kernel", source)(1) == 2
+    assert len(list(kernel_cache.glob("kernel-*.bin"))) == 1
+
+    assert kernels.compile_kernel("kernel", source)(2) == 3
+
+
+def test_cache_code_corrupt(kernel_cache):
+    source = "def kernel(a):\n    return a + 1\n"
+    kernels.compile_kernel("kernel", source)
+    for path in kernel_cache.glob("kernel-*.bin"):
+        path.write_bytes(b"corrupt")
+
+    assert kernels.compile_kernel("kernel", source)(1) == 2
+
+
+def test_cache_selected(kernel_cache, variants):
+    def fast(a, b):
+        return a
+
+    kernels.register_variant("multiply", (2, 2, 2), "fast", fast)
+    kernels.multiply(2, 2, 2)
+    (path,) = kernel_cache.glob("selected.*.json")
+    assert json.loads(path.read_text()) == {"multiply2x2x2": "fast"}
+
+    # A later process uses the stored choice without timing the variants
+    path.write_text(json.dumps({"multiply2x2x2": "generated"}))
+    kernels._selected.clear()
+    kernels.set_cache_dir(kernel_cache)
+    kernels.multiply.cache_clear()
+    assert kernels.multiply(2, 2, 2) is not fast
+    assert kernels.selected() == {"multiply2x2x2": "generated"}
@@ -0,0 +1,102 @@
+from array import array
+
+import pytest
+
+from matrix import Matrix, Matrix3x1, Matrix3x3
+from matrix.lu import LU
+
+
+@pytest.fixture
+def lu(matrix_3x3) -> LU:
+    return LU(matrix_3x3)
+
+
+@pytest.fixture
+def pivoted() -> Matrix3x3:
+    return Matrix3x3.from_iterable([0, 2, 1, 1, 1, 0, 3, 0, 1])
+
+
+def test_lu_factors(pivoted):
+    lu = pivoted.lu()
+    rows = pivoted.data
+
+    permuted = Matrix3x3.from_iterable([rows[pivot] for pivot in lu.pivots])
+    assert lu.pivots == (2, 0, 1)
+    assert (lu.lower * lu.upper).data == tuple(
+        pytest.approx(row) for row in permuted.data
+    )
+
+
+def test_lu_determinant(matrix_3x3, pivoted):
+    assert matrix_3x3.lu().determinant() == pytest.approx(matrix_3x3.determinant())
+    assert pivoted.lu().determinant() == pytest.approx(pivoted.determinant())
+
+
+def test_lu_solve(lu, matrix_3x3):
+    b = Matrix3x1.from_iterable([1, 2, 3])
+
+    x = lu.solve(b)
+
+    assert isinstance(x, Matrix3x1)
+    assert x.data == pytest.approx(matrix_3x3.solve(b).data)
+
+
+@pytest.mark.parametrize("size", [2, 5, 8, 10])
+def test_lu_solve_generated_size(size):
+    a = Matrix(
+        size,
+        size,
+        [(idx * 7) % 11 + (idx % (size + 1) == 0) for idx in range(size * size)],
+    )
+    b = Matrix(size, 1, range(1, size + 1))
+    lu = a.lu()
+
+    assert (a * lu.solve(b)).data == pytest.approx(b.data)
+    solved = lu.solve_many(array("d", [*b.data, *b.data]))
+    assert list(solved) == pytest.approx([*lu.solve(b).data] * 2)
+
+
+def test_lu_solve_many(use_numpy, lu, matrix_3x3):
+    vectors = [[1, 2, 3], [0.5, 0.25, 0.125], [-1, 0, 1]]
+    buffer = array("d", [value for vector in vectors for value in vector])
+
+    result = lu.solve_many(buffer)
+
+    assert isinstance(result, array)
+    expected = [
+        value
+        for vector in vectors
+        for value in matrix_3x3.solve(Matrix3x1.from_iterable(vector)).data
+    ]
+    assert list(result) == pytest.approx(expected)
+
+
+def test_lu_solve_many_ndarray(lu, matrix_3x3):
+    np = pytest.importorskip("numpy")
+    values = np.arange(12.0).reshape(4, 3)
+
+    result = lu.solve_many(values)
+
+    assert result.shape == (4, 3)
+    assert result == pytest.approx(np.linalg.solve(np.asarray(matrix_3x3), values.T).T)
+
+
+def test_lu_solve_many_empty(use_numpy, lu):
+    assert lu.solve_many(array("d")) == array("d")
+
+
+def test_lu_solve_many_length(use_numpy, lu):
+    with pytest.raises(ValueError):
+        lu.solve_many(array("d", [1, 2]))
+
+
+def test_lu_singular():
+    with pytest.raises(ValueError):
+        LU(Matrix3x3.from_iterable((1, 2, 3, 0, 2, 2, 1, 4, 5)))
+
+
+def test_lu_bad(lu, matrix_3x3):
+    with pytest.raises(TypeError):
+        LU(Matrix(3, 4))
+    with pytest.raises(TypeError):
+        lu.solve(matrix_3x3)
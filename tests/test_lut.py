@@ -0,0 +1,138 @@
+import random
+from array import array
+
+import pytest
+
+from matrix import Matrix3x1, Matrix3x3, TransformChain
+from matrix.lut import LUT3D
+
+
+def srgb_decode(x: float, y: float, z: float) -> tuple:
+    return tuple(
+        value / 12.92 if value <= 0.04045 else ((value + 0.055) / 1.055) ** 2.4
+        for value in (x, y, z)
+    )
+
+
+@pytest.fixture
+def pixels() -> array:
+    rng = random.Random(3)
+    return array("d", [rng.random() for _ in range(3 * 200)])
+
+
+@pytest.mark.parametrize("method", ["tetrahedral", "trilinear"])
+def test_lut_matrix_exact(use_numpy, method, matrix_3x3, pixels):
+    lut = LUT3D.bake(matrix_3x3, size=5)
+
+    result = lut.transform_many(pixels, method=method)
+
+    expected = matrix_3x3.transform_many(pixels)
+    assert list(result) == pytest.approx(list(expected), abs=1e-12)
+
+
+@pytest.mark.parametrize("method", ["tetrahedral", "trilinear"])
+def test_lut_callable(use_numpy, method, pixels):
+    lut = LUT3D.bake(srgb_decode, size=33)
+
+    result = lut.transform_many(pixels, method=method)
+
+    values = iter(pixels)
+    expected = [v for pixel in zip(values, values, values) for v in srgb_decode(*pixel)]
+    assert list(result) == pytest.approx(expected, abs=2e-3)
+
+
+@pytest.mark.parametrize("method", ["tetrahedral", "trilinear"])
+def test_lut_backends_agree(monkeypatch, method, pixels):
+    from matrix import backend
+
+    pytest.importorskip("numpy")
+    lut = LUT3D.bake(srgb_decode, size=9)
+
+    with_numpy = lut.transform_many(pixels, method=method)
+    monkeypatch.setattr(backend, "use_numpy", False)
+    without = lut.transform_many(pixels, method=method)
+
+    assert list(with_numpy) == pytest.approx(list(without), abs=1e-12)
+
+
+def test_lut_lookup(matrix_3x3):
+    lut = LUT3D.bake(TransformChain([matrix_3x3]), size=3)
+
+    expected = matrix_3x3 * Matrix3x1.from_iterable([0.25, 0.5, 0.75])
+    assert lut.lookup((0.25, 0.5, 0.75)) == pytest.approx(expected.data)
+
+
+def test_lut_clamps_to_domain():
+    lut = LUT3D.bake(lambda x, y, z: (x, y, z), size=3, domain=(0.0, 2.0))
+
+    assert lut.lookup((-1.0, 1.0, 5.0)) == pytest.approx((0.0, 1.0, 2.0))
+    assert lut.lookup((0.5, 1.5, 2.0), method="trilinear") == pytest.approx(
+        (0.5, 1.5, 2.0)
+    )
+
+
+@pytest.mark.parametrize("method", ["tetrahedral", "trilinear"])
+def test_lut_nan(use_numpy, method, matrix_3x3):
+    lut = LUT3D.bake(matrix_3x3, size=3)
+    nan = float("nan")
+
+    with pytest.raises(ValueError, match="NaN"):
+        lut.transform_many(array("d", [0.5, 0.5, 0.5, 0.5, nan, 0.5]), method)
+    with pytest.raises(ValueError, match="NaN"):
+        lut.lookup((0.5, 0.5, nan), method)
+
+
+def test_lut_empty(use_numpy, matrix_3x3):
+    lut = LUT3D.bake(matrix_3x3, size=3)
+
+    assert lut.transform_many(array("d")) == array("d")
+
+
+def test_lut_bytes_roundtrip(matrix_3x3):
+    lut = LUT3D.bake(matrix_3x3, size=4)
+
+    assert LUT3D.from_bytes(lut.to_bytes("d")) == lut
+    compact = LUT3D.from_bytes(lut.to_bytes())
+    assert len(lut.to_bytes()) == 24 + 4 * 3 * 4**3
+    assert list(compact.table) == pytest.approx(list(lut.table), rel=1e-6)
+
+
+def test_lut_save_load(tmp_path, use_numpy, matrix_3x3, pixels):
+    lut = LUT3D.bake(srgb_decode, size=8)
+    path = tmp_path / "decode.lut"
+    lut.save(path, dtype="d")
+
+    loaded = LUT3D.load(path)
+
+    assert isinstance(loaded.table, memoryview)
+    assert loaded == lut
+    assert loaded.transform_many(pixels) == lut.transform_many(pixels)
+
+
+@pytest.mark.parametrize(
+    "data", [b"", b"MLUT", b"XLUT" + bytes(20), LUT3D.bake(Matrix3x3()).to_bytes()[:-4]]
+)
+def test_lut_from_bytes_bad(data):
+    with pytest.raises(ValueError):
+        LUT3D.from_bytes(data)
+
+
+def test_lut_bad_method(matrix_3x3):
+    with pytest.raises(ValueError):
+        LUT3D.bake(matrix_3x3, size=2).transform_many([0.0] * 3, method="cubic")
+
+
+def test_lut_bad_size():
+    with pytest.raises(ValueError):
+        LUT3D(1, [0.0] * 3)
+
+
+@pytest.mark.parametrize("size", [0, 1, 0x10000])
+def test_lut_bake_bad_size(matrix_3x3, size):
+    with pytest.raises(ValueError):
+        LUT3D.bake(matrix_3x3, size=size)
+
+
+def test_lut_bake_bad_domain(matrix_3x3):
+    with pytest.raises(ValueError):
+        LUT3D.bake(matrix_3x3, size=3, domain=(1.0, 1.0))
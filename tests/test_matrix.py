@@ -0,0 +1,390 @@
+import copy
+import pickle
+from fractions import Fraction
+
+import pytest
+
+from matrix import (
+    Matrix,
+    Matrix1x2,
+    Matrix1x3,
+    Matrix2x1,
+    Matrix2x2,
+    Matrix3x1,
+    Matrix3x3,
+    Matrix3x3Mut,
+    base,
+    kernels,
+)
+from matrix.base import register_multiply
+from matrix.matrix3x import _multiply_3x3_scalar
+
+
+@pytest.fixture
+def matrix_3x4() -> Matrix:
+    return Matrix(3, 4, range(12))
+
+
+@pytest.fixture
+def matrix_4x4() -> Matrix:
+    return Matrix(4, 4, [2, 0, 1, 3, 1, 1, 0, 2, 0, 3, 1, 1, 4, 0, 2, 1])
+
+
+def test_matrix_pickle(matrix_3x4, matrix_4x4):
+    for m in (matrix_3x4, matrix_4x4, Matrix3x3Mut.from_flat(range(9))):
+        copied = pickle.loads(pickle.dumps(m))
+
+        assert type(copied) is type(m)
+        assert copied == m
+        assert copy.deepcopy(m) == m
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [Matrix1x2, Matrix1x3, Matrix2x1, Matrix2x2, Matrix3x1, Matrix3x3, Matrix3x3Mut],
+)
+@pytest.mark.parametrize("difference", [-1, 1])
+def test_matrix_named_bad_length(cls, difference):
+    rows, columns = cls.size
+
+    with pytest.raises(ValueError):
+        cls(range(1, rows * columns + difference + 1))
+
+
+def test_matrix_named_bad_rows():
+    with pytest.raises(ValueError):
+        Matrix3x3([[1, 2, 3], [4, 5, 6]])
+    with pytest.raises(ValueError):
+        Matrix2x2([[1, 2], [3, 4], [5, 6]])
+
+
+def test_matrix_named_size():
+    m = Matrix(3, 3, range(9))
+
+    assert type(m) is Matrix3x3
+    assert m == Matrix3x3.from_iterable(range(9))
+
+
+def test_matrix_generated_size(matrix_3x4):
+    assert type(matrix_3x4).__name__ == "Matrix3x4"
+    assert type(matrix_3x4) is Matrix.of_size(3, 4)
+    assert matrix_3x4.size == (3, 4)
+    assert matrix_3x4[1, 2] == 6.0
+    assert matrix_3x4[2] == (8.0, 9.0, 10.0, 11.0)
+
+
+def test_matrix_empty():
+    assert Matrix(2, 3).data == ((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))
+
+
+def test_matrix_nested():
+    m = Matrix(2, 3, ((1, 2, 3), (4, 5, 6)))
+
+    assert m == Matrix(2, 3, [1, 2, 3, 4, 5, 6])
+
+
+def test_matrix_wrong_length():
+    with pytest.raises(ValueError):
+        Matrix(2, 3, [1, 2, 3])
+
+
+@pytest.mark.parametrize("rows,columns", [(2, 2), (3, 1), (3, 3), (3, 4)])
+def test_matrix_from_flat(rows, columns):
+    cls = Matrix.of_size(rows, columns)
+    m = cls.from_flat(range(rows * columns))
+
+    assert type(m) is cls
+    assert m == cls.from_iterable(list(range(rows * columns)))
+    assert all(type(value) is float for value in m._flat)
+
+
+def test_matrix_from_flat_wrong_length():
+    with pytest.raises(ValueError):
+        Matrix3x3.from_flat(range(8))
+    with pytest.raises(ValueError):
+        Matrix3x1.from_flat(range(9))
+
+
+def test_matrix_from_flat_mutable():
+    m = Matrix3x3Mut.from_flat(range(9))
+
+    m[0, 0] = 10
+    assert m.data[0] == (10.0, 1.0, 2.0)
+
+
+@pytest.mark.parametrize("scalar", [2, Fraction(1, 2), True])
+def test_matrix_results_are_floats(matrix_3x4, scalar):
+    m = Matrix3x3.from_iterable(range(9))
+    v = Matrix3x1.from_iterable([1, 2, 3])
+    results = [
+        m * scalar,
+        v * scalar,
+        matrix_3x4 * scalar,
+        Matrix2x1.from_iterable([1, 2]) * scalar,
+        m * m,
+        m * v,
+        -matrix_3x4,
+    ]
+
+    for result in results:
+        assert all(type(value) is float for value in result._flat)
+
+
+def test_matrix_bad_size():
+    with pytest.raises(ValueError):
+        Matrix(0, 3)
+
+
+def test_matrix_repr():
+    assert repr(Matrix(1, 4)) == "Matrix1x4 = (0.0, 0.0, 0.0, 0.0)"
+
+
+def test_matrix_identity():
+    m = Matrix.of_size(4, 4).identity()
+
+    assert m.data[1] == (0.0, 1.0, 0.0, 0.0)
+    assert m.determinant() == 1.0
+
+
+def test_matrix_multiply(matrix_4x4, matrix_3x4):
+    m = matrix_3x4 * matrix_4x4
+
+    assert m.size == (3, 4)
+    assert m.data[0] == (13.0, 7.0, 8.0, 7.0)
+
+
+def test_matrix_multiply_named_result(matrix_3x4):
+    m = matrix_3x4 * Matrix(4, 1, [1, 0, 0, 1])
+
+    assert type(m) is Matrix3x1
+    assert m.data == (3.0, 11.0, 19.0)
+
+
+def test_matrix_multiply_scalar(matrix_3x4):
+    m = matrix_3x4 * 2
+
+    assert m.data[2] == (16.0, 18.0, 20.0, 22.0)
+
+
+@pytest.mark.parametrize("scalar", [2, 2.0, Fraction(2)])
+def test_matrix_multiply_reflected(matrix_3x4, scalar):
+    m = Matrix3x3.from_iterable(range(9))
+    v = Matrix3x1.from_iterable([1, 2, 3])
+
+    assert scalar * m == m * scalar
+    assert scalar * v == v * scalar
+    assert scalar * matrix_3x4 == matrix_3x4 * scalar
+
+
+def test_matrix_multiply_reflected_bad(matrix_3x4):
+    with pytest.raises(TypeError):
+        "a" * matrix_3x4
+    with pytest.raises(TypeError):
+        None * matrix_3x4
+
+
+def test_matrix_multiply_dispatch_cached():
+    m = Matrix3x3.identity()
+    m * 2.0
+
+    assert base._multiply_dispatch[(Matrix3x3, float)] is _multiply_3x3_scalar
+
+
+def test_matrix_multiply_dispatch_subclass():
+    m = Matrix3x3Mut.from_flat(range(9))
+    v = Matrix3x1.from_iterable([1, 2, 3])
+
+    assert type(m * 2) is Matrix3x3
+    assert m * v == Matrix3x3.from_flat(range(9)) * v
+
+
+def test_matrix_register_multiply(monkeypatch):
+    # Registered on copies, so the handler does not leak into other tests
+    monkeypatch.setattr(base, "_multiply", dict(base._multiply))
+    monkeypatch.setattr(base, "_multiply_dispatch", {})
+
+    class Matrix3x3Counting(Matrix3x3):
+        __slots__ = ()
+        calls = 0
+
+    def multiply(a, b):
+        Matrix3x3Counting.calls += 1
+        return Matrix3x3.__mul__(Matrix3x3.from_flat(a._flat), b)
+
+    v = Matrix3x1.from_iterable([1, 2, 3])
+    m = Matrix3x3Counting.from_flat(range(9))
+    m * v
+    register_multiply(Matrix3x3Counting, Matrix3x1, multiply)
+
+    assert m * v == Matrix3x3.from_flat(range(9)) * v
+    assert m * Matrix3x3.identity() == Matrix3x3.from_flat(range(9))
+    assert Matrix3x3Counting.calls == 1
+
+
+def test_matrix_multiply_bad(matrix_3x4):
+    with pytest.raises(TypeError):
+        matrix_3x4 * matrix_3x4
+
+    with pytest.raises(TypeError):
+        matrix_3x4 * "a"
+
+
+def test_matrix_multiply_loop_matches_unrolled():
+    a = tuple(float(x) for x in range(8))
+    b = tuple(float(x) for x in range(8, 24))
+
+    assert kernels.multiply(2, 4, 4)(a, b) == kernels._multiply_loop(4, 4)(a, b)
+
+
+def test_matrix_large_multiply():
+    a = Matrix(6, 6, range(36))
+
+    m = a * Matrix.of_size(6, 6).identity()
+
+    assert m == a
+
+
+def test_matrix_add_sub_neg(matrix_3x4):
+    assert (matrix_3x4 + matrix_3x4) == matrix_3x4 * 2
+    assert (matrix_3x4 - matrix_3x4) == Matrix(3, 4)
+    assert (-matrix_3x4)[1, 1] == -5.0
+
+
+def test_matrix_add_bad(matrix_3x4, matrix_4x4):
+    with pytest.raises(TypeError):
+        matrix_3x4 + matrix_4x4
+
+
+def test_matrix_hadamard(matrix_3x3, matrix_3x3_1):
+    m = matrix_3x3.hadamard(matrix_3x3_1)
+
+    assert m == Matrix3x3([[1, 4, -3], [8, 5, 12], [-7, 16, 9]])
+
+
+def test_matrix_axpy(matrix_3x3, matrix_3x3_1):
+    assert matrix_3x3.axpy(2, matrix_3x3_1) == matrix_3x3 * 2 + matrix_3x3_1
+
+
+def test_matrix_lerp(matrix_3x3, matrix_3x3_1):
+    assert matrix_3x3.lerp(matrix_3x3_1, 0) == matrix_3x3
+    assert matrix_3x3.lerp(matrix_3x3_1, 1) == matrix_3x3_1
+    assert matrix_3x3.lerp(matrix_3x3_1, 0.5) == (matrix_3x3 + matrix_3x3_1) * 0.5
+
+
+def test_matrix_elementwise_mutable(matrix_3x3):
+    m = Matrix3x3Mut(matrix_3x3.data)
+
+    assert isinstance(m.axpy(2, matrix_3x3), Matrix3x3Mut)
+    assert isinstance(-m, Matrix3x3Mut)
+
+
+def test_matrix_elementwise_bad(matrix_3x3, matrix_3x1):
+    with pytest.raises(TypeError):
+        matrix_3x3.hadamard(matrix_3x1)
+    with pytest.raises(TypeError):
+        matrix_3x3.axpy(2, 1.0)
+    with pytest.raises(TypeError):
+        matrix_3x3.lerp(matrix_3x1, 0.5)
+
+
+def test_matrix_transpose(matrix_3x4):
+    m = matrix_3x4.transpose()
+
+    assert m.size == (4, 3)
+    assert m.data[1] == (1.0, 5.0, 9.0)
+    assert m.transpose() == matrix_3x4
+
+
+def test_matrix_transpose_named(matrix_2x1):
+    assert matrix_2x1.transpose().data == (1.0, 2.0)
+    assert isinstance(matrix_2x1.transpose().transpose(), Matrix2x1)
+
+
+def test_matrix_determinant(matrix_4x4):
+    assert matrix_4x4.determinant() == pytest.approx(-25.0)
+
+
+def test_matrix_determinant_not_square(matrix_3x4):
+    with pytest.raises(TypeError):
+        matrix_3x4.determinant()
+
+
+def test_matrix_inverse(matrix_4x4):
+    m = matrix_4x4 * matrix_4x4.inverse()
+
+    for row, expected in zip(m.data, Matrix.of_size(4, 4).identity().data):
+        assert row == pytest.approx(expected)
+
+
+def test_matrix_inverse_singular():
+    with pytest.raises(ValueError):
+        Matrix(4, 4, range(16)).inverse()
+
+
+@pytest.mark.parametrize("size", [4, 6])
+def test_matrix_condition_number(size):
+    m = Matrix.of_size(size, size).identity() * 2
+
+    assert m.condition_number() == pytest.approx(1.0)
+    assert m.inverse(tol=0.5) == m * 0.25
+
+
+def test_matrix_condition_number_singular():
+    m = Matrix(4, 4, range(16))
+
+    assert m.condition_number() == float("inf")
+    assert m.is_singular()
+    assert m.is_singular(tol=0)
+    assert not Matrix.of_size(4, 4).identity().is_singular(tol=0)
+    with pytest.raises(ValueError):
+        m.inverse(tol=0)
+    with pytest.raises(ValueError):
+        m.is_singular(tol=-1e-12)
+
+
+def test_matrix_inverse_nearly_singular(matrix_4x4):
+    m = Matrix(4, 4, [2, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1e-14])
+
+    assert m.is_singular()
+    assert not matrix_4x4.is_singular()
+    with pytest.raises(ValueError):
+        m.inverse(tol=1e-12)
+
+
+@pytest.mark.parametrize("size", [4, 6])
+def test_matrix_solve(size):
+    a = Matrix(size, size, kernels._sample(size * size))
+    b = Matrix(size, 1, range(size))
+
+    x = a.solve(b)
+
+    assert type(x) is type(b)
+    assert (a * x).data == pytest.approx(b.data)
+
+
+def test_matrix_solve_bad(matrix_3x4, matrix_4x4):
+    with pytest.raises(TypeError):
+        matrix_3x4.solve(Matrix(3, 1))
+    with pytest.raises(TypeError):
+        matrix_4x4.solve(Matrix(3, 1))
+    with pytest.raises(ValueError):
+        Matrix(5, 5, range(25)).solve(Matrix(5, 1))
+
+
+def test_matrix_hash(matrix_3x4):
+    assert {matrix_3x4: 1}[Matrix(3, 4, range(12))] == 1
+
+
+@pytest.mark.parametrize("matrix_type", [Matrix3x3, Matrix3x3Mut])
+def test_matrix_getitem_row(matrix_type):
+    m = matrix_type.from_iterable(range(9))
+
+    assert m[0] == (0.0, 1.0, 2.0)
+    assert m[2] == (6.0, 7.0, 8.0)
+    assert m[-1] == (6.0, 7.0, 8.0)
+    assert m[-3] == (0.0, 1.0, 2.0)
+    assert m[1:] == ((3.0, 4.0, 5.0), (6.0, 7.0, 8.0))
+    with pytest.raises(IndexError):
+        m[3]
+    with pytest.raises(IndexError):
+        m[-4]
@@ -1,6 +1,6 @@
 import pytest
 
-from matrix import Matrix2x2
+from matrix import Matrix2x1, Matrix2x2
 
 
 def test_2x2_empty():
@@ -74,8 +74,7 @@ def test_equals_2x2(matrix_2x2):
 
 
 def test_equals_2x2_bad(matrix_2x2):
-    with pytest.raises(TypeError):
-        matrix_2x2 == 1
+    assert matrix_2x2 != 1
 
 
 def test_inverse_2x2_determinent_0_fails():
@@ -84,6 +83,36 @@ def test_inverse_2x2_determinent_0_fails():
         Matrix2x2.from_iterable(data).inverse()
 
 
+def test_2x2_condition_number(matrix_2x2):
+    assert matrix_2x2.condition_number() == pytest.approx(21.0)
+    assert matrix_2x2.inverse(tol=1e-12) == matrix_2x2.inverse()
+
+
+def test_2x2_nearly_singular():
+    m = Matrix2x2.from_iterable((1.0, 1.0, 1.0, 1.0 + 1e-14))
+
+    assert m.is_singular()
+    with pytest.raises(ValueError):
+        m.inverse(tol=1e-12)
+
+
+def test_2x2_solve(matrix_2x2):
+    x = matrix_2x2.solve(Matrix2x1.from_iterable([5, 11]))
+
+    assert isinstance(x, Matrix2x1)
+    assert x.data == pytest.approx((1.0, 2.0))
+
+
+def test_2x2_solve_singular():
+    with pytest.raises(ValueError):
+        Matrix2x2.from_iterable((1.0, 1.0, 2.0, 2.0)).solve(Matrix2x1())
+
+
 def test_identity_2x2():
     m = Matrix2x2.identity()
     assert m.data == ((1.0, 0.0), (0.0, 1.0))
+
+
+def test_2x2_flat_index(matrix_2x2):
+    assert matrix_2x2[1, 0] == 3.0
+    assert matrix_2x2[1] == (3.0, 4.0)
@@ -1,6 +1,6 @@
 import pytest
 
-from matrix.matrix3x import Matrix3x1
+from matrix.matrix3x import Matrix3x1, Matrix3x3
 
 
 def test_matrix3x1_empty():
@@ -50,10 +50,16 @@ def test_multiply_3x1_bad(matrix_3x1: Matrix3x1, matrix_2x1):
         matrix_3x1 * matrix_2x1
 
 
+def test_multiply_3x1_1x3(matrix_3x1: Matrix3x1, matrix_1x3):
+    n = matrix_3x1 * matrix_1x3
+
+    assert isinstance(n, Matrix3x3)
+    assert n.data == ((1.0, 2.0, 3.0), (2.0, 4.0, 6.0), (3.0, 6.0, 9.0))
+
+
 def test_equals_3x1(matrix_3x1: Matrix3x1):
     assert matrix_3x1 == matrix_3x1
 
 
 def test_equals_3x1_bad(matrix_3x1: Matrix3x1, matrix_2x1):
-    with pytest.raises(TypeError):
-        matrix_3x1 == matrix_2x1
+    assert matrix_3x1 != matrix_2x1
@@ -1,6 +1,9 @@
+from array import array
+
 import pytest
 
-from matrix import Matrix3x1, Matrix3x3
+from matrix import Matrix3x1, Matrix3x3, Matrix3x3Mut
+from matrix.matrix3x import determinants
 
 
 def test_3x3_empty():
@@ -24,6 +27,17 @@ def test_3x3_determinant(matrix_3x3: Matrix3x3):
     assert det == -16
 
 
+def test_3x3_determinant_1(matrix_3x3_1):
+    assert matrix_3x3_1.determinant() == 0
+
+
+def test_3x3_determinants(matrix_3x3, matrix_3x3_1):
+    dets = determinants([matrix_3x3, matrix_3x3_1, Matrix3x3.identity()])
+
+    assert isinstance(dets, array)
+    assert list(dets) == [-16.0, 0.0, 1.0]
+
+
 def test_3x3_adjoint(matrix_3x3):
     adjoint = matrix_3x3.adjoint()
     assert adjoint[0][1] == -4
@@ -82,6 +96,51 @@ def test_3x3_inverse_determinant_0():
         m.inverse()
 
 
+def test_3x3_condition_number(matrix_3x3):
+    assert matrix_3x3.condition_number() == pytest.approx(3.75)
+    assert not matrix_3x3.is_singular()
+
+
+def test_3x3_nearly_singular():
+    m = Matrix3x3.from_iterable((1, 0, 0, 0, 1, 0, 0, 0, 1e-14))
+
+    assert m.condition_number() == pytest.approx(1e14)
+    assert m.is_singular()
+    assert not m.is_singular(1e-15)
+    assert m.inverse()[2][2] == pytest.approx(1e14)
+    with pytest.raises(ValueError):
+        m.inverse(tol=1e-12)
+
+
+def test_3x3_condition_number_singular():
+    m = Matrix3x3.from_iterable((1, 2, 3, 0, 2, 2, 1, 4, 5))
+
+    assert m.condition_number() == float("inf")
+    assert m.is_singular()
+
+
+def test_3x3_solve(matrix_3x3):
+    b = Matrix3x1.from_iterable([1, 2, 3])
+
+    x = matrix_3x3.solve(b)
+
+    assert isinstance(x, Matrix3x1)
+    assert x.data == pytest.approx((matrix_3x3.inverse() * b).data)
+    assert (matrix_3x3 * x).data == pytest.approx(b.data)
+
+
+def test_3x3_solve_singular():
+    m = Matrix3x3.from_iterable((1, 2, 3, 0, 2, 2, 1, 4, 5))
+
+    with pytest.raises(ValueError):
+        m.solve(Matrix3x1.from_iterable([1, 2, 3]))
+
+
+def test_3x3_solve_bad(matrix_3x3, matrix_3x3_1):
+    with pytest.raises(TypeError):
+        matrix_3x3.solve(matrix_3x3_1)
+
+
 def test_identity_3x3():
     m = Matrix3x3.identity()
     assert m.data == ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
@@ -92,8 +151,101 @@ def test_equals_3x3(matrix_3x3):
 
 
 def test_equals_3x3_bad(matrix_3x3, matrix_3x1):
-    with pytest.raises(TypeError):
-        matrix_3x3 == 1
+    assert matrix_3x3 != 1
+    assert matrix_3x3 != matrix_3x1
+
+
+def test_3x3_hash(matrix_3x3):
+    same = Matrix3x3.from_iterable([1, 2, -1, 2, 1, 2, -1, 2, 1])
+    lookup = {matrix_3x3: "a"}
+
+    assert hash(same) == hash(matrix_3x3)
+    assert lookup[same] == "a"
+    assert len({matrix_3x3, same, Matrix3x3.identity()}) == 2
+
+
+def test_3x3_interned(matrix_3x3):
+    data = [1, 2, -1, 2, 1, 2, -1, 2, 1]
 
+    m = Matrix3x3.interned(data)
+
+    assert m == matrix_3x3
+    assert Matrix3x3.interned(data) is m
+    assert Matrix3x3.interned(matrix_3x3) is m
+    assert Matrix3x3.interned(Matrix3x3.identity()) is not m
+
+
+def test_3x3_interned_mutable(matrix_3x3):
     with pytest.raises(TypeError):
-        matrix_3x3 == matrix_3x1
+        Matrix3x3Mut.interned(matrix_3x3.data)
+
+
+def test_3x3_transform_many_list(use_numpy, matrix_3x3):
+    result = matrix_3x3.transform_many([1, 2, 3, 1, 0, 0])
+
+    assert isinstance(result, array)
+    assert list(result) == [2.0, 10.0, 6.0, 1.0, 2.0, -1.0]
+
+
+def test_3x3_transform_many_buffer(use_numpy, matrix_3x3):
+    data = array("d", [1, 2, 3, 0, 1, 0])
+    result = matrix_3x3.transform_many(memoryview(data))
+
+    assert list(result) == [2.0, 10.0, 6.0, 2.0, 1.0, 2.0]
+
+
+def test_3x3_transform_many_matches_multiply(use_numpy, matrix_3x3_1):
+    data = [0.25, 0.5, 0.75, 0.1, 0.2, 0.3]
+    result = matrix_3x3_1.transform_many(data)
+
+    expected = []
+    for vector in (data[:3], data[3:]):
+        expected.extend((matrix_3x3_1 * Matrix3x1.from_iterable(vector)).data)
+
+    assert list(result) == pytest.approx(expected)
+
+
+def test_3x3_transform_many_empty(use_numpy, matrix_3x3):
+    assert matrix_3x3.transform_many(array("d")) == array("d")
+
+
+def test_3x3_transform_many_bad_length(use_numpy, matrix_3x3):
+    with pytest.raises(ValueError):
+        matrix_3x3.transform_many([1.0, 2.0])
+
+
+def test_3x3_transform_many_ndarray(matrix_3x3):
+    np = pytest.importorskip("numpy")
+    data = np.array([[1.0, 2.0, 3.0], [1.0, 0.0, 0.0]])
+
+    result = matrix_3x3.transform_many(data)
+
+    assert isinstance(result, np.ndarray)
+    assert result.shape == (2, 3)
+    assert result.tolist() == [[2.0, 10.0, 6.0], [1.0, 2.0, -1.0]]
+
+
+def test_3x3_flat_index(matrix_3x3_1):
+    assert matrix_3x3_1[1, 2] == 6.0
+    assert matrix_3x3_1[1] == (4.0, 5.0, 6.0)
+
+
+def test_3x3_slots(matrix_3x3):
+    assert not hasattr(matrix_3x3, "__dict__")
+
+
+def test_3x3_cofactor(matrix_3x3):
+    m = matrix_3x3.cofactor()
+    assert m.data == ((-3.0, -4.0, 5.0), (-4.0, 0.0, -4.0), (5.0, -4.0, -3.0))
+
+
+def test_3x3_adjugate(matrix_3x3_1):
+    m = matrix_3x3_1.adjugate()
+    assert m == matrix_3x3_1.cofactor().transpose()
+    assert m == matrix_3x3_1.adjoint()
+
+
+def test_3x3_inverse_product(matrix_3x3):
+    m = matrix_3x3 * matrix_3x3.inverse()
+    for row, expected in zip(m.data, Matrix3x3.identity().data):
+        assert row == pytest.approx(expected)
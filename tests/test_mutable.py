@@ -0,0 +1,164 @@
+import tracemalloc
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+
+from matrix import (
+    Matrix2x1,
+    Matrix2x1Mut,
+    Matrix2x2,
+    Matrix2x2Mut,
+    Matrix3x1,
+    Matrix3x1Mut,
+    Matrix3x3,
+    Matrix3x3Mut,
+)
+from matrix.matrix2x import matrix_multiply_2x1, matrix_multiply_2x2
+from matrix.matrix3x import matrix_multiply_3x1, matrix_multiply_3x3
+
+
+def test_mutable_is_matrix(matrix_3x3):
+    m = Matrix3x3Mut.from_iterable(matrix_3x3.data)
+
+    assert isinstance(m, Matrix3x3)
+    assert m == matrix_3x3
+    assert matrix_3x3 == m
+    assert m.determinant() == -16
+    assert m.inverse() == matrix_3x3.inverse()
+
+
+def test_mutable_not_hashable():
+    with pytest.raises(TypeError):
+        hash(Matrix3x1Mut())
+
+
+def test_mutable_setitem():
+    m = Matrix3x3Mut.from_iterable(Matrix3x3.identity().data)
+    m[1, 2] = 5
+    assert m[1][2] == 5.0
+
+    v = Matrix3x1Mut()
+    v[2] = 3
+    assert v.data == (0.0, 0.0, 3.0)
+
+
+def test_mutable_setitem_bad_index():
+    with pytest.raises(TypeError):
+        Matrix2x2Mut()[1] = 2.0
+
+
+def test_mutable_assign():
+    v = Matrix3x1Mut()
+    assert v.assign([1, 2, 3]) is v
+    assert v == Matrix3x1.from_iterable([1, 2, 3])
+
+    with pytest.raises(ValueError):
+        v.assign([1, 2])
+
+
+def test_mutable_frozen():
+    m = Matrix2x2Mut.from_iterable([1, 2, 3, 4]).frozen()
+
+    assert type(m) is Matrix2x2
+    assert hash(m) == hash(Matrix2x2.from_iterable([1, 2, 3, 4]))
+
+
+def test_imul_matrix(matrix_3x3, matrix_3x3_1):
+    m = Matrix3x3Mut.from_iterable(matrix_3x3.data)
+    original = m
+    m *= matrix_3x3_1
+
+    assert m is original
+    assert m == matrix_3x3 * matrix_3x3_1
+
+
+def test_imul_scalar(matrix_2x2):
+    m = Matrix2x2Mut.from_iterable(matrix_2x2.data)
+    original = m
+    m *= 2
+
+    assert m is original
+    assert m == matrix_2x2 * 2
+
+
+@pytest.mark.parametrize("scalar", [Fraction(1, 2), Decimal("0.5")])
+def test_imul_scalar_number(scalar, matrix_2x2):
+    m = Matrix2x2Mut.from_iterable(matrix_2x2.data)
+    m *= scalar
+
+    assert m == matrix_2x2 * 0.5
+    assert all(type(value) is float for value in m._flat)
+
+
+def test_imul_immutable_rebinds(matrix_3x3):
+    m = matrix_3x3
+    m *= 2
+
+    assert m is not matrix_3x3
+    assert m == matrix_3x3 * 2
+
+
+def test_imul_bad_size(matrix_3x1):
+    v = Matrix3x1Mut.from_iterable(matrix_3x1.data)
+    with pytest.raises(TypeError):
+        v *= Matrix3x3.identity()
+
+
+def test_multiply_3x1_out(matrix_3x3, matrix_3x1):
+    out = Matrix3x1Mut()
+
+    assert matrix_multiply_3x1(matrix_3x3, matrix_3x1, out=out) is out
+    assert out == matrix_3x3 * matrix_3x1
+
+
+def test_multiply_3x1_out_aliased(matrix_3x3, matrix_3x1):
+    v = Matrix3x1Mut.from_iterable(matrix_3x1.data)
+    matrix_multiply_3x1(matrix_3x3, v, out=v)
+
+    assert v == matrix_3x3 * matrix_3x1
+
+
+def test_multiply_3x3_out_aliased(matrix_3x3, matrix_3x3_1):
+    m = Matrix3x3Mut.from_iterable(matrix_3x3_1.data)
+    matrix_multiply_3x3(matrix_3x3, m, out=m)
+
+    assert m == matrix_3x3 * matrix_3x3_1
+
+
+def test_multiply_out_immutable(matrix_3x3, matrix_3x1):
+    with pytest.raises(TypeError):
+        matrix_multiply_3x1(matrix_3x3, matrix_3x1, out=Matrix3x1())
+
+
+def test_multiply_2x_out(matrix_2x2, matrix_2x2_1, matrix_2x1):
+    out = Matrix2x2Mut()
+    matrix_multiply_2x2(matrix_2x2, matrix_2x2_1, out=out)
+    assert out == matrix_2x2 * matrix_2x2_1
+
+    vector = Matrix2x1Mut()
+    matrix_multiply_2x1(matrix_2x2, matrix_2x1, out=vector)
+    assert vector == matrix_2x2 * matrix_2x1
+    assert isinstance(vector, Matrix2x1)
+
+
+def test_steady_state_loop_allocates_nothing(matrix_3x3):
+    pixel = Matrix3x1Mut()
+    out = Matrix3x1Mut()
+
+    def convert(count):
+        for idx in range(count):
+            pixel[0] = idx
+            matrix_multiply_3x1(matrix_3x3, pixel, out=out)
+
+    convert(10)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        convert(10000)
+        after, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert after - before < 256
+    assert peak - before < 1024
@@ -0,0 +1,96 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from matrix import Matrix3x3, Matrix3x3Array, TransformChain, parallel
+
+
+@pytest.fixture
+def pixels() -> array:
+    return array("d", [float(idx % 13) - 6 for idx in range(3 * 500)])
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_transform_many(use_numpy, processes, matrix_3x3, pixels):
+    result = parallel.transform_many(
+        matrix_3x3, pixels, workers=2, chunk_size=64, processes=processes
+    )
+
+    assert result == matrix_3x3.transform_many(pixels)
+
+
+@pytest.mark.parametrize("pool_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_transform_many_executor(pool_type, matrix_3x3, matrix_3x3_1, pixels):
+    with pool_type(2) as pool:
+        for m in (matrix_3x3, matrix_3x3_1):
+            result = parallel.transform_many(m, pixels, chunk_size=64, executor=pool)
+
+            assert result == m.transform_many(pixels)
+
+
+def test_transform_many_list(matrix_3x3, pixels):
+    result = parallel.transform_many(matrix_3x3, list(pixels), workers=1)
+
+    assert result == matrix_3x3.transform_many(pixels)
+
+
+def test_transform_many_ndarray(matrix_3x3, pixels):
+    numpy = pytest.importorskip("numpy")
+    values = numpy.array(pixels).reshape(-1, 3)
+
+    result = parallel.transform_many(matrix_3x3, values, workers=2, chunk_size=100)
+
+    assert isinstance(result, numpy.ndarray)
+    assert result.shape == (500, 3)
+    assert result.ravel().tolist() == list(matrix_3x3.transform_many(pixels))
+
+
+def test_transform_many_chain(matrix_3x3, matrix_3x3_1, pixels):
+    chain = TransformChain([matrix_3x3, matrix_3x3_1])
+
+    result = parallel.transform_many(chain, pixels, workers=2, chunk_size=100)
+
+    assert result == chain.transform_many(pixels)
+
+
+def test_transform_many_bad_length(matrix_3x3):
+    with pytest.raises(ValueError):
+        parallel.transform_many(matrix_3x3, [1.0, 2.0])
+
+
+def test_transform_many_bad_chunk_size(matrix_3x3, pixels):
+    with pytest.raises(ValueError):
+        parallel.transform_many(matrix_3x3, pixels, chunk_size=0)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_inverse(use_numpy, processes, matrix_3x3):
+    matrices = Matrix3x3Array.from_matrices(
+        [matrix_3x3, matrix_3x3.transpose(), Matrix3x3.identity()] * 20
+    )
+
+    result = parallel.inverse(matrices, workers=2, chunk_size=7, processes=processes)
+
+    assert result == matrices.inverse()
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_inverse_singular(processes, matrix_3x3, matrix_3x3_1):
+    matrices = Matrix3x3Array.from_matrices([matrix_3x3] * 10 + [matrix_3x3_1])
+
+    with pytest.raises(ValueError):
+        parallel.inverse(matrices, workers=2, chunk_size=4, processes=processes)
+
+
+@pytest.mark.parametrize("processes", [False, True])
+def test_inverse_nearly_singular(processes, matrix_3x3):
+    nearly = Matrix3x3.from_iterable((1, 0, 0, 0, 1, 0, 0, 0, 1e-14))
+    matrices = Matrix3x3Array.from_matrices([matrix_3x3] * 10 + [nearly])
+
+    result = parallel.inverse(matrices, workers=2, chunk_size=4, processes=processes)
+    assert result == matrices.inverse()
+    with pytest.raises(ValueError):
+        parallel.inverse(
+            matrices, workers=2, chunk_size=4, processes=processes, tol=1e-12
+        )
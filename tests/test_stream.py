@@ -0,0 +1,140 @@
+import io
+from array import array
+
+import pytest
+
+from matrix import Matrix3x3, TransformChain, stream
+
+
+@pytest.fixture
+def pixels() -> array:
+    return array("d", [float(idx % 17) / 4 for idx in range(3 * 1000)])
+
+
+def test_transform_file(tmp_path, use_numpy, matrix_3x3, pixels):
+    src = tmp_path / "src.raw"
+    dst = tmp_path / "dst.raw"
+    src.write_bytes(pixels.tobytes())
+
+    count = stream.transform(src, dst, matrix_3x3, chunk_size=64)
+
+    result = array("d")
+    result.frombytes(dst.read_bytes())
+    assert count == 1000
+    assert result == matrix_3x3.transform_many(pixels)
+
+
+def test_transform_file_float32(tmp_path, use_numpy, matrix_3x3, pixels):
+    src = tmp_path / "src.raw"
+    dst = tmp_path / "dst.raw"
+    src.write_bytes(array("f", pixels).tobytes())
+
+    stream.transform(str(src), str(dst), matrix_3x3, chunk_size=100, dtype="f")
+
+    result = array("f")
+    result.frombytes(dst.read_bytes())
+    assert result == array("f", matrix_3x3.transform_many(pixels))
+
+
+def test_transform_file_objects(use_numpy, matrix_3x3, pixels):
+    dst = io.BytesIO()
+    count = stream.transform(io.BytesIO(pixels.tobytes()), dst, matrix_3x3, 7)
+
+    assert count == 1000
+    assert dst.getvalue() == matrix_3x3.transform_many(pixels).tobytes()
+
+
+def test_transform_file_after_header(tmp_path, use_numpy, matrix_3x3, pixels):
+    src = tmp_path / "src.raw"
+    src.write_bytes(b"HEADER12" + pixels.tobytes())
+
+    with open(src, "rb") as fp:
+        assert fp.read(8) == b"HEADER12"
+        dst = io.BytesIO()
+        count = stream.transform(fp, dst, matrix_3x3, chunk_size=64)
+        assert fp.read() == b""
+
+    assert count == 1000
+    assert dst.getvalue() == matrix_3x3.transform_many(pixels).tobytes()
+
+
+class ShortReads(io.BytesIO):
+    def read(self, size=-1):
+        return super().read(min(size, 5) if size >= 0 else 5)
+
+
+def test_transform_file_short_reads(use_numpy, matrix_3x3, pixels):
+    dst = io.BytesIO()
+    count = stream.transform(ShortReads(pixels.tobytes()), dst, matrix_3x3, 7)
+
+    assert count == 1000
+    assert dst.getvalue() == matrix_3x3.transform_many(pixels).tobytes()
+
+
+def test_transform_file_short_reads_bad_length(matrix_3x3):
+    with pytest.raises(ValueError):
+        stream.transform(ShortReads(bytes(8 * 4)), io.BytesIO(), matrix_3x3)
+
+
+def test_transform_empty_file(tmp_path, matrix_3x3):
+    src = tmp_path / "src.raw"
+    src.write_bytes(b"")
+
+    assert stream.transform(src, tmp_path / "dst.raw", matrix_3x3) == 0
+    assert (tmp_path / "dst.raw").read_bytes() == b""
+
+
+def test_transform_file_bad_length(tmp_path, matrix_3x3):
+    src = tmp_path / "src.raw"
+    src.write_bytes(array("d", [1.0, 2.0]).tobytes())
+
+    with pytest.raises(ValueError):
+        stream.transform(src, io.BytesIO(), matrix_3x3)
+
+
+def test_transform_iter_iterable(use_numpy, matrix_3x3, pixels):
+    values = (value for value in pixels)
+    chunks = list(stream.transform_iter(values, matrix_3x3, chunk_size=300))
+
+    assert [len(chunk) for chunk in chunks] == [900, 900, 900, 300]
+    assert array("d", b"".join(chunks)) == matrix_3x3.transform_many(pixels)
+
+
+def test_transform_iter_bad_length(matrix_3x3):
+    with pytest.raises(ValueError):
+        list(stream.transform_iter([1.0, 2.0, 3.0, 4.0], matrix_3x3))
+
+
+def test_transform_iter_closed_early(tmp_path, use_numpy, matrix_3x3, pixels):
+    src = tmp_path / "src.raw"
+    src.write_bytes(pixels.tobytes())
+
+    chunks = stream.transform_iter(src, matrix_3x3, chunk_size=10)
+    first = next(chunks)
+    chunks.close()
+
+    assert first == matrix_3x3.transform_many(pixels[:30])
+
+
+def test_transform_chain(matrix_3x3, matrix_3x3_1, pixels):
+    chain = TransformChain([matrix_3x3, matrix_3x3_1])
+    dst = io.BytesIO()
+    stream.transform(pixels, dst, chain)
+
+    assert dst.getvalue() == chain.transform_many(pixels).tobytes()
+
+
+def test_transform_bad_dtype(matrix_3x3):
+    with pytest.raises(ValueError):
+        stream.transform([], io.BytesIO(), matrix_3x3, dtype="i")
+
+
+def test_transform_identity_float32_roundtrip(tmp_path):
+    values = array("f", [0.1, 0.2, 0.3])
+    src = tmp_path / "src.raw"
+    src.write_bytes(values.tobytes())
+    dst = tmp_path / "dst.raw"
+
+    stream.transform(src, dst, Matrix3x3.identity(), dtype="f")
+
+    assert dst.read_bytes() == values.tobytes()